@@ -0,0 +1,112 @@
+"""Latency of extract_datetime() under concurrent asyncio load.
+
+A number of client coroutines each await extract_datetime() on utterances
+in a loop. For each way of calling it this reports the per-call latency
+percentiles, the overall throughput, and the longest the event loop went
+without running a 1 ms ticker (the "stall"):
+
+    blocking  - calling lingua_franca.parse.extract_datetime directly
+    executor  - loop.run_in_executor() per call, on a thread pool
+    aio/1     - lingua_franca.aio on threads, without batching
+    aio/32    - lingua_franca.aio on threads, batches of up to 32
+    aio/proc  - lingua_franca.aio on processes, batches of up to 32
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_aio.py [clients] [calls]
+"""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+
+import lingua_franca
+from lingua_franca import aio, parse
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+UTTERANCES = ["remind me tomorrow at 5 pm to call mom",
+              "what's the weather like next tuesday afternoon",
+              "set up an appointment 2 weeks from sunday at 5 pm",
+              "wake me up in three hours and twenty minutes"]
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+async def _ticker(stalls, done):
+    last = time.perf_counter()
+    while not done.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        stalls.append(now - last)
+        last = now
+
+
+async def _load(call, clients, calls):
+    latencies, stalls = [], []
+    done = asyncio.Event()
+    ticker = asyncio.ensure_future(_ticker(stalls, done))
+
+    async def client(first):
+        for i in range(first, calls, clients):
+            start = time.perf_counter()
+            await call(UTTERANCES[i % len(UTTERANCES)])
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(n) for n in range(clients)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+    return latencies, elapsed, max(stalls or [0])
+
+
+def _modes():
+    pool = ThreadPoolExecutor()
+
+    async def blocking(text):
+        return parse.extract_datetime(text, ANCHOR)
+
+    async def executor(text):
+        return await asyncio.get_event_loop().run_in_executor(
+            pool, partial(parse.extract_datetime, text, ANCHOR))
+
+    def frontend(**kwargs):
+        async def call(text):
+            return await front.call("parse", "extract_datetime",
+                                    (text, ANCHOR))
+        front = aio.AsyncFrontend(**kwargs)
+        return call, front.shutdown
+
+    yield "blocking", blocking, lambda: None
+    yield "executor", executor, pool.shutdown
+    yield ("aio/1",) + frontend(max_batch_size=1)
+    yield ("aio/32",) + frontend(max_batch_size=32)
+    yield ("aio/proc",) + frontend(executor="process", max_batch_size=32)
+
+
+def main(clients=64, calls=2000):
+    lingua_franca.load_language("en")
+    print("{} clients, {} calls".format(clients, calls))
+    print("{:<10}{:>9}{:>9}{:>9}{:>9}{:>10}{:>9}".format(
+        "mode", "p50", "p90", "p99", "max", "calls/s", "stall"))
+    print("(latencies and stall in milliseconds)")
+    for name, call, close in _modes():
+        loop = asyncio.new_event_loop()
+        try:
+            latencies, elapsed, stall = loop.run_until_complete(
+                _load(call, clients, calls))
+        finally:
+            close()
+            loop.close()
+        print("{:<10}{:9.2f}{:9.2f}{:9.2f}{:9.2f}{:10.0f}{:9.2f}".format(
+            name, *(_percentile(latencies, p) * 1e3
+                    for p in (0.5, 0.9, 0.99, 1.0)),
+            calls / elapsed, stall * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:3]])
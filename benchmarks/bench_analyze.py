@@ -0,0 +1,54 @@
+"""Time taken by analyze() against the separate extractors it replaces.
+
+For each utterance this reports:
+
+    separate - extract_numbers, extract_duration, extract_datetime and
+               normalize, called one after the other
+    analyze  - analyze(text), returning the same four results
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_analyze.py [lang] [number]
+"""
+import sys
+import timeit
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca.parse import analyze, extract_datetime, \
+    extract_duration, extract_numbers, normalize
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+UTTERANCES = {
+    "en": ["set a timer for twenty five minutes",
+           "remind me in two and a half hours to call mom",
+           "what's the weather like next tuesday afternoon",
+           "set up an appointment two weeks from sunday at five pm"],
+}
+
+
+def separate(text, lang):
+    return {"numbers": extract_numbers(text, lang=lang),
+            "duration": extract_duration(text, lang=lang),
+            "datetime": extract_datetime(text, ANCHOR, lang=lang),
+            "normalized": normalize(text, lang=lang)}
+
+
+def main(lang="en", number=500):
+    lingua_franca.load_language(lang)
+    print("{:<56}{:>10}{:>10}{:>9}".format(
+        "utterance", "separate", "analyze", "speedup"))
+    print("(all times in microseconds per utterance)")
+    for text in UTTERANCES[lang]:
+        assert analyze(text, anchorDate=ANCHOR, lang=lang) == \
+            separate(text, lang)
+        before = timeit.timeit(lambda: separate(text, lang),
+                               number=number) / number * 1e6
+        after = timeit.timeit(
+            lambda: analyze(text, anchorDate=ANCHOR, lang=lang),
+            number=number) / number * 1e6
+        print("{:<56}{:10.1f}{:10.1f}{:8.2f}x".format(
+            text, before, after, before / after))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(n) for n in sys.argv[2:3]])
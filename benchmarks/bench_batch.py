@@ -0,0 +1,74 @@
+"""Throughput of the batch parsers at 1, 2, 4 and 8 workers.
+
+For extract_number, extract_datetime and normalize this reports texts per
+second for:
+
+    loop     - calling the function once per text
+    batch/N  - the *_batch variant with workers=N (1 runs in-process)
+
+Worker counts above the number of CPUs are still run, but will not scale.
+Process start-up is included in the timings, so small batches favour
+fewer workers.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_batch.py [lang] [texts]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca import parse
+
+WORKERS = (1, 2, 4, 8)
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+SENTENCES = {
+    "en": ["set a timer for twenty five minutes",
+           "remind me tomorrow at 5 pm to call mom",
+           "i need three hundred and forty two dollars",
+           "what's the weather like next tuesday",
+           "it's two and a half miles away"],
+}
+
+FUNCTIONS = (
+    ("extract_number",
+     lambda text, lang: parse.extract_number(text, lang=lang),
+     lambda texts, lang, n: parse.extract_number_batch(texts, lang=lang,
+                                                       workers=n)),
+    ("extract_datetime",
+     lambda text, lang: parse.extract_datetime(text, ANCHOR, lang=lang),
+     lambda texts, lang, n: parse.extract_datetime_batch(texts, ANCHOR,
+                                                         lang=lang,
+                                                         workers=n)),
+    ("normalize",
+     lambda text, lang: parse.normalize(text, lang=lang),
+     lambda texts, lang, n: parse.normalize_batch(texts, lang=lang,
+                                                  workers=n)),
+)
+
+
+def _rate(func, count):
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def main(lang="en", count=20000):
+    lingua_franca.load_language(lang)
+    sentences = SENTENCES[lang]
+    texts = [sentences[i % len(sentences)] for i in range(count)]
+    print("{} texts, {} CPUs".format(count, os.cpu_count()))
+    print("{:<18}{:>10}".format("function", "loop") +
+          "".join("{:>10}".format("batch/" + str(n)) for n in WORKERS))
+    print("(texts per second)")
+    for name, single, batch in FUNCTIONS:
+        row = [_rate(lambda: [single(text, lang) for text in texts], count)]
+        for workers in WORKERS:
+            row.append(_rate(lambda: batch(texts, lang, workers), count))
+        print("{:<18}".format(name) +
+              "".join("{:10.0f}".format(rate) for rate in row))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(n) for n in sys.argv[2:3]])
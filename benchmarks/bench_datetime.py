@@ -0,0 +1,87 @@
+"""Time taken by extract_datetime() on the utterances of the parse tests.
+
+The corpus of a language is every utterance passed to testExtract() in the
+datetime tests of test/test_parse.py (English) or test/test_parse_xx.py,
+normalized as those tests do. This reports the time to parse the corpus
+with
+
+    extract_datetime_xx - the whole function
+    token loop          - English only, after number words were converted
+                          to digits, which is where the date and time words
+                          are read
+
+so a change to the parser can be measured by running it before and after:
+
+    PYTHONPATH=. python benchmarks/bench_datetime.py [number] [lang...]
+"""
+import ast
+import os
+import sys
+import timeit
+from datetime import datetime
+
+import lingua_franca
+from lingua_franca.lang import parse_cs, parse_en
+from lingua_franca.parse import normalize
+
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+TESTS = os.path.join(os.path.dirname(__file__), os.pardir, "test")
+LANGUAGES = {
+    "en": ("test_parse.py", parse_en.extract_datetime_en),
+    "cs": ("test_parse_cs.py", parse_cs.extract_datetime_cs),
+}
+
+
+def load_corpus(lang):
+    """ The first argument of each testExtract() call in the datetime tests
+        of a language
+    """
+    path = os.path.join(TESTS, LANGUAGES[lang][0])
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    corpus = []
+    for func in ast.walk(tree):
+        if not isinstance(func, ast.FunctionDef) or \
+                not (func.name.startswith("test_extract") and
+                     "datetime" in func.name and
+                     func.name.endswith("_" + lang)):
+            continue
+        for call in ast.walk(func):
+            if isinstance(call, ast.Call) and \
+                    getattr(call.func, "id", None) == "testExtract":
+                # a string literal, or literals joined with +
+                text = eval(compile(ast.Expression(call.args[0]), path,
+                                    "eval"))
+                corpus.append(normalize(text, lang=lang))
+    return corpus
+
+
+def parse_corpus(extract, corpus):
+    for text in corpus:
+        try:
+            extract(text, ANCHOR)
+        except ValueError:
+            pass
+
+
+def main(number=20, *langs):
+    langs = langs or tuple(LANGUAGES)
+    lingua_franca.load_languages(langs)
+    print("(all times in microseconds per utterance)")
+    for lang in langs:
+        corpus = load_corpus(lang)
+        runs = [("extract_datetime_" + lang, LANGUAGES[lang][1], corpus)]
+        if lang == "en":
+            runs.append(("token loop", parse_en._extract_datetime_converted_en,
+                         [parse_en._convert_words_to_numbers_en(text,
+                                                                ordinals=None)
+                          for text in corpus]))
+        for name, extract, texts in runs:
+            total = min(timeit.repeat(lambda: parse_corpus(extract, texts),
+                                      repeat=3, number=number)) / number
+            print("{:<22}{:8.1f}   ({} utterances)".format(
+                name, total / len(texts) * 1e6, len(texts)))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]], *sys.argv[2:])
@@ -0,0 +1,94 @@
+"""Per-call overhead of @localized_function, with and without the dispatch
+table.
+
+For every function in parse._REGISTERED_FUNCTIONS and
+format._REGISTERED_FUNCTIONS this reports:
+
+    direct   - calling the localized function itself (e.g. extract_number_en)
+    before   - the decorated function, resolved by the full per-call lookup
+    after    - the decorated function, resolved through the dispatch table
+
+The overhead columns are the wrapped time minus the direct time.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_dispatch.py [lang] [number]
+"""
+import sys
+import timeit
+from datetime import datetime
+from importlib import import_module
+
+import lingua_franca
+import lingua_franca.format
+import lingua_franca.parse
+from lingua_franca import internal
+from lingua_franca.internal import FunctionNotLocalizedError
+
+SAMPLE_ARGS = {
+    "extract_numbers": ("one two three",),
+    "extract_numbers_spans": ("one two three",),
+    "extract_number": ("one",),
+    "extract_duration": ("five minutes",),
+    "extract_duration_spans": ("five minutes",),
+    "extract_datetime": ("tomorrow at noon", datetime(2017, 6, 27, 13, 4)),
+    "normalize": ("it's one",),
+    "get_normalizer": (),
+    "analyze": ("in five minutes", ("numbers", "duration")),
+    "get_gender": ("mother",),
+    "is_fractional": ("half",),
+    "is_ordinal": ("third",),
+    "nice_number": (1.5,),
+    "nice_time": (datetime(2017, 6, 27, 13, 4),),
+    "pronounce_number": (42,),
+    "nice_response": ("10 ^ 2",),
+    "nice_duration": (90,),
+}
+
+
+def _disable_dispatch_table():
+    for table in internal._localized_dispatch.values():
+        table.clear()
+
+
+def _enable_dispatch_table():
+    internal._refresh_function_dict()
+
+
+def _time(func, args, kwargs, number):
+    return min(timeit.repeat(lambda: func(*args, **kwargs),
+                             number=number, repeat=3)) / number * 1e6
+
+
+def main(lang="en", number=2000):
+    lingua_franca.load_language(lang)
+    print("{:<8}{:<20}{:>10}{:>10}{:>10}{:>12}{:>12}".format(
+        "module", "function", "direct", "before", "after",
+        "overhead<", "overhead>"))
+    print("(all times in microseconds per call)")
+    for module in (lingua_franca.parse, lingua_franca.format):
+        module_name = module.__name__.split('.')[-1]
+        localized_module = import_module(".lang." + module_name + "_" + lang,
+                                         "lingua_franca")
+        for name in module._REGISTERED_FUNCTIONS:
+            args = SAMPLE_ARGS[name]
+            kwargs = {"lang": lang}
+            localized = getattr(localized_module, name + "_" + lang, None)
+            public = getattr(module, name)
+            try:
+                public(*args, **kwargs)
+            except FunctionNotLocalizedError:
+                print("{:<8}{:<20}{:>10}".format(module_name, name,
+                                                 "not localized"))
+                continue
+            direct = _time(localized, args, {}, number) if localized else 0.0
+            _disable_dispatch_table()
+            before = _time(public, args, kwargs, number)
+            _enable_dispatch_table()
+            after = _time(public, args, kwargs, number)
+            print("{:<8}{:<20}{:>10.2f}{:>10.2f}{:>10.2f}{:>12.2f}{:>12.2f}"
+                  .format(module_name, name, direct, before, after,
+                          before - direct, after - direct))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(n) for n in sys.argv[2:3]])
@@ -0,0 +1,106 @@
+"""Time taken to find durations, by language, with and without one regex.
+
+extract_duration_xx() first writes number words as digits, then finds each
+number followed by a time unit. For that second step this reports:
+
+    per-unit - one re.sub() pass per unit word, formatting its pattern on
+               each call, as extract_duration_xx() used to
+    regex    - one pass of the precompiled regex of the language
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_duration.py [number]
+"""
+import re
+import sys
+import timeit
+from datetime import timedelta
+
+from lingua_franca.lang import parse_cs, parse_de, parse_en, parse_fr, \
+    parse_nl, parse_pl, parse_ru
+from lingua_franca.lang.parse_common import extract_duration_with_regex
+
+# module, regex name, units name, suffix, separator, end, utterances
+LANGUAGES = {
+    "en": (parse_en, "_DURATION_REGEX_EN", "_DURATION_UNITS_EN", "s?",
+           r"(?:\s+|\-)", "",
+           ["set a timer for 5 minutes",
+            "remind me in 3 days 8 hours 10 minutes and 49 seconds",
+            "what is the weather like today"]),
+    "cs": (parse_cs, "_DURATION_REGEX_CS", "_TIME_UNITS_CONVERSION",
+           "[ay]?", r"(?:\s+|\-)", "",
+           ["nastav časovač na 5 minut",
+            "3 dny 8 hodin 10 minut a 49 sekund",
+            "jaké je dnes počasí"]),
+    "ru": (parse_ru, "_DURATION_REGEX_RU", "_TIME_UNITS_CONVERSION",
+           "(?:а|ов|у|ут|уту)?", r"(?:\s+|\-)", "",
+           ["установи таймер на 5 минут",
+            "3 дня 8 часов 10 минут и 49 секунд",
+            "какая сегодня погода"]),
+    "pl": (parse_pl, "_DURATION_REGEX_PL", "_TIME_UNITS_CONVERSION",
+           "[ayeę]?", r"(?:\s+|\-)", "",
+           ["ustaw minutnik na 5 minut",
+            "3 dni 8 godzin 10 minut i 49 sekund",
+            "jaka jest dzisiaj pogoda"]),
+    "nl": (parse_nl, "_DURATION_REGEX_NL", "_DURATION_UNITS_NL", "",
+           r"\s+", "",
+           ["zet een timer voor 5 minuten",
+            "3 dagen 8 uren 10 minuten en 49 seconden",
+            "wat voor weer is het vandaag"]),
+    "de": (parse_de, "_DURATION_REGEX_DE", "_DURATION_UNITS_DE", "[ne]?",
+           r"(?:\s+|\-)", "",
+           ["stelle einen timer auf 5 minuten",
+            "3 tage 8 stunden 10 minuten und 49 sekunden",
+            "wie ist das wetter heute"]),
+    "fr": (parse_fr, "_DURATION_REGEX_FR", "_DURATION_UNITS_FR", "[s]?",
+           r"(?:\s+|\-)", r"(\s+|,|$)",
+           ["règle un minuteur de 5 minutes",
+            "3 jours 8 heures 10 minutes et 49 secondes",
+            "quel temps fait-il aujourd'hui"]),
+}
+
+
+def per_unit(text, units, suffix, separator, end):
+    time_units = {}
+    for word, unit in units.items():
+        pattern = r"(?P<value>\d+(?:\.?\d+)?)" + separator + \
+            "{unit}" + suffix + end
+
+        def repl(match):
+            time_units[unit] = time_units.get(unit, 0) + \
+                float(match.group("value"))
+            return ''
+        text = re.sub(pattern.format(unit=word), repl, text)
+    text = text.strip()
+    duration = timedelta(**time_units) if any(time_units.values()) else None
+    return duration, text
+
+
+def main(number=20000):
+    print("{:<6}{:>10}{:>10}{:>9}".format(
+        "lang", "per-unit", "regex", "speedup"))
+    print("(all times in microseconds per utterance)")
+    for lang, (module, regex, units, suffix, separator, end,
+               utterances) in LANGUAGES.items():
+        regex, units = getattr(module, regex), getattr(module, units)
+
+        def before():
+            for text in utterances:
+                per_unit(text, units, suffix, separator, end)
+
+        def after():
+            for text in utterances:
+                extract_duration_with_regex(text, regex, units)
+
+        for text in utterances:
+            assert per_unit(text, units, suffix, separator, end) == \
+                extract_duration_with_regex(text, regex, units)
+        before = timeit.timeit(before, number=number) / number * 1e6 / \
+            len(utterances)
+        after = timeit.timeit(after, number=number) / number * 1e6 / \
+            len(utterances)
+        print("{:<6}{:10.2f}{:10.2f}{:8.2f}x".format(
+            lang, before, after, before / after))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]])
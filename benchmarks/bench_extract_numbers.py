@@ -0,0 +1,101 @@
+"""Throughput of extract_numbers() on documents of growing length.
+
+Sparse documents repeat a short sentence with a few numbers in it, up to
+the given number of tokens. Dense documents are nothing but numbers, as in
+a list of figures: "0 1 2 3 ...". For every kind and size this reports:
+
+    before   - the former extractor: find a number, replace it with
+               placeholders, and search the whole document again
+    segments - the same search run within each segment of
+               split_number_segments(). A dense document is one segment.
+    after    - extract_numbers_with_text(): each segment cut into its
+               numbers in one pass, and each number read on its own
+
+Times are in microseconds per token, so linear scaling shows as a flat
+column. The former extractors are quadratic, and are skipped above
+--before-limit tokens (1000 by default) to keep the run short.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_extract_numbers.py \
+        [lang] [--before-limit N]
+"""
+import sys
+import time
+from importlib import import_module
+
+from lingua_franca.lang.parse_common import tokenize, \
+    split_number_segments, _extract_numbers_in_segment
+
+SIZES = (10, 100, 1000, 10000)
+SENTENCES = {
+    "en": "i bought twenty two apples and three hundred pears for 5 "
+          "dollars at the market on the way home",
+    "cs": "koupil jsem dvacet dva jablek a tři sta hrušek za 5 "
+          "korun na trhu cestou domů",
+    "pl": "kupiłem dwadzieścia dwa jabłka i trzysta gruszek za 5 "
+          "złotych na targu w drodze do domu",
+    "ru": "я купил двадцать два яблока и триста груш за 5 "
+          "рублей на рынке по дороге домой",
+    "nl": "ik kocht twee en twintig appels en driehonderd peren voor 5 "
+          "euro op de markt op weg naar huis",
+}
+
+
+def _document(lang, kind, size):
+    if kind == "dense":
+        return " ".join(str(i) for i in range(size))
+    words = SENTENCES[lang].split()
+    return " ".join(words[i % len(words)] for i in range(size))
+
+
+def _time(func, size):
+    repeat = max(1, 2000 // size)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat / size * 1e6
+
+
+def main(lang="en", before_limit=1000):
+    parser = import_module("lingua_franca.lang.parse_" + lang)
+    extract_all = getattr(parser, "_extract_numbers_with_text_" + lang)
+    extract_one = getattr(parser, "_extract_number_with_text_" + lang)
+
+    def is_number_word(word):
+        return extract_all([tokenize(word)[0]])
+
+    def by_segment(tokens):
+        results = []
+        for segment in split_number_segments(tokens, is_number_word):
+            results.extend(_extract_numbers_in_segment(segment, extract_one))
+        return results
+
+    print("{:<8}{:>8}{:>10}{:>12}{:>12}{:>12}".format(
+        "kind", "tokens", "numbers", "before", "segments", "after"))
+    print("(all times in microseconds per token)")
+    for kind in ("sparse", "dense"):
+        for size in SIZES:
+            text = _document(lang, kind, size)
+            found = extract_all(tokenize(text))
+            after = _time(lambda: extract_all(tokenize(text)), size)
+            columns = []
+            for former in (
+                    lambda: _extract_numbers_in_segment(tokenize(text),
+                                                        extract_one),
+                    lambda: by_segment(tokenize(text))):
+                if size <= before_limit:
+                    columns.append("{:12.2f}".format(_time(former, size)))
+                else:
+                    columns.append("{:>12}".format("skipped"))
+            print("{:<8}{:>8}{:>10}{}{}{:12.2f}".format(
+                kind, size, len(found), *columns, after))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    limit = 1000
+    if "--before-limit" in args:
+        pos = args.index("--before-limit")
+        limit = int(args[pos + 1])
+        del args[pos:pos + 2]
+    main(*args[:1], before_limit=limit)
@@ -0,0 +1,58 @@
+"""Time taken to match spoken names against a large catalog of choices.
+
+The catalog is made of random names, with the queries being misheard
+copies of some of them. For each query this reports:
+
+    match_one  - match_one(query, choices), scoring every choice
+    FuzzyIndex - FuzzyIndex(choices).match_one(query), with the index built
+                 once beforehand
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_fuzzy.py [choices] [number]
+"""
+import random
+import sys
+import time
+import timeit
+
+from lingua_franca.parse import FuzzyIndex, match_one
+
+SYLLABLES = ["an", "be", "ca", "do", "el", "fi", "ga", "ho", "is", "ja",
+             "ka", "lo", "mi", "na", "or", "pa", "ri", "sa", "to", "vi"]
+
+
+def make_name(rng):
+    return " ".join("".join(rng.choice(SYLLABLES)
+                            for _ in range(rng.randint(1, 4)))
+                    for _ in range(rng.randint(1, 3)))
+
+
+def mishear(name, rng):
+    chars = list(name)
+    chars[rng.randrange(len(chars))] = rng.choice("aeiou")
+    return "".join(chars)
+
+
+def main(size=50000, number=3):
+    rng = random.Random(0)
+    choices = [make_name(rng) for _ in range(size)]
+    queries = [mishear(rng.choice(choices), rng) for _ in range(5)]
+    start = time.perf_counter()
+    index = FuzzyIndex(choices)
+    print("{} choices, index built in {:.0f} ms".format(
+        size, (time.perf_counter() - start) * 1e3))
+    print("{:<24}{:>12}{:>12}{:>9}".format(
+        "query", "match_one", "FuzzyIndex", "speedup"))
+    print("(all times in milliseconds per query)")
+    for query in queries:
+        assert index.match_one(query) == match_one(query, choices)
+        before = timeit.timeit(lambda: match_one(query, choices),
+                               number=number) / number * 1e3
+        after = timeit.timeit(lambda: index.match_one(query),
+                              number=number) / number * 1e3
+        print("{:<24}{:12.1f}{:12.1f}{:8.1f}x".format(
+            query, before, after, before / after))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:3]])
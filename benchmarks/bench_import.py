@@ -0,0 +1,57 @@
+"""Cold-start cost per language.
+
+Each language is measured in a fresh interpreter, reporting the time spent
+importing lingua_franca.parse and lingua_franca.format, loading the
+language, and making the first parse and format calls. Language modules are
+imported on first use, so their cost shows up in the first-call columns.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_import.py [lang ...]
+"""
+import json
+import subprocess
+import sys
+
+_MEASURE = """
+import json, sys, time
+t0 = time.perf_counter()
+import lingua_franca.parse, lingua_franca.format
+t1 = time.perf_counter()
+lingua_franca.load_language(sys.argv[1])
+t2 = time.perf_counter()
+try:
+    lingua_franca.parse.extract_number("1")
+except NotImplementedError:
+    pass
+t3 = time.perf_counter()
+try:
+    lingua_franca.format.pronounce_number(1)
+except NotImplementedError:
+    pass
+t4 = time.perf_counter()
+print(json.dumps([t1 - t0, t2 - t1, t3 - t2, t4 - t3]))
+"""
+
+
+def measure(lang):
+    out = subprocess.run([sys.executable, "-c", _MEASURE, lang],
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                         check=True)
+    return [t * 1000 for t in json.loads(out.stdout)]
+
+
+def main(langs):
+    from lingua_franca import get_supported_langs
+    langs = langs or [lang for lang in get_supported_langs()
+                      if "-" not in lang]
+    print("{:<6}{:>10}{:>10}{:>12}{:>13}{:>10}".format(
+        "lang", "import", "load", "1st parse", "1st format", "total"))
+    print("(all times in milliseconds)")
+    for lang in langs:
+        times = measure(lang)
+        print("{:<6}{:>10.2f}{:>10.2f}{:>12.2f}{:>13.2f}{:>10.2f}".format(
+            lang, *times, sum(times)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""Time taken to match the n-best hypotheses of an utterance to a catalog.
+
+The catalog is made of random names, as in bench_fuzzy.py, and the queries
+are ten misheard copies of one of them, like the n-best list of a speech
+recognizer. This reports the time to find the best match of every query
+with
+
+    match_one      - match_one(query, choices) for each query
+    index          - FuzzyIndex.match_one(query) for each query, with the
+                     index built once beforehand
+    match_many     - match_many(queries, choices), building the index
+    match_many/idx - match_many(queries, index)
+    workers=N      - match_many(queries, index, workers=N)
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_match_many.py [choices] [workers]
+"""
+import os
+import random
+import sys
+import time
+
+from bench_fuzzy import make_name, mishear
+from lingua_franca.parse import FuzzyIndex, match_many, match_one
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(size=100000, workers=os.cpu_count()):
+    rng = random.Random(0)
+    choices = [make_name(rng) for _ in range(size)]
+    name = rng.choice(choices)
+    queries = [mishear(name, rng) for _ in range(10)]
+    index = FuzzyIndex(choices)
+    runs = [
+        ("match_one", lambda: [match_one(query, choices)
+                               for query in queries]),
+        ("index", lambda: [index.match_one(query) for query in queries]),
+        ("match_many", lambda: match_many(queries, choices)),
+        ("match_many/idx", lambda: match_many(queries, index)),
+        ("workers={}".format(workers),
+         lambda: match_many(queries, index, workers=workers)),
+    ]
+    print("{} queries against {} choices".format(len(queries), size))
+    print("{:<16}{:>10}{:>9}".format("mode", "seconds", "speedup"))
+    expected, baseline = None, None
+    for mode, run in runs:
+        result, elapsed = _time(run)
+        if expected is None:
+            expected, baseline = result, elapsed
+        assert result == expected, mode
+        print("{:<16}{:10.2f}{:8.1f}x".format(mode, elapsed,
+                                              baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:3]])
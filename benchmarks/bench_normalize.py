@@ -0,0 +1,75 @@
+"""Time taken by normalize(), by language, against running its stages.
+
+For each utterance this reports:
+
+    stages   - a new normalizer, whose stages are called one after the
+               other, as normalize_xx() used to: each one splitting and
+               joining the utterance again
+    pipeline - the normalizer of get_normalizer(), reusing the pipeline
+               compiled on its first call
+
+Both run with the settings of the language's normalize.json, then with
+every removal turned on.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_normalize.py [number]
+"""
+import sys
+import timeit
+
+import lingua_franca
+from lingua_franca.parse import get_normalizer
+
+UTTERANCES = {
+    "en": "What's the weather like in twenty two minutes? I'd like a cup",
+    "cs": "Jaké bude počasí za dvacet dva minut? Chtěl bych šálek",
+    "ru": "Какая будет погода через двадцать две минуты? Я хочу чашку",
+    "pt": "Qual é o tempo daqui a vinte e dois minutos? Eu quero uma chávena",
+    "ca": "Quin temps farà d'aquí a vint-i-dos minuts? Voldria una tassa",
+}
+REMOVALS = {"remove_symbols": True, "remove_accents": True,
+            "remove_stopwords": True}
+
+
+def stage_by_stage(normalizer, utterance, remove_articles=True):
+    normalizer = type(normalizer)(normalizer.config)
+    if normalizer.should_lowercase:
+        utterance = utterance.lower()
+    if normalizer.should_expand_contractions:
+        utterance = normalizer.expand_contractions(utterance)
+    if normalizer.should_numbers_to_digits:
+        utterance = normalizer.numbers_to_digits(utterance)
+    utterance = normalizer.replace_words(utterance)
+    if normalizer.should_remove_symbols:
+        utterance = normalizer.remove_symbols(utterance)
+    if normalizer.should_remove_accents:
+        utterance = normalizer.remove_accents(utterance)
+    if remove_articles or normalizer.should_remove_articles:
+        utterance = normalizer.remove_articles(utterance)
+    if normalizer.should_remove_stopwords:
+        utterance = normalizer.remove_stopwords(utterance)
+    return " ".join([w for w in utterance.split(" ") if w])
+
+
+def main(number=5000):
+    lingua_franca.load_languages(list(UTTERANCES))
+    print("{:<6}{:<10}{:>10}{:>10}{:>9}".format(
+        "lang", "config", "stages", "pipeline", "speedup"))
+    print("(all times in microseconds per utterance)")
+    for lang, utterance in UTTERANCES.items():
+        for name, config in (("default", {}), ("removals", REMOVALS)):
+            normalizer = get_normalizer(lang, **config)
+            assert normalizer.normalize(utterance, True) == \
+                stage_by_stage(normalizer, utterance)
+            before = timeit.timeit(
+                lambda: stage_by_stage(normalizer, utterance),
+                number=number) / number * 1e6
+            after = timeit.timeit(
+                lambda: normalizer.normalize(utterance, True),
+                number=number) / number * 1e6
+            print("{:<6}{:<10}{:10.1f}{:10.1f}{:8.2f}x".format(
+                lang, name, before, after, before / after))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]])
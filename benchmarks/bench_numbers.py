@@ -0,0 +1,102 @@
+"""Time taken to pronounce and format a column of a million numbers.
+
+The column mixes counts (whole numbers up to 500), prices (two decimals,
+up to 200), measurements (one decimal, up to 100) and large whole numbers
+(up to a billion), so that most values repeat, as in a report. For each
+language and function this reports, for the whole column, in seconds:
+
+    loop    - pronounce_number() or nice_number() called once per value,
+              timed on the first 100k values and scaled to the column
+    list    - pronounce_numbers() or nice_numbers() on a list
+    array   - the same on a NumPy array, when NumPy is installed
+
+Values which a language fails on are left out of its column, and a function
+which fails on all of them is left out.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_numbers.py [values] [lang ...]
+"""
+import random
+import sys
+import time
+
+import lingua_franca
+from lingua_franca.format import nice_number, nice_numbers, \
+    pronounce_number, pronounce_numbers
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LANGUAGES = ["ca", "cs", "da", "de", "en", "es", "fa", "fr", "hu", "it",
+             "nl", "pl", "pt", "ru", "sl", "sv", "syr"]
+LOOP_VALUES = 100000
+
+
+def make_column(size, rng):
+    column = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.4:
+            column.append(int(rng.paretovariate(1.2)) % 500)
+        elif kind < 0.7:
+            column.append(rng.randrange(20000) / 100)
+        elif kind < 0.9:
+            column.append(rng.randrange(1000) / 10)
+        else:
+            column.append(rng.randrange(10 ** 9))
+    return column
+
+
+def usable(func, lang, column):
+    """ The values of the column which func() does not fail on """
+    failing = set()
+    for value in set(column):
+        try:
+            func(value, lang=lang)
+        except Exception:
+            failing.add(value)
+    return [value for value in column if value not in failing]
+
+
+def elapsed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(size=1000000, *langs):
+    rng = random.Random(0)
+    column = make_column(size, rng)
+    langs = langs or LANGUAGES
+    lingua_franca.load_languages(list(langs))
+    print("{} values, {} distinct".format(len(column), len(set(column))))
+    print("{:<6}{:<10}{:>9}{:>9}{:>9}{:>9}".format(
+        "lang", "function", "loop", "list", "array", "speedup"))
+    print("(all times in seconds per column)")
+    for lang in langs:
+        for name, func, batch_func in (
+                ("pronounce", pronounce_number, pronounce_numbers),
+                ("nice", nice_number, nice_numbers)):
+            values = usable(func, lang, column)
+            if not values:
+                continue
+            sample = values[:LOOP_VALUES]
+            expected, loop = elapsed(
+                lambda: [func(value, lang=lang) for value in sample])
+            loop *= len(values) / max(len(sample), 1)
+            result, in_list = elapsed(lambda: batch_func(values, lang=lang))
+            assert result[:len(sample)] == expected
+            in_array = None
+            if numpy is not None:
+                array = numpy.array(values)
+                _, in_array = elapsed(lambda: batch_func(array, lang=lang))
+            print("{:<6}{:<10}{:9.2f}{:9.2f}{:>9}{:8.1f}x".format(
+                lang, name, loop, in_list,
+                "-" if in_array is None else "{:.2f}".format(in_array),
+                loop / min(in_list, in_array or in_list)))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]], *sys.argv[2:])
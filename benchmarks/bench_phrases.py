@@ -0,0 +1,71 @@
+"""Time taken to replace phrases from a large dictionary in utterances.
+
+The dictionary holds random phrases of one to four words, and each
+utterance has some of them among other words. For each dictionary size this
+reports, per utterance:
+
+    regex    - one re.sub() per phrase, longest phrases first: replacing
+               phrases without an index of them
+    replacer - PhraseReplacer.replace() on the words of the utterance
+    build    - building the PhraseReplacer, once, in milliseconds
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_phrases.py [number]
+"""
+import random
+import re
+import sys
+import time
+import timeit
+
+from lingua_franca.lang.parse_common import PhraseReplacer
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf",
+         "hotel", "india", "juliet", "kilo", "lima", "mike", "november",
+         "oscar", "papa", "quebec", "romeo", "sierra", "tango"]
+
+
+def make_phrases(size, rng):
+    phrases = {}
+    while len(phrases) < size:
+        phrase = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+        phrases[phrase] = str(len(phrases))
+    return phrases
+
+
+def replace_with_regex(utterance, patterns):
+    for pattern, replacement in patterns:
+        utterance = pattern.sub(replacement, utterance)
+    return utterance
+
+
+def main(number=20):
+    rng = random.Random(0)
+    print("{:<8}{:>12}{:>12}{:>9}{:>10}".format(
+        "phrases", "regex", "replacer", "speedup", "build"))
+    print("(times in microseconds per utterance, build in milliseconds)")
+    for size in (100, 1000, 5000):
+        phrases = make_phrases(size, rng)
+        utterances = [" ".join(rng.choice(WORDS) for _ in range(12))
+                      for _ in range(20)]
+        patterns = [(re.compile(r"(?<!\S)" + re.escape(phrase) + r"(?!\S)"),
+                     replacement)
+                    for phrase, replacement in sorted(
+                        phrases.items(), key=lambda item: -len(item[0]))]
+        start = time.perf_counter()
+        replacer = PhraseReplacer(phrases)
+        build = time.perf_counter() - start
+
+        before = timeit.timeit(
+            lambda: [replace_with_regex(text, patterns)
+                     for text in utterances],
+            number=number) / number / len(utterances) * 1e6
+        after = timeit.timeit(
+            lambda: [replacer.replace(text.split()) for text in utterances],
+            number=number) / number / len(utterances) * 1e6
+        print("{:<8}{:12.1f}{:12.1f}{:8.0f}x{:10.1f}".format(
+            size, before, after, before / after, build * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]])
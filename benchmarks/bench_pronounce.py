@@ -0,0 +1,95 @@
+"""Time taken to pronounce numbers, by language and kind of number.
+
+For each language this reports, per number, pronouncing random whole
+numbers of up to twelve digits (int), numbers with two decimals (float) and
+ordinals (ordinal), for the module as it is (now) and, given a git revision,
+for the module at that revision (before): say the one before the
+pronunciations of groups of three digits were kept in tables.
+
+Numbers which a language fails to pronounce are left out.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_pronounce.py [number] [revision]
+"""
+import importlib
+import random
+import subprocess
+import sys
+import timeit
+import types
+
+LANGUAGES = ["en", "de", "da", "sv", "nl", "cs", "pl", "ru", "sl", "it", "hu"]
+
+
+def load_revision(lang, revision):
+    """ The format module of a language at a git revision """
+    path = "lingua_franca/lang/format_{}.py".format(lang)
+    source = subprocess.check_output(
+        ["git", "show", "{}:{}".format(revision, path)])
+    module = types.ModuleType("format_{}_{}".format(lang, revision))
+    module.__package__ = "lingua_franca.lang"
+    exec(compile(source, path, "exec"), module.__dict__)
+    return module
+
+
+def pronouncers(module, lang):
+    """ What pronounces each kind of number, if the language can """
+    number = getattr(module, "pronounce_number_" + lang)
+    ordinal = getattr(module, "pronounce_ordinal_" + lang, None)
+    if ordinal is None and "ordinals" in number.__code__.co_varnames:
+        def ordinal(n):
+            return number(n, ordinals=True)
+    return {"int": number, "float": number, "ordinal": ordinal}
+
+
+def pronounceable(pronounce, values):
+    result = []
+    for value in values:
+        try:
+            pronounce(value)
+        except Exception:
+            continue
+        result.append(value)
+    return result
+
+
+def main(number=5, revision=None):
+    rng = random.Random(0)
+    values = {
+        "int": [rng.randrange(10 ** rng.randint(1, 12)) for _ in range(300)],
+        "float": [round(rng.uniform(0, 1000), 2) for _ in range(300)],
+        "ordinal": [rng.randrange(10 ** rng.randint(1, 7)) for _ in range(300)]
+    }
+    print("{:<6}{:<9}{:>9}{:>9}{:>9}".format(
+        "lang", "kind", "before", "now", "speedup"))
+    print("(all times in microseconds per number)")
+    for lang in LANGUAGES:
+        now = pronouncers(importlib.import_module(
+            "lingua_franca.lang.format_" + lang), lang)
+        before = pronouncers(load_revision(lang, revision), lang) \
+            if revision else {}
+        for kind, pronounce in now.items():
+            if pronounce is None:
+                continue
+            kind_values = pronounceable(before.get(kind) or pronounce,
+                                        values[kind])
+
+            def per_number(func):
+                return min(timeit.repeat(
+                    lambda: [func(value) for value in kind_values],
+                    number=number, repeat=5)) / number / \
+                    len(kind_values) * 1e6
+
+            after = per_number(pronounce)
+            if revision:
+                for value in kind_values:
+                    assert pronounce(value) == before[kind](value), value
+                slower = per_number(before[kind])
+                print("{:<6}{:<9}{:9.2f}{:9.2f}{:8.2f}x".format(
+                    lang, kind, slower, after, slower / after))
+            else:
+                print("{:<6}{:<9}{:>9}{:9.2f}".format(lang, kind, "-", after))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]], *sys.argv[2:3])
@@ -0,0 +1,62 @@
+"""Cost of a result cache miss for extract_datetime(), by how widely its
+result may be shared across anchor dates.
+
+Each call is given an anchor outside the span cached by the previous one,
+so that every call misses. For each phrase this reports:
+
+    span      - the span of anchors its result is shared across
+    uncached  - a call with the result cache off
+    miss      - a call missing the result cache, including its probes
+    probes    - extra calls made per miss to find the span
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_result_cache.py [lang] [number]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+import lingua_franca
+from lingua_franca import config
+from lingua_franca.parse import extract_datetime
+from lingua_franca.time import default_timezone
+
+# (phrase, span, step between anchors)
+SAMPLES = [
+    ("tomorrow", "day", timedelta(days=1)),
+    ("at 5 pm", "hour", timedelta(hours=1)),
+    ("at 13:30", "minute", timedelta(minutes=1)),
+    ("in 5 minutes", "exact", timedelta(seconds=1)),
+]
+
+
+def _time(text, anchors, lang):
+    start = time.perf_counter()
+    for anchor in anchors:
+        extract_datetime(text, anchor, lang=lang)
+    return (time.perf_counter() - start) / len(anchors) * 1e6
+
+
+def main(lang="en", number=500):
+    lingua_franca.load_language(lang)
+    anchor = datetime(2017, 6, 27, 13, 4, 5, tzinfo=default_timezone())
+    print("{:<16}{:>8}{:>10}{:>10}{:>8}".format(
+        "phrase", "span", "uncached", "miss", "probes"))
+    print("(times in microseconds per call)")
+    for text, span, step in SAMPLES:
+        anchors = [anchor + step * n for n in range(number)]
+        config.result_cache_size = 0
+        uncached = _time(text, anchors, lang)
+        config.result_cache_size = 2 * number
+        lingua_franca.clear_result_cache()
+        lingua_franca.reset_result_cache_stats()
+        miss = _time(text, anchors, lang)
+        stats = lingua_franca.get_result_cache_stats()
+        print("{:<16}{:>8}{:>10.1f}{:>10.1f}{:>8.2f}".format(
+            text, span, uncached, miss, stats["probes"] / stats["misses"]))
+    config.result_cache_size = 0
+    lingua_franca.clear_result_cache()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(n) for n in sys.argv[2:3]])
@@ -0,0 +1,68 @@
+"""Time taken to split utterances into words, and to find where they are.
+
+The utterances are made of random words, some of them with the "%" and "#"
+the tokenizer splits off. For each share of such words this reports, per
+utterance:
+
+    re.sub   - each splitting rule run over the utterance with re.sub(),
+               then str.split(), as Normalizer.tokenize() used to
+    words    - Normalizer.tokenize(), through the Tokenizer of the class
+    offsets  - tokenize(), then token_offsets() searching the text again for
+               each token, as finding the numbers of a text used to
+    spans    - tokenize_with_offsets(), counting the offsets of words one
+               space apart instead of searching for them
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_tokenize.py [number]
+"""
+import random
+import sys
+import timeit
+
+from lingua_franca.lang.parse_common import Normalizer, token_offsets, \
+    tokenize, tokenize_with_offsets
+
+WORDS = ["set", "a", "timer", "for", "twenty", "two", "minutes", "and",
+         "turn", "the", "volume", "up", "to", "fifty", "percent", "please"]
+SPLIT = ["15%", "#1", "100%", "#42"]
+
+
+def split_with_sub(utterance):
+    for char, pattern, replacement in Normalizer._TOKEN_SPLITS:
+        if char in utterance:
+            utterance = pattern.sub(replacement, utterance)
+    return utterance.split()
+
+
+def main(number=2000):
+    rng = random.Random(0)
+    print("{:<7}{:>9}{:>9}{:>9}{:>9}{:>9}{:>9}".format(
+        "split", "re.sub", "words", "speedup", "offsets", "spans",
+        "speedup"))
+    print("(all times in microseconds per utterance)")
+    for share in (0.0, 0.05, 0.25):
+        utterances = [" ".join(rng.choice(SPLIT) if rng.random() < share
+                               else rng.choice(WORDS) for _ in range(20))
+                      for _ in range(20)]
+        for text in utterances:
+            assert Normalizer.tokenize(text) == split_with_sub(text)
+            tokens, offsets = tokenize_with_offsets(text)
+            assert offsets == token_offsets(text, tokenize(text))
+
+        def per_utterance(func):
+            return min(timeit.repeat(
+                lambda: [func(text) for text in utterances],
+                number=number, repeat=5)) / number / len(utterances) * 1e6
+
+        times = [per_utterance(func) for func in (
+            split_with_sub,
+            Normalizer.tokenize,
+            lambda text: token_offsets(text, tokenize(text)),
+            tokenize_with_offsets)]
+        print("{:<7.0%}{:9.2f}{:9.2f}{:8.2f}x{:9.2f}{:9.2f}{:8.2f}x".format(
+            share, times[0], times[1], times[0] / times[1],
+            times[2], times[3], times[2] / times[3]))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]])
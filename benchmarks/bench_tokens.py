@@ -0,0 +1,77 @@
+"""Memory and time taken to find the numbers of a long document.
+
+The document is 10k words drawn at random from sentences with numbers in
+them. For each language this reports, for tokenizing the document
+(tokenize), and for tokenizing it then finding its numbers with
+_extract_numbers_with_text_xx() (numbers):
+
+    blocks  - memory blocks still allocated afterwards (for the tokens,
+              about one per Token and one per word)
+    KiB     - memory still allocated afterwards
+    peak    - the most memory allocated at once while running, in KiB
+    ms      - time taken, measured apart from the memory, in milliseconds
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_tokens.py [words]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from lingua_franca.lang import parse_cs, parse_en, parse_nl, parse_pl, \
+    parse_ru
+from lingua_franca.lang.parse_common import tokenize
+
+LANGUAGES = {
+    "en": (parse_en._extract_numbers_with_text_en,
+           "I bought twenty two apples for three dollars fifty and one "
+           "hundred and five people came with 3 dogs one and a half cups "
+           "two point five"),
+    "cs": (parse_cs._extract_numbers_with_text_cs,
+           "koupil jsem dvacet dva jablek za tři koruny a sto pět lidí "
+           "přišlo se 3 psy jeden a půl hrnku"),
+    "pl": (parse_pl._extract_numbers_with_text_pl,
+           "kupiłem dwadzieścia dwa jabłka za trzy złote i sto pięć osób "
+           "przyszło z 3 psami"),
+    "ru": (parse_ru._extract_numbers_with_text_ru,
+           "я купил двадцать два яблока за три рубля и сто пять человек "
+           "пришли с 3 собаками"),
+    "nl": (parse_nl._extract_numbers_with_text_nl,
+           "ik kocht tweeëntwintig appels voor drie euro en honderdvijf "
+           "mensen kwamen met 3 honden"),
+}
+
+
+def measure(func):
+    """ Blocks and bytes left allocated by func(), its peak, and its time
+    """
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = func()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+    start = time.perf_counter()
+    func()
+    return result, blocks, size, peak, time.perf_counter() - start
+
+
+def main(words=10000):
+    rng = random.Random(0)
+    print("{:<6}{:<10}{:>9}{:>9}{:>9}{:>9}".format(
+        "lang", "step", "blocks", "KiB", "peak", "ms"))
+    for lang, (extract, sentence) in LANGUAGES.items():
+        vocabulary = sentence.split()
+        text = " ".join(rng.choice(vocabulary) for _ in range(words))
+        tokens, *tokenized = measure(lambda: tokenize(text))
+        numbers, *extracted = measure(lambda: extract(tokenize(text)))
+        for step, (blocks, size, peak, elapsed) in (("tokenize", tokenized),
+                                                    ("numbers", extracted)):
+            print("{:<6}{:<10}{:9d}{:9.0f}{:9.0f}{:9.1f}".format(
+                lang, step, blocks, size / 1024, peak / 1024,
+                elapsed * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:2]])
@@ -1,6 +1,22 @@
+from importlib import import_module
+
 from .internal import get_default_lang, set_default_lang, get_default_loc, \
     get_active_langs, _set_active_langs, get_primary_lang_code, \
     get_full_lang_code, resolve_resource_file, load_language, \
-    load_languages, unload_language, unload_languages, get_supported_langs
+    load_languages, unload_language, unload_languages, get_supported_langs, \
+    get_resident_langs, get_residency_stats, reset_residency_stats, \
+    read_resource_file, invalidate_resource_cache, get_resource_cache_stats, \
+    clear_result_cache, get_result_cache_stats, reset_result_cache_stats
+
+from .preload import warm_up
 
 from lingua_franca import config
+
+
+def __getattr__(name):
+    # Import the top-level modules on first access, so that
+    # `lingua_franca.parse` works without `import lingua_franca.parse`
+    if name in ("parse", "format"):
+        return import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}"
+                         .format(__name__, name))
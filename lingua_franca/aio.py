@@ -0,0 +1,242 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""" Awaitable versions of the lingua_franca.parse and .format functions
+
+Every function registered by lingua_franca.parse and lingua_franca.format
+has a coroutine of the same name here, taking the same arguments:
+
+    from lingua_franca import aio
+
+    async def handle(utterance):
+        when = await aio.extract_datetime(utterance, lang="en-us")
+
+The work runs in an executor, so the event loop is not blocked. Calls made
+at about the same time, to the same function in the same language, are
+sent to the executor together as one batch. At most `max_pending` calls
+are in flight at once; further calls wait for a free slot.
+
+configure() replaces the default settings, e.g. to run in processes:
+
+    aio.configure(executor="process", max_workers=4)
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import wraps
+from importlib import import_module
+from inspect import signature
+
+from lingua_franca import format as _format, parse as _parse
+from lingua_franca.internal import load_languages, get_active_langs, \
+    get_default_lang, set_default_lang
+
+# Set in process workers, which load languages as they are asked for them
+_in_worker = False
+
+
+def _init_worker(langs, default_lang):
+    global _in_worker
+    _in_worker = True
+    load_languages(langs)
+    if default_lang:
+        set_default_lang(default_lang)
+
+
+def _run_batch(lf_module, func_name, lang, worker_setup, calls):
+    """ Run one batch in the executor
+
+    Arguments:
+        worker_setup (tuple): arguments of _init_worker(), for a process
+            worker that has not been set up yet, or None
+
+    Returns:
+        list((bool, object)): for each call, whether it returned, and what
+                              it returned or raised
+    """
+    if worker_setup is not None and not _in_worker:
+        _init_worker(*worker_setup)
+    if _in_worker and lang and lang not in get_active_langs():
+        load_languages([lang])
+    func = getattr(import_module("lingua_franca." + lf_module), func_name)
+    results = []
+    for args, kwargs in calls:
+        try:
+            results.append((True, func(*args, lang=lang, **kwargs)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+class _Batch:
+    """ Calls waiting to be sent to the executor together """
+
+    def __init__(self):
+        self.calls = []
+        self.futures = []
+        self.timer = None
+
+
+class AsyncFrontend:
+    """ Runs localized functions in an executor, batching concurrent calls
+
+    Arguments:
+        executor (str or concurrent.futures.Executor): "thread", "process",
+            or an executor to use as is
+        max_workers (int, optional): workers of a "thread" or "process"
+            executor. Defaults to the executor's own default.
+        max_batch_size (int): calls sent to the executor at once, at most
+        max_batch_delay (float): seconds a call may wait for others to
+            join its batch
+        max_pending (int): calls accepted but not yet finished, at most.
+            Further calls wait until one finishes.
+    """
+
+    def __init__(self, executor="thread", max_workers=None,
+                 max_batch_size=32, max_batch_delay=0.001, max_pending=256):
+        # Sent along with each batch, as the pool initializer of
+        # ProcessPoolExecutor needs Python 3.7
+        self._worker_setup = None
+        if executor == "thread":
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        elif executor == "process":
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            self._worker_setup = (list(get_active_langs()),
+                                  get_default_lang())
+        elif isinstance(executor, str):
+            raise ValueError("executor must be 'thread', 'process' or an "
+                             "Executor, not " + repr(executor))
+        self.executor = executor
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_batch_delay = max_batch_delay
+        self.max_pending = max(max_pending, 1)
+        self._loop = None
+        self._slots = None
+        self._batches = {}
+
+    def _bind(self, loop):
+        # asyncio primitives belong to a single event loop
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._batches = {}
+
+    async def call(self, lf_module, func_name, args=(), kwargs=None):
+        """ Await `lingua_franca.<lf_module>.<func_name>(*args, **kwargs)`
+        """
+        func = getattr(import_module("lingua_franca." + lf_module),
+                       func_name)
+        sig = signature(func)
+        kwargs = dict(kwargs or {})
+        # Keyword arguments the function does not take are passed on as
+        # they are, for it to ignore or report like a direct call would
+        extra = {}
+        if not any(param.kind is param.VAR_KEYWORD
+                   for param in sig.parameters.values()):
+            extra = {name: kwargs.pop(name) for name in list(kwargs)
+                     if name not in sig.parameters}
+        try:
+            bound = sig.bind(*args, **kwargs)
+        except TypeError:
+            # e.g. too many arguments, which the call raises in the executor
+            lang = kwargs.pop("lang", "")
+        else:
+            lang = bound.arguments.pop("lang", "")
+            args, kwargs = bound.args, bound.kwargs
+        kwargs.update(extra)
+        lang = lang or get_default_lang()
+
+        loop = asyncio.get_event_loop()
+        self._bind(loop)
+        async with self._slots:
+            future = loop.create_future()
+            key = (lf_module, func_name, lang)
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch()
+                batch.timer = loop.call_later(self.max_batch_delay,
+                                              self._flush, key, batch)
+            batch.calls.append((args, kwargs))
+            batch.futures.append(future)
+            if len(batch.calls) >= self.max_batch_size:
+                batch.timer.cancel()
+                self._flush(key, batch)
+            return await future
+
+    def _flush(self, key, batch):
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+        job = self._loop.run_in_executor(self.executor, _run_batch, *key,
+                                         self._worker_setup, batch.calls)
+
+        def settle(job):
+            if job.cancelled():
+                results = [(False, asyncio.CancelledError())] * \
+                    len(batch.futures)
+            elif job.exception() is not None:
+                results = [(False, job.exception())] * len(batch.futures)
+            else:
+                results = job.result()
+            for future, (ok, value) in zip(batch.futures, results):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        job.add_done_callback(settle)
+
+    def shutdown(self, wait=True):
+        """ Shut down the executor """
+        self.executor.shutdown(wait=wait)
+
+
+_frontend = None
+
+
+def configure(**kwargs):
+    """ Replace the AsyncFrontend used by the functions in this module
+
+    Arguments are those of AsyncFrontend. The previous executor is shut
+    down once its pending calls are done.
+    """
+    global _frontend
+    if _frontend is not None:
+        _frontend.shutdown(wait=False)
+    _frontend = AsyncFrontend(**kwargs)
+    return _frontend
+
+
+def shutdown(wait=True):
+    """ Shut down the executor, e.g. before the event loop is closed """
+    global _frontend
+    if _frontend is not None:
+        _frontend.shutdown(wait=wait)
+        _frontend = None
+
+
+def _awaitable(lf_module, func):
+    lf_module = lf_module.__name__.split('.')[-1]
+
+    @wraps(func)
+    async def call_in_executor(*args, **kwargs):
+        frontend = _frontend or configure()
+        return await frontend.call(lf_module, func.__name__, args, kwargs)
+    return call_in_executor
+
+
+for _module in (_parse, _format):
+    for _name in _module._REGISTERED_FUNCTIONS:
+        globals()[_name] = _awaitable(_module, getattr(_module, _name))
+del _module, _name
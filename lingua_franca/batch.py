@@ -0,0 +1,180 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""" Calling one localized function on many inputs
+
+The batch functions in lingua_franca.parse are built on map_localized().
+The language is resolved, and the localized function looked up, once per
+batch instead of once per input. With `workers`, the inputs are split into
+chunks which are run in a process pool, and the results are put back in
+input order. map_chunks() does the same for any function of a chunk.
+
+pronounce_numbers() and nice_numbers() in lingua_franca.format are built on
+map_unique(), which calls the localized function once per distinct input.
+"""
+import sys
+from functools import partial
+from importlib import import_module
+
+from lingua_franca.internal import load_language, get_active_langs, \
+    resolve_localized_function, _language_residency
+
+# Each worker gets about this many chunks, so that a slow chunk does not
+# leave the other workers idle at the end of a batch
+_CHUNKS_PER_WORKER = 4
+
+
+def _resolve(lf_module, func_name, lang):
+    import_module("lingua_franca." + lf_module)
+    return resolve_localized_function(lf_module, func_name, lang)
+
+
+def _map_chunk(lf_module, func_name, lang, extra_args, kwargs, texts):
+    # Workers started with "spawn" begin with nothing loaded
+    if lang not in get_active_langs():
+        load_language(lang)
+    dispatch = _resolve(lf_module, func_name, lang)
+    return [dispatch((text, *extra_args), kwargs) for text in texts]
+
+
+def _chunks(texts, chunksize):
+    return [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+
+
+def map_localized(lf_module, func_name, texts, lang='', workers=None,
+                  chunksize=None, extra_args=(), **kwargs):
+    """ Call a localized function on each of `texts`
+
+    Equivalent to
+
+        [getattr(lingua_franca.<lf_module>, func_name)(text, *extra_args,
+                                                       lang=lang, **kwargs)
+         for text in texts]
+
+    Arguments:
+        lf_module (str): the top-level module, e.g. "parse"
+        func_name (str): the top-level function, e.g. "extract_number"
+        texts (iterable(str)): the inputs
+        lang (str, optional): a BCP-47 language code, if omitted the
+                              default language will be used.
+        workers (int, optional): number of processes to share the batch
+                                 between. None or 1 runs it in this process.
+        chunksize (int, optional): number of texts sent to a worker at a
+                                   time. By default, each worker gets about
+                                   four chunks.
+        extra_args (tuple, optional): further positional arguments, after
+            the text, the same for every call. For parameters which some
+            languages name differently, such as the anchor date of
+            extract_datetime, as kwargs the localized function does not
+            accept are dropped.
+        **kwargs: further arguments, the same for every call. Must be
+                  picklable when `workers` is used.
+
+    Returns:
+        list: one result per text, in input order
+    """
+    texts = list(texts)
+    # Resolved here even when running in workers, so that a bad language
+    # or missing localization is raised before any process is started
+    dispatch = _resolve(lf_module, func_name, lang)
+    lang = dispatch.lang_code
+    if not workers or workers == 1 or len(texts) < 2:
+        try:
+            return [dispatch((text, *extra_args), kwargs) for text in texts]
+        finally:
+            if lang in _language_residency:
+                _language_residency.evict()
+
+    return map_chunks(partial(_map_chunk, lf_module, func_name, lang,
+                              extra_args, kwargs),
+                      texts, workers, chunksize)
+
+
+def map_unique(lf_module, func_name, values, lang='', workers=None,
+               chunksize=None, **kwargs):
+    """ Call a localized function once per distinct value of `values`
+
+    Equivalent to map_localized(), for inputs with many repeated values,
+    such as a column of prices or counts: each distinct value is passed to
+    the localized function once, and its result is repeated wherever the
+    value occurs. Values of different types are kept apart, so that 1 and
+    1.0 are not taken for one another.
+
+    A NumPy array of numbers, or anything NumPy can make one of, such as a
+    pandas Series, is deduplicated with numpy.unique(). Its values are
+    converted to Python ints and floats before they are passed on. NumPy is
+    not required: it is only used when the caller has already imported it.
+
+    Arguments:
+        lf_module (str): the top-level module, e.g. "format"
+        func_name (str): the top-level function, e.g. "pronounce_number"
+        values (iterable or array): the inputs. An array of more than one
+                                    dimension is taken in the order of
+                                    numpy.ravel().
+        lang (str, optional): a BCP-47 language code, if omitted the
+                              default language will be used.
+        workers (int, optional): number of processes to share the distinct
+                                 values between. None or 1 runs them in this
+                                 process.
+        chunksize (int, optional): number of distinct values sent to a
+                                   worker at a time.
+        **kwargs: further arguments, the same for every call
+
+    Returns:
+        list: one result per value, in input order
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and hasattr(values, "__array__") and \
+            not isinstance(values, (list, tuple)):
+        array = numpy.ravel(numpy.asarray(values))
+        if array.dtype.kind in "biuf":
+            unique, inverse = numpy.unique(array, return_inverse=True)
+            results = map_localized(lf_module, func_name, unique.tolist(),
+                                    lang, workers, chunksize, **kwargs)
+            return [results[i] for i in inverse.ravel().tolist()]
+        values = array.tolist()
+
+    keys = [(type(value), value) for value in values]
+    unique = list(dict.fromkeys(keys))
+    results = map_localized(lf_module, func_name,
+                            [value for _, value in unique], lang, workers,
+                            chunksize, **kwargs)
+    return list(map(dict(zip(unique, results)).__getitem__, keys))
+
+
+def map_chunks(func, items, workers, chunksize=None):
+    """ Run `func` on chunks of `items` in a process pool
+
+    Arguments:
+        func (callable): takes a list of items, returns a list of results.
+                         Must be picklable.
+        items (list): the inputs
+        workers (int): number of processes to share the items between
+        chunksize (int, optional): number of items sent to a worker at a
+                                   time. By default, each worker gets about
+                                   four chunks.
+
+    Returns:
+        list: the results of all the chunks, in input order
+    """
+    # Imported here, as it takes longer than the rest of lingua_franca.format
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not chunksize:
+        chunksize = -(-len(items) // (workers * _CHUNKS_PER_WORKER))
+    chunks = _chunks(items, chunksize)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        results = pool.map(func, chunks)
+        return [result for chunk in results for result in chunk]
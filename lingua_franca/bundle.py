@@ -0,0 +1,227 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Packed per-locale resource bundles.
+
+Each locale under lingua_franca/res/text/ is a folder of small .word files,
+plus date_time.json and normalize.json. A bundle packs all of them into
+lingua_franca/res/bundles/<locale>.json, which is read with a single open().
+
+Bundles are built, or rebuilt after editing the loose files, with:
+
+    python -m lingua_franca.bundle [locale ...]
+
+When a locale has no bundle, or the user overrides any of its resources
+(in ~/.mycroft/text/<locale>/ or /opt/mycroft/res/text/<locale>/), the
+loose files are used instead. So are they, with a warning, when a loose file
+was changed after the bundle was built.
+
+Bundles are read once. invalidate_resource_cache() forgets them, and with
+`config.resource_revalidation_interval` they are checked again, like other
+resources, for new overrides and changes to the bundle or its loose files.
+"""
+import json
+import os
+import sys
+import time
+from warnings import warn
+
+from lingua_franca import config
+from lingua_franca.internal import resolve_resource_file
+
+_BUNDLE_FORMAT = 1
+_RES_DIR = os.path.join(os.path.dirname(__file__), 'res')
+_BUNDLE_DIR = os.path.join(_RES_DIR, 'bundles')
+# (file name, bundle key) of the json resources packed into a bundle
+_JSON_RESOURCES = (("date_time.json", "date_time"),
+                   ("normalize.json", "normalize"))
+
+_loaded_bundles = {}
+# {locale: (time checked, signature)} of the bundles in _loaded_bundles
+_bundle_checks = {}
+
+
+def _read_word(filename):
+    """ Read the first non-comment line of a .word file """
+    try:
+        with open(filename, 'r', encoding='utf8') as f:
+            for line in f:
+                word = line.strip()
+                if word.startswith("#"):
+                    continue  # skip comment lines
+                return word
+    except Exception:
+        pass
+    return None
+
+
+def _user_overrides(locale):
+    """ Does the user override any resource of this locale? """
+    return any(os.path.isdir(os.path.expanduser(os.path.join(path, locale)))
+               for path in ("~/.mycroft/text", "/opt/mycroft/res/text"))
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _newest_source(locale):
+    """ The mtime of the most recently changed loose file of a locale """
+    locale_dir = os.path.join(_RES_DIR, 'text', locale)
+    newest = _mtime(locale_dir)  # changes when files are added or removed
+    try:
+        with os.scandir(locale_dir) as entries:
+            for entry in entries:
+                newest = max(newest, entry.stat().st_mtime)
+    except OSError:
+        pass
+    return newest
+
+
+def _bundle_signature(locale):
+    """ What the bundle of a locale depends on: (user overrides, mtime of
+        the bundle, mtime of its newest loose file)
+    """
+    if _user_overrides(locale):
+        return True, None, None
+    bundle_mtime = _mtime(os.path.join(_BUNDLE_DIR, locale + ".json"))
+    if bundle_mtime is None:
+        return False, None, None
+    return False, bundle_mtime, _newest_source(locale)
+
+
+def _read_bundle(locale, signature):
+    overrides, bundle_mtime, newest_source = signature
+    if overrides or bundle_mtime is None:
+        return None
+    if newest_source is not None and newest_source > bundle_mtime:
+        warn("The resource bundle of {} is older than its resource files, "
+             "which are used instead. Rebuild it with: python -m "
+             "lingua_franca.bundle {}".format(locale, locale))
+        return None
+    try:
+        with open(os.path.join(_BUNDLE_DIR, locale + ".json"),
+                  encoding='utf8') as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if bundle.get("format") != _BUNDLE_FORMAT:
+        return None
+    return bundle
+
+
+def load_bundle(locale):
+    """ Get the resource bundle of a locale, reading it on first use
+
+    Args:
+        locale (str): a full language code, such as 'en-us'
+
+    Returns:
+        dict: {"words": {name: word}, "date_time": {...}, "normalize": {...}}
+              or None, if the loose files should be used instead
+    """
+    check = _bundle_checks.get(locale)
+    interval = config.resource_revalidation_interval
+    if check is not None and interval is not None and \
+            time.monotonic() - check[0] >= interval:
+        signature = _bundle_signature(locale)
+        if signature != check[1]:
+            _loaded_bundles.pop(locale, None)
+        else:
+            _bundle_checks[locale] = (time.monotonic(), signature)
+    if locale not in _loaded_bundles:
+        signature = _bundle_signature(locale)
+        _loaded_bundles[locale] = _read_bundle(locale, signature)
+        _bundle_checks[locale] = (time.monotonic(), signature)
+    return _loaded_bundles[locale]
+
+
+def unload_bundles():
+    """ Forget bundles read so far, e.g. after rebuilding them """
+    _loaded_bundles.clear()
+    _bundle_checks.clear()
+
+
+def read_locale_json(locale, name):
+    """ Read one of a locale's json resources
+
+    Args:
+        locale (str): a full language code, such as 'en-us'
+        name (str): 'date_time' or 'normalize'
+
+    Returns:
+        dict: the parsed json, or None if the locale doesn't have it
+    """
+    bundle = load_bundle(locale)
+    if bundle is not None:
+        return bundle.get(name)
+    filename = resolve_resource_file(
+        os.path.join("text", locale, name + ".json"))
+    if not filename:
+        return None
+    with open(filename, encoding='utf8') as f:
+        return json.load(f)
+
+
+def build_bundle(locale):
+    """ Pack the loose resource files of a locale into a bundle
+
+    Args:
+        locale (str): a full language code, such as 'en-us'
+
+    Returns:
+        dict: the bundle, as stored by write_bundles()
+    """
+    locale_dir = os.path.join(_RES_DIR, 'text', locale)
+    bundle = {"format": _BUNDLE_FORMAT, "locale": locale, "words": {}}
+    for filename in sorted(os.listdir(locale_dir)):
+        name, ext = os.path.splitext(filename)
+        if ext == ".word":
+            word = _read_word(os.path.join(locale_dir, filename))
+            if word is not None:
+                bundle["words"][name] = word
+    for filename, key in _JSON_RESOURCES:
+        path = os.path.join(locale_dir, filename)
+        if os.path.isfile(path):
+            with open(path, encoding='utf8') as f:
+                bundle[key] = json.load(f)
+    return bundle
+
+
+def write_bundles(locales=None):
+    """ Build and write the bundles of the given locales (default: all)
+
+    Returns:
+        list(str): the paths written
+    """
+    locales = locales or sorted(os.listdir(os.path.join(_RES_DIR, 'text')))
+    os.makedirs(_BUNDLE_DIR, exist_ok=True)
+    written = []
+    for locale in locales:
+        path = os.path.join(_BUNDLE_DIR, locale + ".json")
+        with open(path, 'w', encoding='utf8') as f:
+            json.dump(build_bundle(locale), f, ensure_ascii=False,
+                      separators=(',', ':'), sort_keys=True)
+        written.append(path)
+    unload_bundles()
+    return written
+
+
+if __name__ == "__main__":
+    for path in write_bundles(sys.argv[1:]):
+        print(path)
@@ -1,2 +1,14 @@
 load_langs_on_demand = False
+# Number of languages loaded on demand which stay loaded after use. Beyond
+# this, the least recently used are unloaded. 0 unloads after every call.
+max_langs_on_demand = 0
 inject_timezones = True
+# Seconds after which cached resources are checked for changes on disk,
+# e.g. new files in ~/.mycroft. None never checks.
+resource_revalidation_interval = None
+# Number of parse results kept, so that repeated calls with the same
+# arguments are answered without parsing. 0 turns the cache off.
+result_cache_size = 0
+# Seconds after which a cached result is computed again. None keeps results
+# until they are pushed out by newer ones.
+result_cache_ttl = None
@@ -22,13 +22,14 @@ from warnings import warn
 from os.path import join
 
 
+from lingua_franca.batch import map_unique
 from lingua_franca.bracket_expansion import SentenceTreeParser
 from lingua_franca.internal import localized_function, \
     populate_localized_function_dict, get_active_langs, \
-    get_full_lang_code, get_default_lang, get_default_loc, \
-    is_supported_full_lang, _raise_unsupported_language, \
+    get_full_lang_code, get_default_loc, is_supported_full_lang, \
     UnsupportedLanguageError, NoneLangWarning, InvalidLangWarning, \
-    FunctionNotLocalizedError
+    FunctionNotLocalizedError, read_resource_file
+from lingua_franca.bundle import load_bundle, _read_word, _RES_DIR
 
 
 _REGISTERED_FUNCTIONS = ("nice_number",
@@ -51,7 +52,6 @@ def _translate_word(name, lang=''):
     Returns:
         str: translated version of resource name
     """
-    from lingua_franca.internal import resolve_resource_file
     if not lang:
         if lang is None:
             warn(NoneLangWarning)
@@ -60,19 +60,15 @@ def _translate_word(name, lang=''):
     lang_code = lang if is_supported_full_lang(lang) else \
         get_full_lang_code(lang)
 
-    filename = resolve_resource_file(join("text", lang_code, name + ".word"))
-    if filename:
-        # open the file
-        try:
-            with open(filename, 'r', encoding='utf8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word.startswith("#"):
-                        continue  # skip comment lines
-                    return word
-        except Exception:
-            pass
-    return name  # use resource name as the word
+    bundle = load_bundle(lang_code)
+    if bundle is not None:
+        return bundle["words"].get(name, name)
+
+    word = read_resource_file(join("text", lang_code, name + ".word"),
+                              _read_word)
+    if word is None:
+        return name  # use resource name as the word
+    return word
 
 
 NUMBER_TUPLE = namedtuple(
@@ -85,21 +81,17 @@ class DateTimeFormat:
     def __init__(self, config_path):
         self.lang_config = {}
         self.config_path = config_path
+        # Packed bundles only hold the package's own resources
+        self.use_bundles = os.path.abspath(config_path) == \
+            os.path.abspath(join(_RES_DIR, 'text'))
 
     def cache(self, lang):
         if lang not in self.lang_config:
-            try:
-                # Attempt to load the language-specific formatting data
-                with open(self.config_path + '/' + lang + '/date_time.json',
-                          'r', encoding='utf8') as lang_config_file:
-                    self.lang_config[lang] = json.loads(
-                        lang_config_file.read())
-            except FileNotFoundError:
-                # Fallback to English formatting
-                with open(self.config_path + '/en-us/date_time.json',
-                          'r') as lang_config_file:
-                    self.lang_config[lang] = json.loads(
-                        lang_config_file.read())
+            bundle = load_bundle(lang) if self.use_bundles else None
+            if bundle is not None and "date_time" in bundle:
+                self.lang_config[lang] = bundle["date_time"]
+            else:
+                self._read_config(lang)
 
             for x in ['decade_format', 'hundreds_format', 'thousand_format',
                       'year_format']:
@@ -110,6 +102,20 @@ class DateTimeFormat:
                                    ))
                     i = i + 1
 
+    def _read_config(self, lang):
+        try:
+            # Attempt to load the language-specific formatting data
+            with open(self.config_path + '/' + lang + '/date_time.json',
+                      'r', encoding='utf8') as lang_config_file:
+                self.lang_config[lang] = json.loads(
+                    lang_config_file.read())
+        except FileNotFoundError:
+            # Fallback to English formatting
+            with open(self.config_path + '/en-us/date_time.json',
+                      'r') as lang_config_file:
+                self.lang_config[lang] = json.loads(
+                    lang_config_file.read())
+
     def _number_strings(self, number, lang):
         x = (self.lang_config[lang]['number'].get(str(number % 10)) or
              str(number % 10))
@@ -260,6 +266,38 @@ def nice_number(number, lang='', speech=True, denominators=None):
     return str(number)
 
 
+def nice_numbers(numbers, lang='', workers=None, chunksize=None, **kwargs):
+    """Format many floats to human readable functions
+
+    Equivalent to calling nice_number() on each number, with the language
+    resolved once, and each distinct number formatted once. Meant for
+    columns of numbers, such as prices or measurements, which repeat.
+
+    Args:
+        numbers (iterable or array): the numbers to format. NumPy arrays,
+                                     and anything NumPy can make one of,
+                                     are deduplicated with numpy.unique().
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): number of processes to share the distinct
+                                 numbers between. None or 1 runs them in
+                                 this process.
+        chunksize (int, optional): number of distinct numbers sent to a
+                                   worker at a time.
+        **kwargs: further arguments of nice_number(), such as speech and
+                  denominators, the same for every number
+    Returns:
+        list(str): the formatted string of each number, in order
+    """
+    if not hasattr(numbers, "__array__"):
+        numbers = list(numbers)
+    try:
+        return map_unique("format", "nice_number", numbers, lang, workers,
+                          chunksize, **kwargs)
+    except UnsupportedLanguageError:
+        return [str(number) for number in numbers]
+
+
 @localized_function()
 def nice_time(dt, lang='', speech=True, use_24hour=False,
               use_ampm=False, variant=None):
@@ -305,6 +343,36 @@ def pronounce_number(number, lang='', places=2, short_scale=True,
     """
 
 
+def pronounce_numbers(numbers, lang='', workers=None, chunksize=None,
+                      **kwargs):
+    """
+    Convert many numbers to their spoken equivalents
+
+    Equivalent to calling pronounce_number() on each number, with the
+    language resolved once, and each distinct number pronounced once. Meant
+    for columns of numbers, such as counts or prices, which repeat.
+
+    Args:
+        numbers (iterable or array): the numbers to pronounce. NumPy arrays,
+                                     and anything NumPy can make one of,
+                                     are deduplicated with numpy.unique().
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): number of processes to share the distinct
+                                 numbers between. None or 1 runs them in
+                                 this process.
+        chunksize (int, optional): number of distinct numbers sent to a
+                                   worker at a time.
+        **kwargs: further arguments of pronounce_number(), such as places,
+                  short_scale, scientific and ordinals, the same for every
+                  number. Those left out keep the language's own defaults.
+    Returns:
+        list(str): the pronounced number of each number, in order
+    """
+    return map_unique("format", "pronounce_number", numbers, lang, workers,
+                      chunksize, **kwargs)
+
+
 def nice_date(dt, lang='', now=None):
     """
     Format a datetime to a pronounceable date
@@ -1,12 +1,18 @@
+import os
 import os.path
+import stat
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
 from functools import wraps
 from importlib import import_module
-from inspect import signature
+from inspect import Parameter, signature
 
 from warnings import warn
-from datetime import datetime
+from datetime import datetime, timedelta
 from lingua_franca import config
-from lingua_franca.time import to_local
+from lingua_franca.time import now_local, to_local
 
 
 _SUPPORTED_LANGUAGES = ("ca", "cs", "da", "de", "en", "es", "fr", "hu",
@@ -45,6 +51,12 @@ __loaded_langs = []
 
 _localized_functions = {}
 
+# Resolved localized callables, keyed by (module name, function name) and then
+# by language code. Rebuilt by populate_localized_function_dict() whenever the
+# set of loaded languages changes, so that a call to a decorated function can
+# skip the signature inspection and module lookup performed by the decorator.
+_localized_dispatch = {}
+
 # TODO the deprecation of 'lang=None' and 'lang=<invalid>' can refer to
 # commit 35efd0661a178e82f6745ad17e10e607c0d83472 for the "proper" state
 # of affairs, raising the errors below instead of deprecation warnings
@@ -53,6 +65,71 @@ _localized_functions = {}
 # parameter changed from lang=None to lang='' should be switched back
 
 
+class _LanguageResidency:
+    """ Tracks the languages loaded by `config.load_langs_on_demand`
+
+    Languages loaded on demand stay loaded until more than
+    `config.max_langs_on_demand` of them are resident, at which point the
+    least recently used are unloaded. Languages loaded explicitly, through
+    `load_language()` and friends, are never tracked or evicted.
+    """
+
+    def __init__(self):
+        self._resident = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._resident)
+
+    def __contains__(self, lang):
+        return lang in self._resident
+
+    def acquire(self, lang):
+        """ Load `lang` on demand and mark it most recently used """
+        self.misses += 1
+        load_language(lang)
+        self._resident[lang] = None
+
+    def touch(self, lang):
+        """ Record a call to `lang`, if it was loaded on demand """
+        if lang in self._resident:
+            self.hits += 1
+            self._resident.move_to_end(lang)
+
+    def evict(self):
+        """ Unload least recently used languages until within the cap """
+        while len(self._resident) > max(config.max_langs_on_demand, 0):
+            lang, _ = self._resident.popitem(last=False)
+            self.evictions += 1
+            unload_language(lang)
+
+    def discard(self, lang):
+        """ Stop tracking `lang`, without unloading it """
+        self._resident.pop(lang, None)
+
+    def retain(self, langs):
+        """ Stop tracking any language which is no longer loaded """
+        for lang in [lang for lang in self._resident if lang not in langs]:
+            del self._resident[lang]
+
+    def langs(self):
+        return list(self._resident)
+
+    def stats(self):
+        return {"resident": len(self._resident),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions}
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+
+_language_residency = _LanguageResidency()
+
+
 class UnsupportedLanguageError(NotImplementedError):
     pass
 
@@ -127,6 +204,8 @@ def _set_active_langs(langs=None, override_default=True):
                         " 'str' or 'list'"))
     global __loaded_langs, __default_lang
     __loaded_langs = list(dict.fromkeys(langs))
+    _language_residency.retain(__loaded_langs)
+    _result_cache.clear()
     if __default_lang:
         if override_default or get_primary_lang_code(__default_lang) \
                 not in __loaded_langs:
@@ -174,6 +253,9 @@ def load_language(lang):
        `import lingua_franca.parse`, will only import those functions
        which belong to currently-loaded languages.
 
+       Either way, the localized modules themselves are imported lazily,
+       the first time one of their functions is called.
+
     Arguments:
         lang (str): the language code to load (any supported lang code,
                     whether 'primary' or 'full')
@@ -185,6 +267,8 @@ def load_language(lang):
     if lang not in _SUPPORTED_LANGUAGES:
         if lang in _SUPPORTED_FULL_LOCALIZATIONS:
             lang = get_primary_lang_code(lang)
+    # An explicit load pins languages which were loaded on demand
+    _language_residency.discard(lang)
     if lang not in __loaded_langs:
         __loaded_langs.append(lang)
     if not __default_lang:
@@ -231,6 +315,34 @@ def unload_languages(langs):
     _set_active_langs(__loaded_langs)
 
 
+def get_resident_langs():
+    """ Get the languages currently kept loaded by
+        `config.load_langs_on_demand`, least recently used first.
+
+    Returns:
+        list(str)
+    """
+    return _language_residency.langs()
+
+
+def get_residency_stats():
+    """ Get counters for languages loaded on demand
+
+    'hits' counts calls to a language which was still resident, 'misses'
+    calls which had to load their language, and 'evictions' languages
+    unloaded to stay within `config.max_langs_on_demand`.
+
+    Returns:
+        dict: {"resident": int, "hits": int, "misses": int, "evictions": int}
+    """
+    return _language_residency.stats()
+
+
+def reset_residency_stats():
+    """ Zero the counters reported by `get_residency_stats()` """
+    _language_residency.reset_stats()
+
+
 def get_default_lang():
     """ Return the current default language.
         This returns the active BCP-47 code, such as 'en' or 'es'.
@@ -386,7 +498,77 @@ def __get_full_lang_code_deprecation_warning(lang=''):
         raise UnsupportedLanguageError(lang)
 
 
-def localized_function(run_own_code_on=[type(None)]):
+# Sentinel returned by the dispatch fast path when the full lookup is needed
+_DISPATCH_MISS = object()
+# Language codes which the full lookup drops from positional arguments
+_POSITIONAL_LANG_CODES = frozenset(_SUPPORTED_LANGUAGES +
+                                   _SUPPORTED_FULL_LOCALIZATIONS)
+
+
+def _inject_timezones(args, kwargs):
+    """ Add the local timezone to any naive datetime among a call's arguments
+
+    Arguments:
+        args (tuple): positional arguments
+        kwargs (dict): keyword arguments
+
+    Returns:
+        (tuple, dict): the arguments, with naive datetimes made local.
+                       Neither input is modified.
+    """
+    for key, value in kwargs.items():
+        if isinstance(value, datetime) and value.tzinfo is None:
+            kwargs = dict(kwargs)
+            kwargs[key] = to_local(value)
+    for idx, value in enumerate(args):
+        if isinstance(value, datetime) and value.tzinfo is None:
+            args = (*args[:idx], to_local(value), *args[idx + 1:])
+    return args, kwargs
+
+
+class _AllKwargs:
+    """ The kwargs accepted by a function taking **kwargs: all but 'lang' """
+
+    def __contains__(self, arg):
+        return arg != 'lang'
+
+
+def _accepted_kwargs(loc_signature):
+    """ The names of the kwargs a localized function accepts, but 'lang' """
+    if any(param.kind is Parameter.VAR_KEYWORD
+           for param in loc_signature.parameters.values()):
+        return _AllKwargs()
+    return frozenset(loc_signature.parameters) - {'lang'}
+
+
+def _make_dispatcher(localized_func, loc_signature, lang_code):
+    """ Build the argument adapter stored in the dispatch table
+
+    The adapter drops the 'lang' kwarg, along with any kwargs the localized
+    function does not accept, and calls the localized function. This mirrors
+    what @localized_function does on a full lookup.
+
+    Arguments:
+        localized_func (callable): e.g. parse_en.extract_number_en
+        loc_signature (inspect.Signature): the signature of localized_func
+        lang_code (str): the primary language code of localized_func
+
+    Returns:
+        callable: dispatcher(args, kwargs), with attribute `lang_code`
+    """
+    accepted = _accepted_kwargs(loc_signature)
+
+    def dispatcher(args, kwargs):
+        if kwargs:
+            kwargs = {arg: val for arg, val in kwargs.items()
+                      if arg in accepted}
+        return localized_func(*args, **kwargs)
+    dispatcher.lang_code = lang_code
+    return dispatcher
+
+
+def localized_function(run_own_code_on=[type(None)], cache_results=False,
+                       anchor_param=None):
     """
     Decorator which finds localized functions, and calls them, from signatures
     defined in the top-level modules. See lingua_franca.format or .parse for
@@ -426,6 +608,16 @@ def localized_function(run_own_code_on=[type(None)]):
             be run. Calls to the wrapped function will be passed to the
             appropriate, localized function.
 
+        cache_results(bool)
+            Whether results may be kept by the result cache, which is
+            turned on by `config.result_cache_size`. Only for functions
+            whose result depends on nothing but their arguments.
+
+        anchor_param(str, optional)
+            The parameter holding the date relative to which the function
+            works, like extract_datetime's 'anchorDate'. The result cache
+            fills it in with now_local() when it is omitted.
+
 
     """
     # Make sure everything in run_own_code_on is an Error or None
@@ -457,7 +649,6 @@ def localized_function(run_own_code_on=[type(None)]):
         def _call_localized_function(func, *args, **kwargs):
             lang_code = None
             load_langs_on_demand = config.load_langs_on_demand
-            unload_language_afterward = False
             func_signature = signature(func)
             func_params = list(func_signature.parameters)
             lang_param_index = func_params.index('lang')
@@ -465,12 +656,7 @@ def localized_function(run_own_code_on=[type(None)]):
 
             # Check if we need to add timezone awareness to any datetime object
             if config.inject_timezones:
-                for key, value in kwargs.items():
-                    if isinstance(value, datetime) and value.tzinfo is None:
-                        kwargs[key] = to_local(value)
-                for idx, value in enumerate(args):
-                    if isinstance(value, datetime) and value.tzinfo is None:
-                        args = (*args[:idx], to_local(value), *args[idx + 1:])
+                args, kwargs = _inject_timezones(args, kwargs)
 
             # Check if we're passing a lang as a kwarg
             if 'lang' in kwargs.keys():
@@ -541,10 +727,11 @@ def localized_function(run_own_code_on=[type(None)]):
             if _module_name not in _localized_functions.keys():
                 raise ModuleNotFoundError("Module lingua_franca." +
                                           _module_name + " not recognized")
-            if lang_code not in _localized_functions[_module_name].keys():
+            if lang_code in _language_residency:
+                _language_residency.touch(lang_code)
+            elif lang_code not in _localized_functions[_module_name].keys():
                 if load_langs_on_demand:
-                    load_language(lang_code)
-                    unload_language_afterward = True
+                    _language_residency.acquire(lang_code)
                 else:
                     raise ModuleNotFoundError(_module_name +
                                               " module of language '" +
@@ -584,31 +771,78 @@ def localized_function(run_own_code_on=[type(None)]):
 
             # Now we call the function, ignoring any kwargs from the
             # wrapped function that aren't in the localized function.
+            accepted = _accepted_kwargs(loc_signature)
             r_val = localized_func(*args,
                                    **{arg: val for arg, val
                                       in kwargs.items()
-                                      if arg in loc_signature.parameters})
+                                      if arg in accepted})
 
             # Unload all the stuff we just assembled and imported
             del localized_func
             del _module
-            if unload_language_afterward:
-                unload_language(lang_code)
+            if lang_code in _language_residency:
+                _language_residency.evict()
+            return r_val
+
+        # Precomputed state for the dispatch table fast path
+        _dispatch_key = (func.__module__.split('.')[-1],
+                         func.__name__.split('.')[-1])
+        _dispatch_table = _localized_dispatch.setdefault(_dispatch_key, {})
+        _func_signature = signature(func)
+        _func_params = list(_func_signature.parameters)
+        _lang_param_index = _func_params.index('lang') \
+            if 'lang' in _func_params else -1
+
+        def _dispatch_localized_function(args, kwargs):
+            # Only handles the common case: 'lang' omitted or passed as a
+            # keyword argument, naming an already-loaded language. Anything
+            # else returns _DISPATCH_MISS and is handled by the full lookup.
+            if _lang_param_index < 0 or _lang_param_index < len(args):
+                return _DISPATCH_MISS
+            # The full lookup drops positional args naming the language, as
+            # in extract_datetime("tomorrow", "en")
+            for arg in args:
+                if isinstance(arg, str) and arg in _POSITIONAL_LANG_CODES:
+                    return _DISPATCH_MISS
+            lang_code = kwargs.get('lang', '')
+            if lang_code is None:
+                return _DISPATCH_MISS
+            dispatch = _dispatch_table.get(lang_code or __default_lang)
+            if dispatch is None:
+                return _DISPATCH_MISS
+            if _language_residency:
+                _language_residency.touch(dispatch.lang_code)
+            if config.inject_timezones:
+                args, kwargs = _inject_timezones(args, kwargs)
+            return dispatch(args, kwargs)
+
+        def _call_dispatched_or_localized_function(*args, **kwargs):
+            r_val = _dispatch_localized_function(args, kwargs)
+            if r_val is _DISPATCH_MISS:
+                r_val = _call_localized_function(func, *args, **kwargs)
             return r_val
 
         # Actual wrapper
         @wraps(func)
         def call_localized_function(*args, **kwargs):
+            if cache_results and config.result_cache_size > 0:
+                return _result_cache.call(_call_uncached, _dispatch_key,
+                                          _func_signature, args, kwargs,
+                                          anchor_param)
+            return _call_uncached(*args, **kwargs)
+
+        def _call_uncached(*args, **kwargs):
             if run_own_code_on != [type(None)]:
                 try:
-                    return _call_localized_function(func, *args, **kwargs)
+                    return _call_dispatched_or_localized_function(*args,
+                                                                  **kwargs)
                 except Exception as e:  # Intercept, check for run_own_code_on
                     if any((isinstance(e, error) for error in run_own_code_on)):
                         return func(*args, **kwargs)
                     else:
                         raise e
             else:  # don't intercept any exceptions
-                return _call_localized_function(func, *args, **kwargs)
+                return _call_dispatched_or_localized_function(*args, **kwargs)
         return call_localized_function
     try:
         return localized_function_decorator
@@ -617,16 +851,148 @@ def localized_function(run_own_code_on=[type(None)]):
         return
 
 
+def resolve_localized_function(lf_module, func_name, lang=''):
+    """ Look up the localized implementation of a top-level function
+
+    This performs the language resolution done by @localized_function on
+    every call, once, and returns the callable it would end up invoking.
+    Used by lingua_franca.batch to call the same function on many inputs.
+
+    Arguments:
+        lf_module (str): the top-level module, e.g. "parse"
+        func_name (str): the top-level function, e.g. "extract_number"
+        lang (str, optional): a BCP-47 language code, if omitted the
+                              default language will be used.
+
+    Returns:
+        callable: dispatcher(args, kwargs), which calls e.g.
+                  lingua_franca.lang.parse_en.extract_number_en, dropping
+                  any kwargs the localized function does not accept.
+
+    Raises:
+        UnsupportedLanguageError: `lang` is not supported
+        FunctionNotLocalizedError: `lang` does not implement `func_name`
+        ModuleNotFoundError: `lang` is not loaded, and
+                             config.load_langs_on_demand is off
+    """
+    lang_code = lang or get_default_lang()
+    if not lang_code:
+        raise ModuleNotFoundError("No language module loaded.")
+    lang_code = lang_code.lower()
+    if lang_code not in _SUPPORTED_LANGUAGES:
+        if lang_code not in _SUPPORTED_FULL_LOCALIZATIONS:
+            _raise_unsupported_language(lang_code)
+        lang_code = lang_code.split('-')[0]
+    if lf_module not in _localized_functions:
+        raise ModuleNotFoundError("Module lingua_franca." + lf_module +
+                                  " not recognized")
+    if lang_code in _language_residency:
+        _language_residency.touch(lang_code)
+    elif lang_code not in _localized_functions[lf_module]:
+        if config.load_langs_on_demand:
+            _language_residency.acquire(lang_code)
+        else:
+            raise ModuleNotFoundError(lf_module + " module of language '" +
+                                      lang_code + "' is not currently "
+                                      "loaded.")
+    functions = _localized_functions[lf_module][lang_code]
+    loc_signature = functions[func_name]
+    if isinstance(loc_signature, NotImplementedError):
+        raise loc_signature
+    return functions.dispatchers[func_name]
+
+
+class _LocalizedFunctions(dict):
+    """ {function_name(str): signature} for one language of one top-level
+        module, such as Spanish `lingua_franca.parse`.
+
+    Nothing is imported until a function is first looked up. At that point
+    the language's module, e.g. `lingua_franca.lang.parse_es`, is imported
+    and the localized function's signature is cached. Functions which the
+    language does not implement are cached as FunctionNotLocalizedError.
+
+    The localized function is also added to the dispatch table, so that
+    later calls skip the lookup entirely.
+    """
+
+    def __init__(self, lf_module, lang_code):
+        super().__init__()
+        self.lf_module = lf_module
+        self.lang_code = lang_code
+        self.dispatchers = {}
+
+    def __missing__(self, function_name):
+        bad_lang_code = "Language code '{}' is registered with" \
+            " Lingua Franca, but its " + self.lf_module + " module" \
+            " could not be found."
+        try:
+            mod = import_module(".lang." + self.lf_module + "_" +
+                                self.lang_code, "lingua_franca")
+        except ModuleNotFoundError:
+            warn(Warning(bad_lang_code.format(self.lang_code)))
+            return self._function_not_found(function_name)
+
+        try:
+            function = getattr(mod, function_name + "_" + self.lang_code)
+        except AttributeError:
+            # TODO log these occurrences: "function 'function_name' not
+            # implemented in language 'primary_lang_code'"
+            #
+            # Perhaps provide this info to autodocs, to help volunteers
+            # identify the functions in need of localization
+            return self._function_not_found(function_name)
+        function_signature = signature(function)
+        self[function_name] = function_signature
+        self.dispatchers[function_name] = _make_dispatcher(function,
+                                                           function_signature,
+                                                           self.lang_code)
+        if _localized_functions.get(self.lf_module, {}).get(self.lang_code) \
+                is self:
+            self.register_dispatchers()
+        return function_signature
+
+    def _function_not_found(self, function_name):
+        try:
+            lang_common_data = import_module(".lang.common_data_" +
+                                             self.lang_code, "lingua_franca")
+            message = getattr(lang_common_data,
+                              "_FUNCTION_NOT_IMPLEMENTED_WARNING")
+        except Exception:
+            message = "This function has not been implemented" \
+                " in the specified language."
+        self[function_name] = FunctionNotLocalizedError(message)
+        return self[function_name]
+
+    def register_dispatchers(self):
+        """ Add every function resolved so far to the dispatch table """
+        lang_aliases = [self.lang_code] + \
+            [full_code for full_code in _SUPPORTED_FULL_LOCALIZATIONS
+             if full_code.split('-')[0] == self.lang_code]
+        for function_name, dispatcher in self.dispatchers.items():
+            table = _localized_dispatch.setdefault(
+                (self.lf_module, function_name), {})
+            for alias in lang_aliases:
+                table[alias] = dispatcher
+
+
+# _LocalizedFunctions, keyed by (module name, primary language code). These
+# outlive unloading a language, just as its modules stay in sys.modules.
+_localized_function_cache = {}
+
+
 def populate_localized_function_dict(lf_module, langs=get_active_langs()):
     """Returns a dictionary of dictionaries, containing localized functions.
 
     Used by the top-level modules to locate, cache, and call localized funcs.
 
+    Localized modules are not imported here. Each function is looked up, and
+    its module imported, the first time it is called in a given language.
+
     Arguments:
         lf_module(str) - - the name of the top-level module
 
     Returns:
-        Dict - - {language_code: {function_name(str): function}}
+        Dict - - {language_code: {function_name(str): signature}}
 
     Note:
         The dictionary returned can be used directly,
@@ -636,55 +1002,127 @@ def populate_localized_function_dict(lf_module, langs=get_active_langs()):
         and its members are invoked via the `@localized_function` decorator.
 
     Example:
-        populate_localized_function_dict("format")["en"]["pronounce_number"](1)
-        "one"
+        populate_localized_function_dict("format")["en"]["pronounce_number"]
+        <Signature (number, places=2, short_scale=True, scientific=False,
+                    ordinals=False)>
     """
-    bad_lang_code = "Language code '{}' is registered with" \
-        " Lingua Franca, but its " + lf_module + " module" \
-        " could not be found."
     return_dict = {}
+    for key, table in _localized_dispatch.items():
+        if key[0] == lf_module:
+            table.clear()
     for lang_code in langs:
         primary_lang_code = get_primary_lang_code(lang_code)
-        return_dict[primary_lang_code] = {}
-        _FUNCTION_NOT_FOUND = ""
-        try:
-            lang_common_data = import_module(".lang.common_data_" + primary_lang_code,
-                                             "lingua_franca")
-            _FUNCTION_NOT_FOUND = getattr(lang_common_data,
-                                          "_FUNCTION_NOT_IMPLEMENTED_WARNING")
-            del lang_common_data
-        except Exception:
-            _FUNCTION_NOT_FOUND = "This function has not been implemented" \
-                " in the specified language."
-        _FUNCTION_NOT_FOUND = FunctionNotLocalizedError(_FUNCTION_NOT_FOUND)
+        functions = _localized_function_cache.setdefault(
+            (lf_module, primary_lang_code),
+            _LocalizedFunctions(lf_module, primary_lang_code))
+        functions.register_dispatchers()
+        return_dict[primary_lang_code] = functions
+    _localized_functions[lf_module] = return_dict
+    return _localized_functions[lf_module]
+
+
+class _ResourceCache:
+    """ Process-wide cache of resolved resource paths and their contents
+
+    Entries are keyed by (res_name, data_dir). Resource names include the
+    locale, e.g. 'text/en-us/and.word'. Each entry holds the resolved path
+    and the contents parsed from it, one per parser function.
+
+    If `config.resource_revalidation_interval` is a number of seconds,
+    entries older than that are checked again: if a file has appeared,
+    disappeared or changed its mtime in any of the locations searched by
+    `resolve_resource_file()`, including the ~/.mycroft and /opt/mycroft/res
+    overrides, the entry is dropped and the resource resolved anew.
+    """
 
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _candidates(res_name, data_dir):
+        data_dir = data_dir or os.path.expanduser("/opt/mycroft/res/")
+        package_file = os.path.join(os.path.dirname(__file__), 'res',
+                                    res_name)
+        return (res_name,
+                os.path.expanduser("~/.mycroft/" + res_name),
+                os.path.expanduser(os.path.join(data_dir, res_name)),
+                os.path.abspath(os.path.normpath(package_file)))
+
+    @staticmethod
+    def _mtime(filename):
         try:
-            mod = import_module(".lang." + lf_module + "_" + primary_lang_code,
-                                "lingua_franca")
-        except ModuleNotFoundError:
-            warn(Warning(bad_lang_code.format(primary_lang_code)))
-            continue
+            file_stat = os.stat(filename)
+        except (OSError, ValueError):
+            return None
+        return file_stat.st_mtime if stat.S_ISREG(file_stat.st_mode) \
+            else None
+
+    def _resolve(self, res_name, data_dir):
+        """ Find a resource, and the mtimes which would change the result
+
+        Returns:
+            (str, tuple): the path (or None), and the mtimes of each
+                          location checked, up to and including the path
+        """
+        signature = []
+        for filename in self._candidates(res_name, data_dir):
+            mtime = self._mtime(filename)
+            signature.append(mtime)
+            if mtime is not None:
+                return filename, tuple(signature)
+        return None, tuple(signature)
+
+    def _entry(self, res_name, data_dir):
+        key = (res_name, data_dir)
+        entry = self._entries.get(key)
+        interval = config.resource_revalidation_interval
+        if entry is not None and interval is not None and \
+                time.monotonic() - entry["checked"] >= interval:
+            if self._resolve(res_name, data_dir)[1] != entry["signature"]:
+                self.reloads += 1
+                entry = None
+            else:
+                entry["checked"] = time.monotonic()
+        if entry is None:
+            self.misses += 1
+            path, signature = self._resolve(res_name, data_dir)
+            entry = self._entries[key] = {"path": path,
+                                          "signature": signature,
+                                          "checked": time.monotonic(),
+                                          "contents": {}}
+        else:
+            self.hits += 1
+        return entry
+
+    def resolve(self, res_name, data_dir=None):
+        return self._entry(res_name, data_dir)["path"]
+
+    def read(self, res_name, parser, data_dir=None):
+        entry = self._entry(res_name, data_dir)
+        if entry["path"] is None:
+            return None
+        if parser not in entry["contents"]:
+            entry["contents"][parser] = parser(entry["path"])
+        return entry["contents"][parser]
+
+    def invalidate(self, res_name=None):
+        if res_name is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[0] == res_name]:
+                del self._entries[key]
 
-        function_names = getattr(import_module("." + lf_module, "lingua_franca"),
-                                 "_REGISTERED_FUNCTIONS")
-        for function_name in function_names:
-            try:
-                function = getattr(mod, function_name
-                                   + "_" + primary_lang_code)
-                function_signature = signature(function)
-                del function
-            except AttributeError:
-                function_signature = _FUNCTION_NOT_FOUND
-                # TODO log these occurrences: "function 'function_name' not
-                # implemented in language 'primary_lang_code'"
-                #
-                # Perhaps provide this info to autodocs, to help volunteers
-                # identify the functions in need of localization
-            return_dict[primary_lang_code][function_name] = function_signature
-
-        del mod
-    _localized_functions[lf_module] = return_dict
-    return _localized_functions[lf_module]
+    def stats(self):
+        return {"entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads}
+
+
+_resource_cache = _ResourceCache()
 
 
 def resolve_resource_file(res_name, data_dir=None):
@@ -698,6 +1136,11 @@ def resolve_resource_file(res_name, data_dir=None):
     then finally it will look for res_name in the 'mycroft/res'
     folder of the source code package.
 
+    Results are cached for the life of the process. See
+    `config.resource_revalidation_interval` to pick up files added to, or
+    changed in, the override folders while running, and
+    `invalidate_resource_cache()` to do so on request.
+
     Example:
     With mycroft running as the user 'bob', if you called
         resolve_resource_file('snd/beep.wav')
@@ -711,28 +1154,277 @@ def resolve_resource_file(res_name, data_dir=None):
     Returns:
         str: path to resource or None if no resource found
     """
-    # First look for fully qualified file (e.g. a user setting)
-    if os.path.isfile(res_name):
-        return res_name
+    return _resource_cache.resolve(res_name, data_dir)
+
+
+def read_resource_file(res_name, parser, data_dir=None):
+    """Resolve a resource and parse it, caching the result.
+
+    The parsed value is cached alongside the resolved path, so `parser` is
+    only called again if the resource is invalidated or revalidation finds
+    that it changed.
+
+    Args:
+        res_name(str): a resource path/name, as for resolve_resource_file()
+        parser(callable): called with the resolved path, returns the contents
+        data_dir(str, optional): overrides /opt/mycroft/res/
+    Returns:
+        the value returned by parser, or None if no resource found
+    """
+    return _resource_cache.read(res_name, parser, data_dir)
+
+
+def invalidate_resource_cache(res_name=None):
+    """Forget cached resources, so that they are looked up again.
 
-    # Now look for ~/.mycroft/res_name (in user folder)
-    filename = os.path.expanduser("~/.mycroft/" + res_name)
-    if os.path.isfile(filename):
-        return filename
+    The resource bundles read so far are forgotten too, whichever resource
+    is given, so that new overrides and rebuilt bundles are picked up.
 
-    # Next look for /opt/mycroft/res/res_name
-    data_dir = data_dir or os.path.expanduser("/opt/mycroft/res/")
-    filename = os.path.expanduser(os.path.join(data_dir, res_name))
-    if os.path.isfile(filename):
-        return filename
+    Args:
+        res_name(str, optional): the resource to forget. All are forgotten
+                                 if omitted.
+    """
+    # Imported here, as lingua_franca.bundle imports this module
+    from lingua_franca.bundle import unload_bundles
+
+    _resource_cache.invalidate(res_name)
+    unload_bundles()
+    _result_cache.clear()
+
+
+def get_resource_cache_stats():
+    """
+    Returns:
+        dict: {"entries": int, "hits": int, "misses": int, "reloads": int},
+              where reloads counts entries found stale on revalidation
+    """
+    return _resource_cache.stats()
+
+
+class _ResultCache:
+    """ LRU cache of the results of functions decorated with
+        @localized_function(cache_results=True)
+
+    Off unless `config.result_cache_size` is more than 0. Entries are keyed
+    by function, language and arguments, and are dropped after
+    `config.result_cache_ttl` seconds, if set. Results are copied in and
+    out, so callers may modify what they get.
+
+    Functions taking an anchor date, such as extract_datetime(), are always
+    called with one: now_local() stands in for None, so a relative date is
+    never served from the cache after it has gone stale. A result is shared
+    across all anchors in the same day, hour or minute when the function
+    gives the same result at both ends of it. Otherwise, it is cached for
+    that exact anchor only. A span found to give another result is not
+    probed again for the same arguments until the anchor leaves it.
+    """
+
+    # Spans of anchor dates over which a result may be shared, widest first,
+    # as the fields replaced to get the start of the span, and its length
+    _ANCHOR_SPANS = (("day", {"hour": 0, "minute": 0, "second": 0,
+                              "microsecond": 0}, timedelta(days=1)),
+                     ("hour", {"minute": 0, "second": 0, "microsecond": 0},
+                      timedelta(hours=1)),
+                     ("minute", {"second": 0, "microsecond": 0},
+                      timedelta(minutes=1)))
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        # The start of the last span of each length in _ANCHOR_SPANS found
+        # to give another result than its anchor, by arguments
+        self._failed = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by clear(), so that results computed across a change to
+        # the loaded languages are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.probes = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key, value, generation):
+        ttl = config.result_cache_ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (expires, deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(config.result_cache_size, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _with_anchor(sig, args, kwargs, anchor_param, anchor):
+        """ The arguments of a call, with the anchor passed positionally,
+            as some languages name the parameter differently """
+        params = list(sig.parameters.values())
+        index = [param.name for param in params].index(anchor_param)
+        kwargs = dict(kwargs)
+        kwargs.pop(anchor_param, None)
+        positional = list(args[:index])
+        for param in params[len(positional):index]:
+            positional.append(kwargs.pop(param.name, param.default))
+        return (*positional, anchor, *args[index + 1:]), kwargs
+
+    def _anchor_key(self, call, anchor, value, keys):
+        """ The widest span of anchors with the same result as `value` """
+        base = keys[-1][0]
+        failed = list(self._failed.get(base,
+                                       [None] * len(self._ANCHOR_SPANS)))
+        # the start of a day is that of its first hour and minute too
+        results = {anchor: value}
+
+        def same(probe):
+            if probe not in results:
+                results[probe] = self._probe(call, probe)
+            return results[probe] == value
+
+        found = keys[-1]
+        for index, (key, (_, _, length)) in enumerate(
+                zip(keys, self._ANCHOR_SPANS)):
+            start = key[2]
+            if start == failed[index]:
+                continue
+            if same(start) and same(start + length -
+                                    timedelta(microseconds=1)):
+                found = key
+                break
+            failed[index] = start
+        with self._lock:
+            self._failed[base] = failed
+            self._failed.move_to_end(base)
+            while len(self._failed) > max(config.result_cache_size, 0):
+                self._failed.popitem(last=False)
+        return found
+
+    def _probe(self, call, anchor):
+        self.probes += 1
+        try:
+            return call(anchor)
+        except Exception:
+            return _DISPATCH_MISS  # never equal to a result
+
+    def call(self, func, name, sig, args, kwargs, anchor_param=None):
+        """ func(*args, **kwargs), or its cached result
+
+        Arguments:
+            func (callable): the function
+            name (tuple): identifies the function
+            sig (inspect.Signature): the signature of the function
+            args (tuple): positional arguments
+            kwargs (dict): keyword arguments
+            anchor_param (str, optional): the parameter holding the anchor
+                                          date, if any
+        """
+        try:
+            bound = sig.bind(*args, **kwargs)
+        except TypeError:
+            # Arguments the function does not take, which the uncached call
+            # ignores or reports itself
+            return func(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments['lang'] = arguments.get('lang') or get_default_lang()
+        anchor = None
+        if anchor_param:
+            anchor = arguments.pop(anchor_param) or now_local()
+            if not isinstance(anchor, datetime):
+                # e.g. the language passed in the anchor's place, which the
+                # uncached call still understands
+                return func(*args, **kwargs)
+            if config.inject_timezones and anchor.tzinfo is None:
+                anchor = to_local(anchor)
+
+        def call(anchor):
+            if not anchor_param:
+                return func(*args, **kwargs)
+            call_args, call_kwargs = self._with_anchor(sig, args, kwargs,
+                                                       anchor_param, anchor)
+            return func(*call_args, **call_kwargs)
+
+        base = (name, tuple(arguments.items()))
+        try:
+            hash(base)
+        except TypeError:
+            return call(anchor)
+        if anchor_param:
+            keys = [(base, span, anchor.replace(**fields))
+                    for span, fields, _ in self._ANCHOR_SPANS]
+            keys.append((base, None, anchor))
+        else:
+            keys = [base]
+
+        for key in keys:
+            entry = self._get(key)
+            if entry is not None:
+                self.hits += 1
+                return deepcopy(entry[1])
+        self.misses += 1
+        generation = self._generation
+        value = call(anchor)
+        key = keys[-1]
+        if anchor_param:
+            key = self._anchor_key(call, anchor, value, keys)
+        self._put(key, value, generation)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._failed.clear()
+
+    def stats(self):
+        return {"entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "probes": self.probes}
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+        self.expirations = self.probes = 0
+
+
+_result_cache = _ResultCache()
+
+
+def clear_result_cache():
+    """ Forget all the results cached under `config.result_cache_size` """
+    _result_cache.clear()
+
+
+def get_result_cache_stats():
+    """
+    Returns:
+        dict: {"entries": int, "hits": int, "misses": int, "evictions": int,
+               "expirations": int, "probes": int}, where expirations counts
+              entries older than `config.result_cache_ttl`, and probes the
+              extra calls made to find how widely a result depending on an
+              anchor date may be shared
+    """
+    return _result_cache.stats()
 
-    # Finally look for it in the source package
-    filename = os.path.join(os.path.dirname(__file__), 'res', res_name)
-    filename = os.path.abspath(os.path.normpath(filename))
-    if os.path.isfile(filename):
-        return filename
 
-    return None  # Resource cannot be resolved
+def reset_result_cache_stats():
+    """ Zero the counters reported by get_result_cache_stats() """
+    _result_cache.reset_stats()
 
 
 def lookup_variant(mappings, key="variant"):
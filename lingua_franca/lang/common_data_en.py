@@ -295,3 +295,32 @@ _SPOKEN_EXTRA_NUM_EN = {
         }
 _STRING_SHORT_ORDINAL_EN = invert_dict(_SHORT_ORDINAL_EN)
 _STRING_LONG_ORDINAL_EN = invert_dict(_LONG_ORDINAL_EN)
+
+# words read by extract_datetime_en
+_WEEKDAYS_EN = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday',
+                'saturday', 'sunday')
+_MONTHS_EN = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+              'august', 'september', 'october', 'november', 'december')
+_MONTHS_SHORT_EN = ('jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                    'sept', 'oct', 'nov', 'dec')
+_TIME_QUALIFIERS_AM_EN = frozenset(['morning'])
+_TIME_QUALIFIERS_PM_EN = frozenset(['afternoon', 'evening', 'night',
+                                    'tonight'])
+# words that may come before a date or time, and are consumed with it
+_DATETIME_MARKERS_EN = frozenset(['at', 'in', 'on', 'by', 'this', 'around',
+                                  'for', 'of', 'within'])
+# "7 on mondays", "3 this friday"
+_RECUR_MARKERS_EN = frozenset(_WEEKDAYS_EN + tuple(d + 's' for d in
+                                                    _WEEKDAYS_EN) +
+                              ('weekend', 'weekday', 'weekends', 'weekdays'))
+# years in one of each, as in "2 decades" or "a century"
+_YEAR_MULTIPLES_EN = {'decade': 10, 'century': 100, 'millennium': 1000}
+# day offset by phrase
+_RELATIVE_DAYS_EN = {
+    ('today',): 0,
+    ('tomorrow',): 1,
+    ('day', 'before', 'yesterday'): -2,
+    ('before', 'yesterday'): -2,
+    ('yesterday',): -1,
+    ('day', 'after', 'tomorrow'): 2
+}
@@ -45,3 +45,29 @@ def convert_to_mixed_fraction(number, denominators=range(1, 21)):
         return None
 
     return int_number, int(round(numerator)), denominator
+
+
+class ChunkTable(dict):
+    """
+    The pronunciations of the numbers 0 to size - 1, computed once, which the
+    pronounce_number functions put larger numbers together from.
+
+    A number which pronounce() fails on is left out, so that looking it up
+    calls pronounce() again, and fails the way it always did.
+
+    Args:
+        pronounce (function): pronounce(n) -> str
+        size (int): the numbers to pronounce
+    """
+
+    def __init__(self, pronounce, size=1000):
+        super().__init__()
+        self._pronounce = pronounce
+        for n in range(size):
+            try:
+                self[n] = pronounce(n)
+            except Exception:
+                pass  # raised again by __missing__()
+
+    def __missing__(self, n):
+        return self._pronounce(n)
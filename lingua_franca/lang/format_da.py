@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_da import _EXTRA_SPACE_DA, \
     _FRACTION_STRING_DA, _MONTHS_DA, _NUM_POWERS_OF_TEN, _NUM_STRING_DA
 from math import floor
@@ -59,6 +60,82 @@ def nice_number_da(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _pronounce_triplet_da(num):
+    result = ""
+    num = floor(num)
+    if num > 99:
+        hundreds = floor(num / 100)
+        if hundreds > 0:
+            if hundreds == 1:
+                result += 'et' + 'hundrede' + _EXTRA_SPACE_DA
+            else:
+                result += _NUM_STRING_DA[hundreds] + \
+                    'hundrede' + _EXTRA_SPACE_DA
+                num -= hundreds * 100
+    if num == 0:
+        result += ''  # do nothing
+    elif num == 1:
+        result += 'et'
+    elif num <= 20:
+        result += _NUM_STRING_DA[num] + _EXTRA_SPACE_DA
+    elif num > 20:
+        ones = num % 10
+        tens = num - ones
+        if ones > 0:
+            result += _NUM_STRING_DA[ones] + _EXTRA_SPACE_DA
+            if tens > 0:
+                result += 'og' + _EXTRA_SPACE_DA
+        if tens > 0:
+            result += _NUM_STRING_DA[tens] + _EXTRA_SPACE_DA
+
+    return result
+
+
+# What whole numbers are put together from, built once: every triplet of
+# digits, pronounced, and what follows a triplet of one, or of more, at
+# each scale level (thousands, millions, ...)
+_TRIPLETS_DA = ChunkTable(_pronounce_triplet_da)
+_ONE_AT_SCALE_DA = ("en", 'et' + _EXTRA_SPACE_DA + 'tusinde' +
+                    _EXTRA_SPACE_DA) + tuple(
+    "en " + power + ' ' for power in _NUM_POWERS_OF_TEN[2:])
+_SCALES_DA = ('', 'tusinde' + _EXTRA_SPACE_DA) + tuple(
+    "og" + _NUM_POWERS_OF_TEN[scale_level] +
+    ("er" if scale_level % 2 == 0 else "") +  # MillionER
+    "er "  # MilliardER, MillioneER
+    for scale_level in range(2, len(_NUM_POWERS_OF_TEN)))
+
+
+def _pronounce_fractional_da(num, places):
+    # fixed number of places even with trailing zeros
+    result = ""
+    place = 10
+    while places > 0:
+        # doesn't work with 1.0001 and places = 2: int(
+        # number*place) % 10 > 0 and places > 0:
+        result += " " + _NUM_STRING_DA[int(num * place) % 10]
+        place *= 10
+        places -= 1
+    return result
+
+
+def _pronounce_whole_number_da(num):
+    num = floor(num)
+    result = ''
+    scale_level = 0
+    while num:
+        last_triplet = num % 1000
+        if last_triplet == 1:
+            result = _ONE_AT_SCALE_DA[scale_level] + _EXTRA_SPACE_DA + result
+        elif last_triplet > 1:
+            result = _TRIPLETS_DA[last_triplet] + _SCALES_DA[scale_level] + \
+                _EXTRA_SPACE_DA + result
+        else:
+            result = _EXTRA_SPACE_DA + result
+        num = floor(num / 1000)
+        scale_level += 1
+    return result
+
+
 def pronounce_number_da(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -79,82 +156,6 @@ def pronounce_number_da(number, places=2, short_scale=True, scientific=False,
     # TODO short_scale, scientific and ordinals
     # currently ignored
 
-    def pronounce_triplet_da(num):
-        result = ""
-        num = floor(num)
-        if num > 99:
-            hundreds = floor(num / 100)
-            if hundreds > 0:
-                if hundreds == 1:
-                    result += 'et' + 'hundrede' + _EXTRA_SPACE_DA
-                else:
-                    result += _NUM_STRING_DA[hundreds] + \
-                        'hundrede' + _EXTRA_SPACE_DA
-                    num -= hundreds * 100
-        if num == 0:
-            result += ''  # do nothing
-        elif num == 1:
-            result += 'et'
-        elif num <= 20:
-            result += _NUM_STRING_DA[num] + _EXTRA_SPACE_DA
-        elif num > 20:
-            ones = num % 10
-            tens = num - ones
-            if ones > 0:
-                result += _NUM_STRING_DA[ones] + _EXTRA_SPACE_DA
-                if tens > 0:
-                    result += 'og' + _EXTRA_SPACE_DA
-            if tens > 0:
-                result += _NUM_STRING_DA[tens] + _EXTRA_SPACE_DA
-
-        return result
-
-    def pronounce_fractional_da(num, places):
-        # fixed number of places even with trailing zeros
-        result = ""
-        place = 10
-        while places > 0:
-            # doesn't work with 1.0001 and places = 2: int(
-            # number*place) % 10 > 0 and places > 0:
-            result += " " + _NUM_STRING_DA[int(num * place) % 10]
-            place *= 10
-            places -= 1
-        return result
-
-    def pronounce_whole_number_da(num, scale_level=0):
-        if num == 0:
-            return ''
-
-        num = floor(num)
-        result = ''
-        last_triplet = num % 1000
-
-        if last_triplet == 1:
-            if scale_level == 0:
-                if result != '':
-                    result += '' + 'et'
-                else:
-                    result += "en"
-            elif scale_level == 1:
-                result += 'et' + _EXTRA_SPACE_DA + 'tusinde' + _EXTRA_SPACE_DA
-            else:
-                result += "en " + _NUM_POWERS_OF_TEN[scale_level] + ' '
-        elif last_triplet > 1:
-            result += pronounce_triplet_da(last_triplet)
-            if scale_level == 1:
-                result += 'tusinde' + _EXTRA_SPACE_DA
-            if scale_level >= 2:
-                result += "og" + _NUM_POWERS_OF_TEN[scale_level]
-            if scale_level >= 2:
-                if scale_level % 2 == 0:
-                    result += "er"  # MillionER
-                result += "er "  # MilliardER, MillioneER
-
-        num = floor(num / 1000)
-        scale_level += 1
-        return pronounce_whole_number_da(num,
-                                         scale_level) + result + _EXTRA_SPACE_DA
-
     result = ""
     if abs(number) >= 1000000000000000000000000:  # cannot do more than this
         return str(number)
@@ -164,14 +165,14 @@ def pronounce_number_da(number, places=2, short_scale=True, scientific=False,
         return "minus " + pronounce_number_da(abs(number), places)
     else:
         if number == int(number):
-            return pronounce_whole_number_da(number)
+            return _pronounce_whole_number_da(number)
         else:
             whole_number_part = floor(number)
             fractional_part = number - whole_number_part
-            result += pronounce_whole_number_da(whole_number_part)
+            result += _pronounce_whole_number_da(whole_number_part)
             if places > 0:
                 result += " komma"
-                result += pronounce_fractional_da(fractional_part, places)
+                result += _pronounce_fractional_da(fractional_part, places)
             return result
 
 
@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_de import _EXTRA_SPACE_DE, \
     _FRACTION_STRING_DE, _MONTHS_DE, _NUM_POWERS_OF_TEN_DE, _NUM_STRING_DE
 from math import floor
@@ -58,6 +59,79 @@ def nice_number_de(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _pronounce_triplet_de(num):
+    result = ""
+    num = floor(num)
+    if num > 99:
+        hundreds = floor(num / 100)
+        if hundreds > 0:
+            result += _NUM_STRING_DE[
+                hundreds] + _EXTRA_SPACE_DE + 'hundert' + _EXTRA_SPACE_DE
+            num -= hundreds * 100
+    if num == 0:
+        result += ''  # do nothing
+    elif num == 1:
+        result += 'eins'  # need the s for the last digit
+    elif num <= 20:
+        result += _NUM_STRING_DE[num]  # + _EXTRA_SPACE_DA
+    elif num > 20:
+        ones = num % 10
+        tens = num - ones
+        if ones > 0:
+            result += _NUM_STRING_DE[ones] + _EXTRA_SPACE_DE
+            if tens > 0:
+                result += 'und' + _EXTRA_SPACE_DE
+        if tens > 0:
+            result += _NUM_STRING_DE[tens] + _EXTRA_SPACE_DE
+    return result
+
+
+# What whole numbers are put together from, built once: every triplet of
+# digits, pronounced, and what follows a triplet of one, or of more, at
+# each scale level (thousands, millions, ...)
+_TRIPLETS_DE = ChunkTable(_pronounce_triplet_de)
+_ONE_AT_SCALE_DE = ("eins", 'ein' + _EXTRA_SPACE_DE + 'tausend' +
+                    _EXTRA_SPACE_DE) + tuple(
+    "eine " + power + ' ' for power in _NUM_POWERS_OF_TEN_DE[2:])
+_SCALES_DE = ('', 'tausend' + _EXTRA_SPACE_DE) + tuple(
+    " " + _NUM_POWERS_OF_TEN_DE[scale_level] +
+    ("e" if scale_level % 2 == 0 else "") +  # MillionE
+    "n "  # MilliardeN, MillioneN
+    for scale_level in range(2, len(_NUM_POWERS_OF_TEN_DE)))
+
+
+def _pronounce_fractional_de(num,
+                             places):  # fixed number of places even with
+    # trailing zeros
+    result = ""
+    place = 10
+    while places > 0:  # doesn't work with 1.0001 and places = 2: int(
+        # number*place) % 10 > 0 and places > 0:
+        result += " " + _NUM_STRING_DE[int(num * place) % 10]
+        if int(num * place) % 10 == 1:
+            result += 's'  # "1" is pronounced "eins" after the decimal
+            # point
+        place *= 10
+        places -= 1
+    return result
+
+
+def _pronounce_whole_number_de(num):
+    num = floor(num)
+    result = ''
+    scale_level = 0
+    while num:
+        last_triplet = num % 1000
+        if last_triplet == 1:
+            result = _ONE_AT_SCALE_DE[scale_level] + result
+        elif last_triplet > 1:
+            result = _TRIPLETS_DE[last_triplet] + _SCALES_DE[scale_level] + \
+                result
+        num = floor(num / 1000)
+        scale_level += 1
+    return result
+
+
 def pronounce_number_de(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -79,84 +153,6 @@ def pronounce_number_de(number, places=2, short_scale=True, scientific=False,
     # TODO short_scale, scientific and ordinals
     # currently ignored
 
-    def pronounce_triplet_de(num):
-        result = ""
-        num = floor(num)
-        if num > 99:
-            hundreds = floor(num / 100)
-            if hundreds > 0:
-                result += _NUM_STRING_DE[
-                    hundreds] + _EXTRA_SPACE_DE + 'hundert' + _EXTRA_SPACE_DE
-                num -= hundreds * 100
-        if num == 0:
-            result += ''  # do nothing
-        elif num == 1:
-            result += 'eins'  # need the s for the last digit
-        elif num <= 20:
-            result += _NUM_STRING_DE[num]  # + _EXTRA_SPACE_DA
-        elif num > 20:
-            ones = num % 10
-            tens = num - ones
-            if ones > 0:
-                result += _NUM_STRING_DE[ones] + _EXTRA_SPACE_DE
-                if tens > 0:
-                    result += 'und' + _EXTRA_SPACE_DE
-            if tens > 0:
-                result += _NUM_STRING_DE[tens] + _EXTRA_SPACE_DE
-        return result
-
-    def pronounce_fractional_de(num,
-                                places):  # fixed number of places even with
-        # trailing zeros
-        result = ""
-        place = 10
-        while places > 0:  # doesn't work with 1.0001 and places = 2: int(
-            # number*place) % 10 > 0 and places > 0:
-            result += " " + _NUM_STRING_DE[int(num * place) % 10]
-            if int(num * place) % 10 == 1:
-                result += 's'  # "1" is pronounced "eins" after the decimal
-                # point
-            place *= 10
-            places -= 1
-        return result
-
-    def pronounce_whole_number_de(num, scale_level=0):
-        if num == 0:
-            return ''
-
-        num = floor(num)
-        result = ''
-        last_triplet = num % 1000
-
-        if last_triplet == 1:
-            if scale_level == 0:
-                if result != '':
-                    result += '' + 'eins'
-                else:
-                    result += "eins"
-            elif scale_level == 1:
-                result += 'ein' + _EXTRA_SPACE_DE + 'tausend' + _EXTRA_SPACE_DE
-            else:
-                result += "eine " + _NUM_POWERS_OF_TEN_DE[scale_level] + ' '
-        elif last_triplet > 1:
-            result += pronounce_triplet_de(last_triplet)
-            if scale_level == 1:
-                # result += _EXTRA_SPACE_DA
-                result += 'tausend' + _EXTRA_SPACE_DE
-            if scale_level >= 2:
-                # if _EXTRA_SPACE_DA == '':
-                #    result += " "
-                result += " " + _NUM_POWERS_OF_TEN_DE[scale_level]
-            if scale_level >= 2:
-                if scale_level % 2 == 0:
-                    result += "e"  # MillionE
-                result += "n "  # MilliardeN, MillioneN
-
-        num = floor(num / 1000)
-        scale_level += 1
-        return pronounce_whole_number_de(num,
-                                         scale_level) + result  # + _EXTRA_SPACE_DA
-
     result = ""
     if abs(number) >= 1000000000000000000000000:  # cannot do more than this
         return str(number)
@@ -166,14 +162,14 @@ def pronounce_number_de(number, places=2, short_scale=True, scientific=False,
         return "minus " + pronounce_number_de(abs(number), places)
     else:
         if number == int(number):
-            return pronounce_whole_number_de(number)
+            return _pronounce_whole_number_de(number)
         else:
             whole_number_part = floor(number)
             fractional_part = number - whole_number_part
-            result += pronounce_whole_number_de(whole_number_part)
+            result += _pronounce_whole_number_de(whole_number_part)
             if places > 0:
                 result += " Komma"
-                result += pronounce_fractional_de(fractional_part, places)
+                result += _pronounce_fractional_de(fractional_part, places)
             return result
 
 
@@ -15,7 +15,10 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from functools import partial
+
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_en import _NUM_STRING_EN, \
     _FRACTION_STRING_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, _LONG_ORDINAL_EN
 
@@ -65,6 +68,141 @@ def nice_number_en(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _number_names_en(scale):
+    number_names = _NUM_STRING_EN.copy()
+    number_names.update(scale)
+    return number_names
+
+
+# The names of numbers with the short and the long scale, and the names of
+# the scales, built once rather than on every call of pronounce_number_en()
+_NUMBER_NAMES_SHORT_EN = _number_names_en(_SHORT_SCALE_EN)
+_NUMBER_NAMES_LONG_EN = _number_names_en(_LONG_SCALE_EN)
+_DIGITS_EN = [_NUMBER_NAMES_SHORT_EN[n] for n in range(0, 20)]
+_TENS_EN = [_NUMBER_NAMES_SHORT_EN[n] for n in range(10, 100, 10)]
+_SHORT_HUNDREDS_EN = list(_SHORT_SCALE_EN.values())
+_LONG_HUNDREDS_EN = list(_LONG_SCALE_EN.values())
+_SHORT_SCALE_MAX_EN = max(_SHORT_SCALE_EN)
+_LONG_SCALE_MAX_EN = max(_LONG_SCALE_EN)
+
+
+def _sub_thousand_en(n, ordinals=False):
+    assert 0 <= n <= 999
+    if n in _SHORT_ORDINAL_EN and ordinals:
+        return _SHORT_ORDINAL_EN[n]
+    if n <= 19:
+        return _DIGITS_EN[n]
+    elif n <= 99:
+        q, r = divmod(n, 10)
+        return _TENS_EN[q - 1] + (" " + _sub_thousand_en(r, ordinals) if r
+                                  else "")
+    else:
+        q, r = divmod(n, 100)
+        return _DIGITS_EN[q] + " hundred" + (
+            " and " + _sub_thousand_en(r, ordinals) if r else "")
+
+
+# Every number under a thousand, pronounced, which larger numbers are
+# composed of: _SUB_THOUSAND_EN[ordinals][n]
+_SUB_THOUSAND_EN = (ChunkTable(_sub_thousand_en),
+                    ChunkTable(partial(_sub_thousand_en, ordinals=True)))
+
+
+def _split_by(n, split=1000):
+    assert 0 <= n
+    res = []
+    while n:
+        n, r = divmod(n, split)
+        res.append(r)
+    return res
+
+
+def _short_scale_en(n, ordinals):
+    if n >= _SHORT_SCALE_MAX_EN:
+        return "infinity"
+    ordi = ordinals
+
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000)):
+        if not z:
+            continue
+        number = _SUB_THOUSAND_EN[bool(not i and ordi)][z]
+
+        if i:
+            if i >= len(_SHORT_HUNDREDS_EN):
+                return ""
+            number += " "
+            if ordi:
+
+                if i * 1000 in _SHORT_ORDINAL_EN:
+                    if z == 1:
+                        number = _SHORT_ORDINAL_EN[i * 1000]
+                    else:
+                        number += _SHORT_ORDINAL_EN[i * 1000]
+                else:
+                    if n not in _SHORT_SCALE_EN:
+                        num = int("1" + "0" * (len(str(n)) - 2))
+
+                        number += _SHORT_SCALE_EN[num] + "th"
+                    else:
+                        number = _SHORT_SCALE_EN[n] + "th"
+            else:
+                number += _SHORT_HUNDREDS_EN[i]
+        res.append(number)
+        ordi = False
+
+    return ", ".join(reversed(res))
+
+
+def _long_scale_en(n, places, scientific, ordinals):
+    if n >= _LONG_SCALE_MAX_EN:
+        return "infinity"
+    ordi = ordinals
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000000)):
+        if not z:
+            continue
+        number = pronounce_number_en(z, places, True, scientific,
+                                     ordinals=ordi and not i)
+        # strip off the comma after the thousand
+        if i:
+            if i >= len(_LONG_HUNDREDS_EN):
+                return ""
+            # plus one as we skip 'thousand'
+            # (and 'hundred', but this is excluded by index value)
+            number = number.replace(',', '')
+
+            if ordi:
+                if i * 1000000 in _LONG_ORDINAL_EN:
+                    if z == 1:
+                        number = _LONG_ORDINAL_EN[
+                            (i + 1) * 1000000]
+                    else:
+                        number += _LONG_ORDINAL_EN[
+                            (i + 1) * 1000000]
+                else:
+                    if n not in _LONG_SCALE_EN:
+                        num = int("1" + "0" * (len(str(n)) - 2))
+
+                        number += " " + _LONG_SCALE_EN[
+                            num] + "th"
+                    else:
+                        number = " " + _LONG_SCALE_EN[n] + "th"
+            else:
+
+                number += " " + _LONG_HUNDREDS_EN[i + 1]
+        res.append(number)
+    return ", ".join(reversed(res))
+
+
 def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -112,21 +250,8 @@ def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
                     'negative ' if power < 0 else '',
                     pronounce_number_en(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_EN.copy()
-        number_names.update(_SHORT_SCALE_EN)
-    else:
-        number_names = _NUM_STRING_EN.copy()
-        number_names.update(_LONG_SCALE_EN)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_EN[n] for n in _SHORT_SCALE_EN.keys()]
-    else:
-        hundreds = [_LONG_SCALE_EN[n] for n in _LONG_SCALE_EN.keys()]
+    number_names = _NUMBER_NAMES_SHORT_EN if short_scale \
+        else _NUMBER_NAMES_LONG_EN
 
     # deal with negatives
     result = ""
@@ -175,117 +300,10 @@ def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
             result += "one "
         result += number_names[num]
     else:
-        def _sub_thousand(n, ordinals=False):
-            assert 0 <= n <= 999
-            if n in _SHORT_ORDINAL_EN and ordinals:
-                return _SHORT_ORDINAL_EN[n]
-            if n <= 19:
-                return digits[n]
-            elif n <= 99:
-                q, r = divmod(n, 10)
-                return tens[q - 1] + (" " + _sub_thousand(r, ordinals) if r
-                                      else "")
-            else:
-                q, r = divmod(n, 100)
-                return digits[q] + " hundred" + (
-                    " and " + _sub_thousand(r, ordinals) if r else "")
-
-        def _short_scale(n):
-            if n >= max(_SHORT_SCALE_EN.keys()):
-                return "infinity"
-            ordi = ordinals
-
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000)):
-                if not z:
-                    continue
-                number = _sub_thousand(z, not i and ordi)
-
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    number += " "
-                    if ordi:
-
-                        if i * 1000 in _SHORT_ORDINAL_EN:
-                            if z == 1:
-                                number = _SHORT_ORDINAL_EN[i * 1000]
-                            else:
-                                number += _SHORT_ORDINAL_EN[i * 1000]
-                        else:
-                            if n not in _SHORT_SCALE_EN:
-                                num = int("1" + "0" * (len(str(n)) - 2))
-
-                                number += _SHORT_SCALE_EN[num] + "th"
-                            else:
-                                number = _SHORT_SCALE_EN[n] + "th"
-                    else:
-                        number += hundreds[i]
-                res.append(number)
-                ordi = False
-
-            return ", ".join(reversed(res))
-
-        def _split_by(n, split=1000):
-            assert 0 <= n
-            res = []
-            while n:
-                n, r = divmod(n, split)
-                res.append(r)
-            return res
-
-        def _long_scale(n):
-            if n >= max(_LONG_SCALE_EN.keys()):
-                return "infinity"
-            ordi = ordinals
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000000)):
-                if not z:
-                    continue
-                number = pronounce_number_en(z, places, True, scientific,
-                                             ordinals=ordi and not i)
-                # strip off the comma after the thousand
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    # plus one as we skip 'thousand'
-                    # (and 'hundred', but this is excluded by index value)
-                    number = number.replace(',', '')
-
-                    if ordi:
-                        if i * 1000000 in _LONG_ORDINAL_EN:
-                            if z == 1:
-                                number = _LONG_ORDINAL_EN[
-                                    (i + 1) * 1000000]
-                            else:
-                                number += _LONG_ORDINAL_EN[
-                                    (i + 1) * 1000000]
-                        else:
-                            if n not in _LONG_SCALE_EN:
-                                num = int("1" + "0" * (len(str(n)) - 2))
-
-                                number += " " + _LONG_SCALE_EN[
-                                    num] + "th"
-                            else:
-                                number = " " + _LONG_SCALE_EN[n] + "th"
-                    else:
-
-                        number += " " + hundreds[i + 1]
-                res.append(number)
-            return ", ".join(reversed(res))
-
         if short_scale:
-            result += _short_scale(num)
+            result += _short_scale_en(num, ordinals)
         else:
-            result += _long_scale(num)
+            result += _long_scale_en(num, places, scientific, ordinals)
 
     # deal with scientific notation unpronounceable as number
     if not result and "e" in str(num):
@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_hu import _NUM_POWERS_OF_TEN, \
     _EXTRA_SPACE_HU, _FRACTION_STRING_HU, _MONTHS_HU, _NUM_STRING_HU
 from math import floor
@@ -74,6 +75,73 @@ def nice_number_hu(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _pronounce_triplet_hu(num):
+    result = ""
+    num = floor(num)
+    if num > 99:
+        hundreds = floor(num / 100)
+        if hundreds > 0:
+            hundredConst = _EXTRA_SPACE_HU + 'száz' + _EXTRA_SPACE_HU
+            if hundreds == 1:
+                result += hundredConst
+            elif hundreds == 2:
+                result += 'két' + hundredConst
+            else:
+                result += _NUM_STRING_HU[hundreds] + hundredConst
+            num -= hundreds * 100
+    if num == 0:
+        result += ''  # do nothing
+    elif num <= 20:
+        result += _NUM_STRING_HU[num]  # + _EXTRA_SPACE_DA
+    elif num > 20:
+        ones = num % 10
+        tens = num - ones
+        if tens > 0:
+            if tens != 20:
+                result += _NUM_STRING_HU[tens] + _EXTRA_SPACE_HU
+            else:
+                result += "huszon" + _EXTRA_SPACE_HU
+        if ones > 0:
+            result += _NUM_STRING_HU[ones] + _EXTRA_SPACE_HU
+    return result
+
+
+def _pronounce_scaled_triplet_hu(num):
+    # before a scale, two is "két"
+    return _pronounce_triplet_hu(num).replace(_NUM_STRING_HU[2], 'két')
+
+
+# What whole numbers are put together from, built once: every triplet of
+# digits, pronounced on its own and before a scale, and what follows a
+# triplet of one, or of more, at each scale level (thousands, millions, ...)
+_TRIPLETS_HU = ChunkTable(_pronounce_triplet_hu)
+_SCALED_TRIPLETS_HU = ChunkTable(_pronounce_scaled_triplet_hu)
+_ONE_AT_SCALE_HU = ("egy", _EXTRA_SPACE_HU + _NUM_POWERS_OF_TEN[1] +
+                    _EXTRA_SPACE_HU) + tuple(
+    "egy" + power for power in _NUM_POWERS_OF_TEN[2:])
+_SCALES_HU = ('', _NUM_POWERS_OF_TEN[1] + _EXTRA_SPACE_HU + '-') + tuple(
+    power + '-' for power in _NUM_POWERS_OF_TEN[2:])
+
+
+def _pronounce_whole_number_hu(num):
+    num = floor(num)
+    result = ''
+    scale_level = 0
+    while num:
+        last_triplet = num % 1000
+        if last_triplet == 1:
+            result = _ONE_AT_SCALE_HU[scale_level] + result
+        elif last_triplet > 1:
+            if scale_level:
+                result = _SCALED_TRIPLETS_HU[last_triplet] + \
+                    _SCALES_HU[scale_level] + result
+            else:
+                result = _TRIPLETS_HU[last_triplet]
+        num = floor(num / 1000)
+        scale_level += 1
+    return result
+
+
 def pronounce_number_hu(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -94,71 +162,6 @@ def pronounce_number_hu(number, places=2, short_scale=True, scientific=False,
     # TODO short_scale, scientific and ordinals
     # currently ignored
 
-    def pronounce_triplet_hu(num):
-        result = ""
-        num = floor(num)
-        if num > 99:
-            hundreds = floor(num / 100)
-            if hundreds > 0:
-                hundredConst = _EXTRA_SPACE_HU + 'száz' + _EXTRA_SPACE_HU
-                if hundreds == 1:
-                    result += hundredConst
-                elif hundreds == 2:
-                    result += 'két' + hundredConst
-                else:
-                    result += _NUM_STRING_HU[hundreds] + hundredConst
-                num -= hundreds * 100
-        if num == 0:
-            result += ''  # do nothing
-        elif num <= 20:
-            result += _NUM_STRING_HU[num]  # + _EXTRA_SPACE_DA
-        elif num > 20:
-            ones = num % 10
-            tens = num - ones
-            if tens > 0:
-                if tens != 20:
-                    result += _NUM_STRING_HU[tens] + _EXTRA_SPACE_HU
-                else:
-                    result += "huszon" + _EXTRA_SPACE_HU
-            if ones > 0:
-                result += _NUM_STRING_HU[ones] + _EXTRA_SPACE_HU
-        return result
-
-    def pronounce_whole_number_hu(num, scale_level=0):
-        if num == 0:
-            return ''
-
-        num = floor(num)
-        result = ''
-        last_triplet = num % 1000
-
-        if last_triplet == 1:
-            if scale_level == 0:
-                if result != '':
-                    result += '' + "egy"
-                else:
-                    result += "egy"
-            elif scale_level == 1:
-                result += _EXTRA_SPACE_HU + \
-                    _NUM_POWERS_OF_TEN[1] + _EXTRA_SPACE_HU
-            else:
-                result += "egy" + _NUM_POWERS_OF_TEN[scale_level]
-        elif last_triplet > 1:
-            result += pronounce_triplet_hu(last_triplet)
-            if scale_level != 0:
-                result = result.replace(_NUM_STRING_HU[2], 'két')
-            if scale_level == 1:
-                result += _NUM_POWERS_OF_TEN[1] + _EXTRA_SPACE_HU
-            if scale_level >= 2:
-                result += _NUM_POWERS_OF_TEN[scale_level]
-            if scale_level > 0:
-                result += '-'
-
-        num = floor(num / 1000)
-        scale_level += 1
-        return pronounce_whole_number_hu(num,
-                                         scale_level) + result
-
     result = ""
     if abs(number) >= 1000000000000000000000000:  # cannot do more than this
         return str(number)
@@ -168,16 +171,16 @@ def pronounce_number_hu(number, places=2, short_scale=True, scientific=False,
         return "mínusz " + pronounce_number_hu(abs(number), places)
     else:
         if number == int(number):
-            return pronounce_whole_number_hu(number).strip('-')
+            return _pronounce_whole_number_hu(number).strip('-')
         else:
             whole_number_part = floor(number)
             fractional_part = number - whole_number_part
             if whole_number_part == 0:
                 result += _NUM_STRING_HU[0]
-            result += pronounce_whole_number_hu(whole_number_part)
+            result += _pronounce_whole_number_hu(whole_number_part)
             if places > 0:
                 result += " egész "
-                fraction = pronounce_whole_number_hu(
+                fraction = _pronounce_whole_number_hu(
                     round(fractional_part * 10 ** places))
                 result += fraction.replace(_NUM_STRING_HU[2], 'két')
                 fraction_suffixes = [
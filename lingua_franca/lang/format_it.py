@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_it import _NUM_STRING_IT, \
     _FRACTION_STRING_IT, _LONG_SCALE_IT, _SHORT_SCALE_IT
 
@@ -76,6 +77,51 @@ def nice_number_it(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _number_names_it(scale):
+    number_names = _NUM_STRING_IT.copy()
+    number_names.update(scale)
+    return number_names
+
+
+_NUMBER_NAMES_SHORT_IT = _number_names_it(_SHORT_SCALE_IT)
+_NUMBER_NAMES_LONG_IT = _number_names_it(_LONG_SCALE_IT)
+_DIGITS_IT = [_NUM_STRING_IT[n] for n in range(0, 20)]
+_TENS_IT = [_NUM_STRING_IT[n] for n in range(10, 100, 10)]
+_SHORT_HUNDREDS_IT = list(_SHORT_SCALE_IT.values())
+_LONG_HUNDREDS_IT = list(_LONG_SCALE_IT.values())
+_SHORT_SCALE_MAX_IT = max(_SHORT_SCALE_IT.keys())
+_LONG_SCALE_MAX_IT = max(_LONG_SCALE_IT.keys())
+
+
+def _sub_thousand_it(n):
+    assert 0 <= n <= 999
+    if n <= 19:
+        return _DIGITS_IT[n]
+    elif n <= 99:
+        q, r = divmod(n, 10)
+        _deci = _TENS_IT[q-1]
+        _unit = r
+        _partial = _deci
+        if _unit > 0:
+            if _unit == 1 or _unit == 8:
+                _partial = _partial[:-1]  # ventuno  ventotto
+            _partial += _NUM_STRING_IT[_unit]
+        return _partial
+    else:
+        q, r = divmod(n, 100)
+        if q == 1:
+            _partial = "cento"
+        else:
+            _partial = _DIGITS_IT[q] + "cento"
+        _partial += (
+            " " + _sub_thousand_it(r) if r else "")  # separa centinaia
+        return _partial
+
+
+# every group of three digits, pronounced once
+_SUB_THOUSAND_IT = ChunkTable(_sub_thousand_it)
+
+
 def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
     """
     Convert a number to it's spoken equivalent
@@ -111,20 +157,11 @@ def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
                 pronounce_number_it(abs(power), places, short_scale, False))
 
     if short_scale:
-        number_names = _NUM_STRING_IT.copy()
-        number_names.update(_SHORT_SCALE_IT)
+        number_names = _NUMBER_NAMES_SHORT_IT
+        hundreds = _SHORT_HUNDREDS_IT
     else:
-        number_names = _NUM_STRING_IT.copy()
-        number_names.update(_LONG_SCALE_IT)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_IT[n] for n in _SHORT_SCALE_IT.keys()]
-    else:
-        hundreds = [_LONG_SCALE_IT[n] for n in _LONG_SCALE_IT.keys()]
+        number_names = _NUMBER_NAMES_LONG_IT
+        hundreds = _LONG_HUNDREDS_IT
 
     # deal with negatives
     result = ""
@@ -138,32 +175,8 @@ def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
             result += ""  # inizio stringa
         result += number_names[num]
     else:
-        def _sub_thousand(n):
-            assert 0 <= n <= 999
-            if n <= 19:
-                return digits[n]
-            elif n <= 99:
-                q, r = divmod(n, 10)
-                _deci = tens[q-1]
-                _unit = r
-                _partial = _deci
-                if _unit > 0:
-                    if _unit == 1 or _unit == 8:
-                        _partial = _partial[:-1]  # ventuno  ventotto
-                    _partial += number_names[_unit]
-                return _partial
-            else:
-                q, r = divmod(n, 100)
-                if q == 1:
-                    _partial = "cento"
-                else:
-                    _partial = digits[q] + "cento"
-                _partial += (
-                    " " + _sub_thousand(r) if r else "")  # separa centinaia
-                return _partial
-
         def _short_scale(n):
-            if n >= max(_SHORT_SCALE_IT.keys()):
+            if n >= _SHORT_SCALE_MAX_IT:
                 return "numero davvero enorme"
             n = int(n)
             assert 0 <= n
@@ -171,7 +184,7 @@ def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
             for i, z in enumerate(_split_by(n, 1000)):
                 if not z:
                     continue
-                number = _sub_thousand(z)
+                number = _SUB_THOUSAND_IT[z]
                 if i:
                     number += ""  # separa ordini grandezza
                     number += hundreds[i]
@@ -188,7 +201,7 @@ def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
             return res
 
         def _long_scale(n):
-            if n >= max(_LONG_SCALE_IT.keys()):
+            if n >= _LONG_SCALE_MAX_IT:
                 return "numero davvero enorme"
             n = int(n)
             assert 0 <= n
@@ -14,7 +14,7 @@
 # limitations under the License.
 #
 
-from .format_common import convert_to_mixed_fraction
+from .format_common import convert_to_mixed_fraction, ChunkTable
 from lingua_franca.lang.common_data_nl import _NUM_POWERS_OF_TEN, \
     _NUM_STRING_NL, _FRACTION_STRING_NL, _EXTRA_SPACE_NL, _MONTHS_NL
 from math import floor
@@ -58,6 +58,74 @@ def nice_number_nl(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _pronounce_triplet_nl(num):
+    result = ""
+    num = floor(num)
+    if num > 99:
+        hundreds = floor(num / 100)
+        if hundreds > 0:
+            result += _NUM_STRING_NL[
+                hundreds] + _EXTRA_SPACE_NL + 'honderd' + _EXTRA_SPACE_NL
+            num -= hundreds * 100
+    if num == 0:
+        result += ''  # do nothing
+    elif num <= 20:
+        result += _NUM_STRING_NL[num]  # + _EXTRA_SPACE_DA
+    elif num > 20:
+        ones = num % 10
+        tens = num - ones
+        if ones > 0:
+            result += _NUM_STRING_NL[ones] + _EXTRA_SPACE_NL
+            if tens > 0:
+                result += 'en' + _EXTRA_SPACE_NL
+        if tens > 0:
+            result += _NUM_STRING_NL[tens] + _EXTRA_SPACE_NL
+    return result
+
+
+# What whole numbers are put together from, built once: every triplet of
+# digits, pronounced, and what follows a triplet of one, or of more, at
+# each scale level (thousands, millions, ...)
+_TRIPLETS_NL = ChunkTable(_pronounce_triplet_nl)
+_ONE_AT_SCALE_NL = ("één", 'één' + _EXTRA_SPACE_NL + 'duizend' +
+                    _EXTRA_SPACE_NL) + tuple(
+    "één " + power + ' ' for power in _NUM_POWERS_OF_TEN[2:])
+_SCALES_NL = ('', 'duizend' + _EXTRA_SPACE_NL) + tuple(
+    " " + power + ' ' for power in _NUM_POWERS_OF_TEN[2:])
+
+
+def _pronounce_fractional_nl(num,
+                             places):  # fixed number of places even with
+    # trailing zeros
+    result = ""
+    place = 10
+    while places > 0:  # doesn't work with 1.0001 and places = 2: int(
+        # number*place) % 10 > 0 and places > 0:
+        result += " " + _NUM_STRING_NL[int(num * place) % 10]
+        if int(num * place) % 10 == 1:
+            result += ''  # "1" is pronounced "eins" after the decimal
+            # point
+        place *= 10
+        places -= 1
+    return result
+
+
+def _pronounce_whole_number_nl(num):
+    num = floor(num)
+    result = ''
+    scale_level = 0
+    while num:
+        last_triplet = num % 1000
+        if last_triplet == 1:
+            result = _ONE_AT_SCALE_NL[scale_level] + result
+        elif last_triplet > 1:
+            result = _TRIPLETS_NL[last_triplet] + _SCALES_NL[scale_level] + \
+                result
+        num = floor(num / 1000)
+        scale_level += 1
+    return result
+
+
 def pronounce_number_nl(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -78,82 +146,6 @@ def pronounce_number_nl(number, places=2, short_scale=True, scientific=False,
     # TODO short_scale, scientific and ordinals
     # currently ignored
 
-    def pronounce_triplet_nl(num):
-        result = ""
-        num = floor(num)
-        if num > 99:
-            hundreds = floor(num / 100)
-            if hundreds > 0:
-                result += _NUM_STRING_NL[
-                    hundreds] + _EXTRA_SPACE_NL + 'honderd' + _EXTRA_SPACE_NL
-                num -= hundreds * 100
-        if num == 0:
-            result += ''  # do nothing
-        elif num <= 20:
-            result += _NUM_STRING_NL[num]  # + _EXTRA_SPACE_DA
-        elif num > 20:
-            ones = num % 10
-            tens = num - ones
-            if ones > 0:
-                result += _NUM_STRING_NL[ones] + _EXTRA_SPACE_NL
-                if tens > 0:
-                    result += 'en' + _EXTRA_SPACE_NL
-            if tens > 0:
-                result += _NUM_STRING_NL[tens] + _EXTRA_SPACE_NL
-        return result
-
-    def pronounce_fractional_nl(num,
-                                places):  # fixed number of places even with
-        # trailing zeros
-        result = ""
-        place = 10
-        while places > 0:  # doesn't work with 1.0001 and places = 2: int(
-            # number*place) % 10 > 0 and places > 0:
-            result += " " + _NUM_STRING_NL[int(num * place) % 10]
-            if int(num * place) % 10 == 1:
-                result += ''  # "1" is pronounced "eins" after the decimal
-                # point
-            place *= 10
-            places -= 1
-        return result
-
-    def pronounce_whole_number_nl(num, scale_level=0):
-        if num == 0:
-            return ''
-
-        num = floor(num)
-        result = ''
-        last_triplet = num % 1000
-
-        if last_triplet == 1:
-            if scale_level == 0:
-                if result != '':
-                    result += '' + 'één'
-                else:
-                    result += "één"
-            elif scale_level == 1:
-                result += 'één' + _EXTRA_SPACE_NL + 'duizend' + _EXTRA_SPACE_NL
-            else:
-                result += "één " + _NUM_POWERS_OF_TEN[scale_level] + ' '
-        elif last_triplet > 1:
-            result += pronounce_triplet_nl(last_triplet)
-            if scale_level == 1:
-                # result += _EXTRA_SPACE_DA
-                result += 'duizend' + _EXTRA_SPACE_NL
-            if scale_level >= 2:
-                # if _EXTRA_SPACE_DA == '':
-                #    result += " "
-                result += " " + _NUM_POWERS_OF_TEN[scale_level] + ' '
-            if scale_level >= 2:
-                if scale_level % 2 == 0:
-                    result += ""  # Miljioen
-                result += ""  # Miljard, Miljoen
-
-        num = floor(num / 1000)
-        scale_level += 1
-        return pronounce_whole_number_nl(num,
-                                         scale_level) + result + ''
-
     result = ""
     if abs(number) >= 1000000000000000000000000:  # cannot do more than this
         return str(number)
@@ -163,14 +155,14 @@ def pronounce_number_nl(number, places=2, short_scale=True, scientific=False,
         return "min " + pronounce_number_nl(abs(number), places)
     else:
         if number == int(number):
-            return pronounce_whole_number_nl(number)
+            return _pronounce_whole_number_nl(number)
         else:
             whole_number_part = floor(number)
             fractional_part = number - whole_number_part
-            result += pronounce_whole_number_nl(whole_number_part)
+            result += _pronounce_whole_number_nl(whole_number_part)
             if places > 0:
                 result += " komma"
-                result += pronounce_fractional_nl(fractional_part, places)
+                result += _pronounce_fractional_nl(fractional_part, places)
             return result
 
 
@@ -15,7 +15,10 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from functools import lru_cache, partial
+
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _FRACTION_STRING_PL, _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _ALT_ORDINALS_PL
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -61,6 +64,130 @@ def nice_number_pl(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _number_names_pl():
+    number_names = _NUM_STRING_PL.copy()
+    number_names.update(_SHORT_SCALE_PL)
+    return number_names
+
+
+# The names of numbers and of the scale, built once rather than on every
+# call of pronounce_number_pl()
+_NUMBER_NAMES_PL = _number_names_pl()
+_DIGITS_PL = [_NUMBER_NAMES_PL[n] for n in range(0, 20)]
+_TENS_PL = [_NUMBER_NAMES_PL[n] for n in range(10, 100, 10)]
+_ORDINAL_TENS_PL = [_SHORT_ORDINAL_PL[n] for n in range(10, 100, 10)]
+_HUNDREDS_PL = list(_SHORT_SCALE_PL.values())
+_SHORT_SCALE_MAX_PL = max(_SHORT_SCALE_PL)
+
+
+def _sub_thousand_pl(n, ordinals=False, iteration=0, scientific_run=False,
+                     tens=_TENS_PL):
+    assert 0 <= n <= 999
+
+    _, n_mod = divmod(n, 10)
+    if iteration > 0 and n in _ALT_ORDINALS_PL and ordinals:
+        return _ALT_ORDINALS_PL[n]
+    elif n in _SHORT_ORDINAL_PL and ordinals:
+        return _SHORT_ORDINAL_PL[n] if not scientific_run \
+            else _ALT_ORDINALS_PL[n]
+    if n <= 19:
+        return _DIGITS_PL[n] if not scientific_run or not ordinals\
+            else _DIGITS_PL[n][:-1] + "ej"
+    elif n <= 99:
+        q, r = divmod(n, 10)
+        tens_text = tens[q - 1]
+        if scientific_run:
+            tens_text = tens_text[:-1] + "ej"
+        return tens_text + (" " + _sub_thousand_pl(
+            r, ordinals, scientific_run=scientific_run, tens=tens) if r
+            else "")
+    else:
+        q, r = divmod(n, 100)
+        digit_name = _DIGITS_PL[q]
+        if q*100 in _NUM_STRING_PL:
+            digit_name = _NUM_STRING_PL[q*100]
+
+        return digit_name + (
+            " " + _sub_thousand_pl(r, ordinals, scientific_run=scientific_run,
+                                   tens=tens) if r else "")
+
+
+@lru_cache(maxsize=None)
+def _sub_thousand_table_pl(scientific_run, ordinal_tens, ordinals, later):
+    """
+    Every number under a thousand, pronounced, which larger numbers are
+    composed of. There are sixteen kinds of them, so each is only built
+    the first time it is needed.
+    """
+    return ChunkTable(partial(
+        _sub_thousand_pl, ordinals=ordinals, iteration=int(later),
+        scientific_run=scientific_run,
+        tens=_ORDINAL_TENS_PL if ordinal_tens else _TENS_PL))
+
+
+def _split_by(n, split=1000):
+    assert 0 <= n
+    res = []
+    while n:
+        n, r = divmod(n, split)
+        res.append(r)
+    return res
+
+
+def _short_scale_pl(n, ordinals, scientific_run):
+    if n >= _SHORT_SCALE_MAX_PL:
+        return "nieskończoność"
+    ordi = ordinals
+
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000)):
+        if not z:
+            continue
+        number = _sub_thousand_table_pl(bool(scientific_run), bool(ordinals),
+                                        bool(ordi), i > 0)[z]
+
+        if i:
+            if i >= len(_HUNDREDS_PL):
+                return ""
+            number += " "
+            if ordi:
+                if i * 1000 in _SHORT_ORDINAL_PL:
+                    if z == 1:
+                        number = _SHORT_ORDINAL_PL[i * 1000]
+                    else:
+                        number += _SHORT_ORDINAL_PL[i * 1000]
+                else:
+                    if n not in _SHORT_SCALE_PL:
+                        num = int("1" + "0" * (len(str(n)) - 2))
+
+                        number += _SHORT_SCALE_PL[num] + "owa"
+                    else:
+                        number = _SHORT_SCALE_PL[n] + "ty"
+            else:
+                hundreds_text = _SHORT_SCALE_PL[float(pow(1000, i))]
+                if z != 1:
+                    _, z_mod = divmod(z, 10)
+                    _, z_mod_tens = divmod(z, 100)
+                    n_main, _ = divmod(z_mod_tens, 10)
+                    if i == 1:
+                        if n_main != 1 and 5 > z_mod > 0:
+                            hundreds_text += "e"
+                        else:
+                            hundreds_text = "tysięcy"
+                    elif i > 1:
+                        hundreds_text += "y" if 5 > z_mod > 0 else "ów"
+
+                number += hundreds_text
+        res.append(number)
+        ordi = False
+
+    return ", ".join(reversed(res))
+
+
 def pronounce_number_pl(num, places=2, short_scale=True, scientific=False,
                         ordinals=False, scientific_run=False):
     """
@@ -107,15 +234,7 @@ def pronounce_number_pl(num, places=2, short_scale=True, scientific=False,
                     'minus ' if power < 0 else '',
                     pronounce_number_pl(abs(power), places, short_scale, False))
 
-    number_names = _NUM_STRING_PL.copy()
-    number_names.update(_SHORT_SCALE_PL)
-
-    digits = [number_names[n] for n in range(0, 20)]
-    if ordinals:
-        tens = [_SHORT_ORDINAL_PL[n] for n in range(10, 100, 10)]
-    else:
-        tens = [number_names[n] for n in range(10, 100, 10)]
-    hundreds = [_SHORT_SCALE_PL[n] for n in _SHORT_SCALE_PL.keys()]
+    number_names = _NUMBER_NAMES_PL
 
     # deal with negatives
     result = ""
@@ -127,95 +246,7 @@ def pronounce_number_pl(num, places=2, short_scale=True, scientific=False,
     if num in number_names and not ordinals:
         result += number_names[num]
     else:
-        def _sub_thousand(n, ordinals=False, iteration=0):
-            assert 0 <= n <= 999
-
-            _, n_mod = divmod(n, 10)
-            if iteration > 0 and n in _ALT_ORDINALS_PL and ordinals:
-                return _ALT_ORDINALS_PL[n]
-            elif n in _SHORT_ORDINAL_PL and ordinals:
-                return _SHORT_ORDINAL_PL[n] if not scientific_run \
-                    else _ALT_ORDINALS_PL[n]
-            if n <= 19:
-                return digits[n] if not scientific_run or not ordinals\
-                    else digits[n][:-1] + "ej"
-            elif n <= 99:
-                q, r = divmod(n, 10)
-                tens_text = tens[q - 1]
-                if scientific_run:
-                    tens_text = tens_text[:-1] + "ej"
-                return tens_text + (" " + _sub_thousand(r, ordinals) if r
-                                    else "")
-            else:
-                q, r = divmod(n, 100)
-                digit_name = digits[q]
-                if q*100 in _NUM_STRING_PL:
-                    digit_name = _NUM_STRING_PL[q*100]
-
-                return digit_name + (
-                    " " + _sub_thousand(r, ordinals) if r else "")
-
-        def _short_scale(n):
-            if n >= max(_SHORT_SCALE_PL.keys()):
-                return "nieskończoność"
-            ordi = ordinals
-
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000)):
-                if not z:
-                    continue
-                number = _sub_thousand(z, ordi, iteration=i)
-
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    number += " "
-                    if ordi:
-                        if i * 1000 in _SHORT_ORDINAL_PL:
-                            if z == 1:
-                                number = _SHORT_ORDINAL_PL[i * 1000]
-                            else:
-                                number += _SHORT_ORDINAL_PL[i * 1000]
-                        else:
-                            if n not in _SHORT_SCALE_PL:
-                                num = int("1" + "0" * (len(str(n)) - 2))
-
-                                number += _SHORT_SCALE_PL[num] + "owa"
-                            else:
-                                number = _SHORT_SCALE_PL[n] + "ty"
-                    else:
-                        hundreds_text = _SHORT_SCALE_PL[float(pow(1000, i))]
-                        if z != 1:
-                            _, z_mod = divmod(z, 10)
-                            _, z_mod_tens = divmod(z, 100)
-                            n_main, _ = divmod(z_mod_tens, 10)
-                            if i == 1:
-                                if n_main != 1 and 5 > z_mod > 0:
-                                    hundreds_text += "e"
-                                else:
-                                    hundreds_text = "tysięcy"
-                            elif i > 1:
-                                hundreds_text += "y" if 5 > z_mod > 0 else "ów"
-
-                        number += hundreds_text
-                res.append(number)
-                ordi = False
-
-            return ", ".join(reversed(res))
-
-        def _split_by(n, split=1000):
-            assert 0 <= n
-            res = []
-            while n:
-                n, r = divmod(n, split)
-                res.append(r)
-            return res
-
-        result += _short_scale(num)
+        result += _short_scale_pl(num, ordinals, scientific_run)
 
     # deal with scientific notation unpronounceable as number
     if not result and "e" in str(num):
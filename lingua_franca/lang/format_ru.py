@@ -15,7 +15,10 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from functools import partial
+
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _FRACTION_STRING_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, _LONG_ORDINAL_RU
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -75,6 +78,170 @@ def nice_number_ru(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _number_names_ru(scale):
+    number_names = _NUM_STRING_RU.copy()
+    number_names.update(scale)
+    return number_names
+
+
+# The names of numbers with the short and the long scale, and the names of
+# the scales, built once rather than on every call of pronounce_number_ru()
+_NUMBER_NAMES_SHORT_RU = _number_names_ru(_SHORT_SCALE_RU)
+_NUMBER_NAMES_LONG_RU = _number_names_ru(_LONG_SCALE_RU)
+_DIGITS_RU = [_NUMBER_NAMES_SHORT_RU[n] for n in range(0, 20)]
+_TENS_RU = [_NUMBER_NAMES_SHORT_RU[n] for n in range(10, 100, 10)]
+_SHORT_HUNDREDS_RU = list(_SHORT_SCALE_RU.values())
+_LONG_HUNDREDS_RU = list(_LONG_SCALE_RU.values())
+_SHORT_SCALE_MAX_RU = max(_SHORT_SCALE_RU)
+_LONG_SCALE_MAX_RU = max(_LONG_SCALE_RU)
+
+
+def _sub_thousand_ru(n, ordinals=False):
+    assert 0 <= n <= 999
+    if n in _SHORT_ORDINAL_RU and ordinals:
+        return _SHORT_ORDINAL_RU[n]
+    if n <= 19:
+        return _DIGITS_RU[n]
+    elif n <= 99:
+        q, r = divmod(n, 10)
+        return _TENS_RU[q - 1] + (" " + _sub_thousand_ru(r, ordinals) if r
+                                  else "")
+    else:
+        q, r = divmod(n, 100)
+        return _NUM_STRING_RU[q * 100] + (
+            " " + _sub_thousand_ru(r, ordinals) if r else "")
+
+
+# Every number under a thousand, pronounced, which larger numbers are
+# composed of: _SUB_THOUSAND_RU[ordinals][n]
+_SUB_THOUSAND_RU = (ChunkTable(_sub_thousand_ru),
+                    ChunkTable(partial(_sub_thousand_ru, ordinals=True)))
+
+
+def _split_by(n, split=1000):
+    assert 0 <= n
+    res = []
+    while n:
+        n, r = divmod(n, split)
+        res.append(r)
+    return res
+
+
+def _short_scale_ru(n, ordinals):
+    if n > _SHORT_SCALE_MAX_RU:
+        return "бесконечность"
+    ordi = ordinals
+
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000)):
+        if not z:
+            continue
+        number = _SUB_THOUSAND_RU[bool(not i and ordi)][z]
+
+        if i:
+            if i >= len(_SHORT_HUNDREDS_RU):
+                return ""
+            if ordi:
+                if i * 1000 in _SHORT_ORDINAL_RU:
+                    if z == 1:
+                        number = _SHORT_ORDINAL_RU[i * 1000]
+                    else:
+                        if z > 5:
+                            number = number[:-1] + "и"
+                        number += _SHORT_ORDINAL_RU[i * 1000]
+                else:
+                    if n not in _SHORT_SCALE_RU:
+                        num = int("1" + "0" * (len(str(n)) // 3 * 3))
+
+                        if number[-3:] == "два":
+                            number = number[:-1] + "ух"
+                        elif number[-2:] == "ри" or number[-2:] == "ре":
+                            number = number[:-1] + "ёх"
+                        elif number[-1:] == "ь":
+                            number = number[:-1] + "и"
+
+                        number += _SHORT_SCALE_RU[num] + "ный"
+                    else:
+                        number = _SHORT_SCALE_RU[n] + "ный"
+            elif z == 1:
+                number = _SHORT_HUNDREDS_RU[i - 1]
+            else:
+                if i == 1:
+                    if z % 10 == 1 and z % 100 // 10 != 1:
+                        number = number[:-2] + "на"
+                    elif z % 10 == 2 and z % 100 // 10 != 1:
+                        number = number[:-1] + "е"
+                    number += " " + plural_ru(z, "тысяча", "тысячи", "тысяч")
+                elif 1 <= z % 10 <= 4 and z % 100 // 10 != 1:
+                    number += " " + _SHORT_HUNDREDS_RU[i - 1] + "а"
+                else:
+                    number += " " + _SHORT_HUNDREDS_RU[i - 1] + "ов"
+
+        res.append(number)
+        ordi = False
+
+    return " ".join(reversed(res))
+
+
+def _long_scale_ru(n, places, scientific, ordinals):
+    if n >= _LONG_SCALE_MAX_RU:
+        return "бесконечность"
+    ordi = ordinals
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000000)):
+        if not z:
+            continue
+        number = pronounce_number_ru(z, places, True, scientific,
+                                     ordinals=ordi and not i)
+        # strip off the comma after the thousand
+        if i:
+            if i >= len(_LONG_HUNDREDS_RU):
+                return ""
+            # plus one as we skip 'thousand'
+            # (and 'hundred', but this is excluded by index value)
+            number = number.replace(',', '')
+
+            if ordi:
+                if (i + 1) * 1000000 in _LONG_ORDINAL_RU:
+                    if z == 1:
+                        number = _LONG_ORDINAL_RU[
+                            (i + 1) * 1000000]
+                    else:
+                        number += _LONG_ORDINAL_RU[
+                            (i + 1) * 1000000]
+                else:
+                    if n not in _LONG_SCALE_RU:
+                        num = int("1" + "0" * (len(str(n)) // 3 * 3))
+
+                        if number[-3:] == "два":
+                            number = number[:-1] + "ух"
+                        elif number[-2:] == "ри" or number[-2:] == "ре":
+                            number = number[:-1] + "ёх"
+                        elif number[-1:] == "ь":
+                            number = number[:-1] + "и"
+
+                        number += _LONG_SCALE_RU[num] + "ный"
+                    else:
+                        number = " " + _LONG_SCALE_RU[n] + "ный"
+            elif z == 1:
+                number = _LONG_HUNDREDS_RU[i]
+            elif z <= 4:
+                number += " " + _LONG_HUNDREDS_RU[i] + "а"
+            else:
+                number += " " + _LONG_HUNDREDS_RU[i] + "ов"
+
+        res.append(number)
+    return " ".join(reversed(res))
+
+
 def pronounce_number_ru(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -122,21 +289,8 @@ def pronounce_number_ru(number, places=2, short_scale=True, scientific=False,
                     'минус ' if power < 0 else '',
                     pronounce_number_ru(abs(power), places, short_scale, False, ordinals=False))
 
-    if short_scale:
-        number_names = _NUM_STRING_RU.copy()
-        number_names.update(_SHORT_SCALE_RU)
-    else:
-        number_names = _NUM_STRING_RU.copy()
-        number_names.update(_LONG_SCALE_RU)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_RU[n] for n in _SHORT_SCALE_RU.keys()]
-    else:
-        hundreds = [_LONG_SCALE_RU[n] for n in _LONG_SCALE_RU.keys()]
+    number_names = _NUMBER_NAMES_SHORT_RU if short_scale \
+        else _NUMBER_NAMES_LONG_RU
 
     # deal with negative numbers
     result = ""
@@ -148,145 +302,10 @@ def pronounce_number_ru(number, places=2, short_scale=True, scientific=False,
     if num in number_names and not ordinals:
         result += number_names[num]
     else:
-        def _sub_thousand(n, ordinals=False):
-            assert 0 <= n <= 999
-            if n in _SHORT_ORDINAL_RU and ordinals:
-                return _SHORT_ORDINAL_RU[n]
-            if n <= 19:
-                return digits[n]
-            elif n <= 99:
-                q, r = divmod(n, 10)
-                return tens[q - 1] + (" " + _sub_thousand(r, ordinals) if r
-                                      else "")
-            else:
-                q, r = divmod(n, 100)
-                return _NUM_STRING_RU[q * 100] + (" " + _sub_thousand(r, ordinals) if r else "")
-
-        def _short_scale(n):
-            if n > max(_SHORT_SCALE_RU.keys()):
-                return "бесконечность"
-            ordi = ordinals
-
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000)):
-                if not z:
-                    continue
-                number = _sub_thousand(z, not i and ordi)
-
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    if ordi:
-                        if i * 1000 in _SHORT_ORDINAL_RU:
-                            if z == 1:
-                                number = _SHORT_ORDINAL_RU[i * 1000]
-                            else:
-                                if z > 5:
-                                    number = number[:-1] + "и"
-                                number += _SHORT_ORDINAL_RU[i * 1000]
-                        else:
-                            if n not in _SHORT_SCALE_RU:
-                                num = int("1" + "0" * (len(str(n)) // 3 * 3))
-
-                                if number[-3:] == "два":
-                                    number = number[:-1] + "ух"
-                                elif number[-2:] == "ри" or number[-2:] == "ре":
-                                    number = number[:-1] + "ёх"
-                                elif number[-1:] == "ь":
-                                    number = number[:-1] + "и"
-
-                                number += _SHORT_SCALE_RU[num] + "ный"
-                            else:
-                                number = _SHORT_SCALE_RU[n] + "ный"
-                    elif z == 1:
-                        number = hundreds[i - 1]
-                    else:
-                        if i == 1:
-                            if z % 10 == 1 and z % 100 // 10 != 1:
-                                number = number[:-2] + "на"
-                            elif z % 10 == 2 and z % 100 // 10 != 1:
-                                number = number[:-1] + "е"
-                            number += " " + plural_ru(z, "тысяча", "тысячи", "тысяч")
-                        elif 1 <= z % 10 <= 4 and z % 100 // 10 != 1:
-                            number += " " + hundreds[i - 1] + "а"
-                        else:
-                            number += " " + hundreds[i - 1] + "ов"
-
-                res.append(number)
-                ordi = False
-
-            return " ".join(reversed(res))
-
-        def _split_by(n, split=1000):
-            assert 0 <= n
-            res = []
-            while n:
-                n, r = divmod(n, split)
-                res.append(r)
-            return res
-
-        def _long_scale(n):
-            if n >= max(_LONG_SCALE_RU.keys()):
-                return "бесконечность"
-            ordi = ordinals
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000000)):
-                if not z:
-                    continue
-                number = pronounce_number_ru(z, places, True, scientific,
-                                             ordinals=ordi and not i)
-                # strip off the comma after the thousand
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    # plus one as we skip 'thousand'
-                    # (and 'hundred', but this is excluded by index value)
-                    number = number.replace(',', '')
-
-                    if ordi:
-                        if (i + 1) * 1000000 in _LONG_ORDINAL_RU:
-                            if z == 1:
-                                number = _LONG_ORDINAL_RU[
-                                    (i + 1) * 1000000]
-                            else:
-                                number += _LONG_ORDINAL_RU[
-                                    (i + 1) * 1000000]
-                        else:
-                            if n not in _LONG_SCALE_RU:
-                                num = int("1" + "0" * (len(str(n)) // 3 * 3))
-
-                                if number[-3:] == "два":
-                                    number = number[:-1] + "ух"
-                                elif number[-2:] == "ри" or number[-2:] == "ре":
-                                    number = number[:-1] + "ёх"
-                                elif number[-1:] == "ь":
-                                    number = number[:-1] + "и"
-
-                                number += _LONG_SCALE_RU[num] + "ный"
-                            else:
-                                number = " " + _LONG_SCALE_RU[n] + "ный"
-                    elif z == 1:
-                        number = hundreds[i]
-                    elif z <= 4:
-                        number += " " + hundreds[i] + "а"
-                    else:
-                        number += " " + hundreds[i] + "ов"
-
-                res.append(number)
-            return " ".join(reversed(res))
-
         if short_scale:
-            result += _short_scale(num)
+            result += _short_scale_ru(num, ordinals)
         else:
-            result += _long_scale(num)
+            result += _long_scale_ru(num, places, scientific, ordinals)
 
     # deal with scientific notation unpronounceable as number
     if not result and "e" in str(num):
@@ -15,9 +15,12 @@
 # limitations under the License.
 #
 
+from functools import partial
+
 from lingua_franca.lang.common_data_sl import _NUM_STRING_SL, \
     _FRACTION_STRING_SL, _LONG_SCALE_SL, _SHORT_SCALE_SL, _SHORT_ORDINAL_SL
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ChunkTable
 
 
 def nice_number_sl(number, speech=True, denominators=range(1, 21)):
@@ -67,6 +70,203 @@ def nice_number_sl(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _number_names_sl(scale):
+    number_names = _NUM_STRING_SL.copy()
+    number_names.update(scale)
+    return number_names
+
+
+# The names of numbers with the short and the long scale, and the names of
+# the scales, built once rather than on every call of pronounce_number_sl()
+_NUMBER_NAMES_SHORT_SL = _number_names_sl(_SHORT_SCALE_SL)
+_NUMBER_NAMES_LONG_SL = _number_names_sl(_LONG_SCALE_SL)
+_DIGITS_SL = [_NUMBER_NAMES_SHORT_SL[n] for n in range(0, 20)]
+_TENS_SL = [_NUMBER_NAMES_SHORT_SL[n] for n in range(10, 100, 10)]
+_SHORT_HUNDREDS_SL = list(_SHORT_SCALE_SL.values())
+_LONG_HUNDREDS_SL = list(_LONG_SCALE_SL.values())
+_SHORT_SCALE_MAX_SL = max(_SHORT_SCALE_SL)
+_LONG_SCALE_MAX_SL = max(_LONG_SCALE_SL)
+
+
+def _sub_thousand_sl(n, ordinals=False, is_male=False):
+    assert 0 <= n <= 999
+    if n in _SHORT_ORDINAL_SL and ordinals:
+        return _SHORT_ORDINAL_SL[n]
+    if n <= 19:
+        if is_male and n == 2:
+            return _DIGITS_SL[n][:-1] + "a"
+        return _DIGITS_SL[n]
+    elif n <= 99:
+        q, r = divmod(n, 10)
+        sub = _sub_thousand_sl(r, False)
+        if r == 2:
+            sub = sub[:-1] + "a"
+        return ((sub + "in") if r else "") + (
+            _TENS_SL[q - 1]) + ("i" if ordinals else "")
+    else:
+        q, r = divmod(n, 100)
+        if q == 1:
+            qstr = ""
+        else:
+            qstr = _DIGITS_SL[q]
+        return (qstr + "sto" + (
+            " " + _sub_thousand_sl(r, ordinals) if r else ""))
+
+
+# Every number under a thousand, pronounced, which larger numbers are
+# composed of: _SUB_THOUSAND_SL[ordinals][is_male][n]
+_SUB_THOUSAND_SL = tuple(
+    tuple(ChunkTable(partial(_sub_thousand_sl, ordinals=ordinals,
+                             is_male=is_male))
+          for is_male in (False, True))
+    for ordinals in (False, True))
+
+
+def _plural_hundreds_sl(n, hundred, ordi, short_scale):
+    if hundred[-3:] != "jon":
+        if ordi:
+            return hundred + "i"
+
+        return hundred
+
+    if n < 1000 or short_scale:
+        if ordi:
+            return hundred + "ti"
+
+        if n % 100 == 1:
+            return hundred
+        elif n % 100 == 2:
+            return hundred + "a"
+        elif n % 100 == 3 or n % 100 == 4:
+            return hundred + "i"
+        else:
+            return hundred + "ov"
+    else:
+        n //= 1000
+
+        if ordi:
+            return hundred[:-3] + "jardti"
+
+        if n % 100 == 1:
+            return hundred[:-3] + "jarda"
+        elif n % 100 == 2:
+            return hundred[:-3] + "jardi"
+        elif n % 100 == 3 or n % 100 == 4:
+            return hundred[:-3] + "jarde"
+        else:
+            return hundred[:-3] + "jard"
+
+
+def _split_by(n, split=1000):
+    assert 0 <= n
+    res = []
+    while n:
+        n, r = divmod(n, split)
+        res.append(r)
+    return res
+
+
+def _short_scale_sl(n, ordinals):
+    if n >= _SHORT_SCALE_MAX_SL:
+        return "neskončno"
+    ordi = ordinals
+
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+
+    split = _split_by(n, 1000)
+    if ordinals and len([a for a in split if a > 0]) == 1:
+        ordi_force = True
+    else:
+        ordi_force = False
+
+    for i, z in enumerate(split):
+        if not z:
+            continue
+
+        sub_thousand = _SUB_THOUSAND_SL[bool(not i and ordi)]
+        if z == 1 and i == 1:
+            number = ""
+        elif z > 100 and z % 100 == 2:
+            number = sub_thousand[True][z]
+        elif z > 100 and z % 100 == 3:
+            number = sub_thousand[False][z] + "je"
+        elif z > 1 or i == 0 or ordi:
+            number = sub_thousand[False][z]
+        else:
+            number = ""
+
+        if i:
+            if i >= len(_SHORT_HUNDREDS_SL):
+                return ""
+            if z > 1:
+                number += " "
+            number += _plural_hundreds_sl(
+                z, _SHORT_HUNDREDS_SL[i],
+                True if ordi_force else not i and ordi, True)
+        res.append(number)
+        ordi = False
+
+    return " ".join(reversed(res))
+
+
+def _long_scale_sl(n, places, scientific, ordinals):
+    if n >= _LONG_SCALE_MAX_SL:
+        return "neskončno"
+    ordi = ordinals
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+
+    split = _split_by(n, 1000000)
+    if ordinals and len([a for a in split if a > 0]) == 1:
+        ordi_force = True
+    else:
+        ordi_force = False
+
+    for i, z in enumerate(split):
+        if not z:
+            continue
+
+        number = pronounce_number_sl(z, places, True, scientific)
+        if z > 100:
+            add = number.split()[0] + " "
+        else:
+            add = ""
+        if z % 100 == 2 and i >= 1:
+            number = add + _DIGITS_SL[2][:-1] + "a"
+        if z % 100 == 3 and i >= 1:
+            number = add + _DIGITS_SL[3] + "je"
+
+        # strip off the comma after the thousand
+        if i:
+            if i >= len(_LONG_HUNDREDS_SL):
+                return ""
+            # plus one as we skip 'thousand'
+            # (and 'hundred', but this is excluded by index value)
+            hundred = _plural_hundreds_sl(
+                z, _LONG_HUNDREDS_SL[i + 1],
+                True if ordi_force else ordi and not i, False)
+
+            if z >= 1000:
+                z //= 1000
+                number = pronounce_number_sl(
+                    z, places, True, scientific,
+                    ordinals=True if ordi_force else ordi and not i)
+
+            if z == 1:
+                number = hundred
+            else:
+                number += " " + hundred
+        res.append(number)
+    return " ".join(reversed(res))
+
+
 def pronounce_number_sl(num, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -113,21 +313,8 @@ def pronounce_number_sl(num, places=2, short_scale=True, scientific=False,
                     'minus ' if power < 0 else '',
                     pronounce_number_sl(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_SL.copy()
-        number_names.update(_SHORT_SCALE_SL)
-    else:
-        number_names = _NUM_STRING_SL.copy()
-        number_names.update(_LONG_SCALE_SL)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_SL[n] for n in _SHORT_SCALE_SL.keys()]
-    else:
-        hundreds = [_LONG_SCALE_SL[n] for n in _LONG_SCALE_SL.keys()]
+    number_names = _NUMBER_NAMES_SHORT_SL if short_scale \
+        else _NUMBER_NAMES_LONG_SL
 
     # deal with negatives
     result = ""
@@ -139,171 +326,10 @@ def pronounce_number_sl(num, places=2, short_scale=True, scientific=False,
     if num in number_names and not ordinals:
         result += number_names[num]
     else:
-        def _sub_thousand(n, ordinals=False, is_male=False):
-            assert 0 <= n <= 999
-            if n in _SHORT_ORDINAL_SL and ordinals:
-                return _SHORT_ORDINAL_SL[n]
-            if n <= 19:
-                if is_male and n == 2:
-                    return digits[n][:-1] + "a"
-                return digits[n]
-            elif n <= 99:
-                q, r = divmod(n, 10)
-                sub = _sub_thousand(r, False)
-                if r == 2:
-                    sub = sub[:-1] + "a"
-                return ((sub + "in") if r else "") + (
-                    tens[q - 1]) + ("i" if ordinals else "")
-            else:
-                q, r = divmod(n, 100)
-                if q == 1:
-                    qstr = ""
-                else:
-                    qstr = digits[q]
-                return (qstr + "sto" + (
-                    " " + _sub_thousand(r, ordinals) if r else ""))
-
-        def _plural_hundreds(n, hundred, ordi=True):
-            if hundred[-3:] != "jon":
-                if ordi:
-                    return hundred + "i"
-
-                return hundred
-
-            if n < 1000 or short_scale:
-                if ordi:
-                    return hundred + "ti"
-
-                if n % 100 == 1:
-                    return hundred
-                elif n % 100 == 2:
-                    return hundred + "a"
-                elif n % 100 == 3 or n % 100 == 4:
-                    return hundred + "i"
-                else:
-                    return hundred + "ov"
-            else:
-                n //= 1000
-
-                if ordi:
-                    return hundred[:-3] + "jardti"
-
-                if n % 100 == 1:
-                    return hundred[:-3] + "jarda"
-                elif n % 100 == 2:
-                    return hundred[:-3] + "jardi"
-                elif n % 100 == 3 or n % 100 == 4:
-                    return hundred[:-3] + "jarde"
-                else:
-                    return hundred[:-3] + "jard"
-
-        def _short_scale(n):
-            if n >= max(_SHORT_SCALE_SL.keys()):
-                return "neskončno"
-            ordi = ordinals
-
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-
-            split = _split_by(n, 1000)
-            if ordinals and len([a for a in split if a > 0]) == 1:
-                ordi_force = True
-            else:
-                ordi_force = False
-
-            for i, z in enumerate(split):
-                if not z:
-                    continue
-
-                if z == 1 and i == 1:
-                    number = ""
-                elif z > 100 and z % 100 == 2:
-                    number = _sub_thousand(z, not i and ordi, is_male=True)
-                elif z > 100 and z % 100 == 3:
-                    number = _sub_thousand(z, not i and ordi) + "je"
-                elif z > 1 or i == 0 or ordi:
-                    number = _sub_thousand(z, not i and ordi)
-                else:
-                    number = ""
-
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    if z > 1:
-                        number += " "
-                    number += _plural_hundreds(
-                        z, hundreds[i], True if ordi_force else not i and ordi)
-                res.append(number)
-                ordi = False
-
-            return " ".join(reversed(res))
-
-        def _split_by(n, split=1000):
-            assert 0 <= n
-            res = []
-            while n:
-                n, r = divmod(n, split)
-                res.append(r)
-            return res
-
-        def _long_scale(n):
-            if n >= max(_LONG_SCALE_SL.keys()):
-                return "neskončno"
-            ordi = ordinals
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-
-            split = _split_by(n, 1000000)
-            if ordinals and len([a for a in split if a > 0]) == 1:
-                ordi_force = True
-            else:
-                ordi_force = False
-
-            for i, z in enumerate(split):
-                if not z:
-                    continue
-
-                number = pronounce_number_sl(z, places, True, scientific)
-                if z > 100:
-                    add = number.split()[0] + " "
-                else:
-                    add = ""
-                if z % 100 == 2 and i >= 1:
-                    number = add + digits[2][:-1] + "a"
-                if z % 100 == 3 and i >= 1:
-                    number = add + digits[3] + "je"
-
-                # strip off the comma after the thousand
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    # plus one as we skip 'thousand'
-                    # (and 'hundred', but this is excluded by index value)
-                    hundred = _plural_hundreds(
-                        z, hundreds[i + 1], True if ordi_force else ordi and not i)
-
-                    if z >= 1000:
-                        z //= 1000
-                        number = pronounce_number_sl(z, places, True, scientific,
-                                                     ordinals=True if ordi_force else ordi and not i)
-
-                    if z == 1:
-                        number = hundred
-                    else:
-                        number += " " + hundred
-                res.append(number)
-            return " ".join(reversed(res))
-
         if short_scale:
-            result += _short_scale(num)
+            result += _short_scale_sl(num, ordinals)
         else:
-            result += _long_scale(num)
+            result += _long_scale_sl(num, places, scientific, ordinals)
 
     if ordinals:
         result = result.replace(" ", "")
@@ -14,7 +14,7 @@
 # limitations under the License.
 #
 
-from .format_common import convert_to_mixed_fraction
+from .format_common import convert_to_mixed_fraction, ChunkTable
 from lingua_franca.lang.common_data_sv import _EXTRA_SPACE_SV, \
     _FRACTION_STRING_SV, _MONTHS_SV, _NUM_POWERS_OF_TEN_SV, _NUM_STRING_SV
 from math import floor
@@ -64,6 +64,78 @@ def nice_number_sv(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+def _pronounce_triplet_sv(num):
+    result = ""
+    num = floor(num)
+
+    if num > 99:
+        hundreds = floor(num / 100)
+        if hundreds > 0:
+            if hundreds == 1:
+                result += 'ett' + 'hundra'
+            else:
+                result += _NUM_STRING_SV[hundreds] + 'hundra'
+
+            num -= hundreds * 100
+
+    if num == 0:
+        result += ''  # do nothing
+    elif num == 1:
+        result += 'ett'
+    elif num <= 20:
+        result += _NUM_STRING_SV[num]
+    elif num > 20:
+        tens = num % 10
+        ones = num - tens
+
+        if ones > 0:
+            result += _NUM_STRING_SV[ones]
+        if tens > 0:
+            result += _NUM_STRING_SV[tens]
+
+    return result
+
+
+# What whole numbers are put together from, built once: every triplet of
+# digits, pronounced, and what follows a triplet of one, or of more, at
+# each scale level (thousands, millions, ...)
+_TRIPLETS_SV = ChunkTable(_pronounce_triplet_sv)
+_ONE_AT_SCALE_SV = ('en', 'ettusen' + _EXTRA_SPACE_SV) + tuple(
+    'en ' + power + _EXTRA_SPACE_SV for power in _NUM_POWERS_OF_TEN_SV[2:])
+_SCALES_SV = ('', 'tusen' + _EXTRA_SPACE_SV) + tuple(
+    power + 'er' + _EXTRA_SPACE_SV  # MiljonER
+    for power in _NUM_POWERS_OF_TEN_SV[2:])
+
+
+def _pronounce_fractional_sv(num, places):
+    # fixed number of places even with trailing zeros
+    result = ""
+    place = 10
+    while places > 0:
+        # doesn't work with 1.0001 and places = 2: int(
+        # num*place) % 10 > 0 and places > 0:
+        result += " " + _NUM_STRING_SV[int(num * place) % 10]
+        place *= 10
+        places -= 1
+    return result
+
+
+def _pronounce_whole_number_sv(num):
+    num = floor(num)
+    result = ''
+    scale_level = 0
+    while num:
+        last_triplet = num % 1000
+        if last_triplet == 1:
+            result = _ONE_AT_SCALE_SV[scale_level] + result
+        elif last_triplet > 1:
+            result = _TRIPLETS_SV[last_triplet] + _SCALES_SV[scale_level] + \
+                result
+        num = floor(num / 1000)
+        scale_level += 1
+    return result
+
+
 def pronounce_number_sv(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -84,81 +156,6 @@ def pronounce_number_sv(number, places=2, short_scale=True, scientific=False,
     # TODO short_scale, scientific and ordinals
     # currently ignored
 
-    def pronounce_triplet_sv(num):
-        result = ""
-        num = floor(num)
-
-        if num > 99:
-            hundreds = floor(num / 100)
-            if hundreds > 0:
-                if hundreds == 1:
-                    result += 'ett' + 'hundra'
-                else:
-                    result += _NUM_STRING_SV[hundreds] + 'hundra'
-
-                num -= hundreds * 100
-
-        if num == 0:
-            result += ''  # do nothing
-        elif num == 1:
-            result += 'ett'
-        elif num <= 20:
-            result += _NUM_STRING_SV[num]
-        elif num > 20:
-            tens = num % 10
-            ones = num - tens
-
-            if ones > 0:
-                result += _NUM_STRING_SV[ones]
-            if tens > 0:
-                result += _NUM_STRING_SV[tens]
-
-        return result
-
-    def pronounce_fractional_sv(num, places):
-        # fixed number of places even with trailing zeros
-        result = ""
-        place = 10
-        while places > 0:
-            # doesn't work with 1.0001 and places = 2: int(
-            # num*place) % 10 > 0 and places > 0:
-            result += " " + _NUM_STRING_SV[int(num * place) % 10]
-            place *= 10
-            places -= 1
-        return result
-
-    def pronounce_whole_number_sv(num, scale_level=0):
-        if num == 0:
-            return ''
-
-        num = floor(num)
-        result = ''
-        last_triplet = num % 1000
-
-        if last_triplet == 1:
-            if scale_level == 0:
-                if result != '':
-                    result += '' + 'ett'
-                else:
-                    result += 'en'
-            elif scale_level == 1:
-                result += 'ettusen' + _EXTRA_SPACE_SV
-            else:
-                result += 'en ' + \
-                    _NUM_POWERS_OF_TEN_SV[scale_level] + _EXTRA_SPACE_SV
-        elif last_triplet > 1:
-            result += pronounce_triplet_sv(last_triplet)
-            if scale_level == 1:
-                result += 'tusen' + _EXTRA_SPACE_SV
-            if scale_level >= 2:
-                result += _NUM_POWERS_OF_TEN_SV[scale_level]
-            if scale_level >= 2:
-                result += 'er' + _EXTRA_SPACE_SV  # MiljonER
-
-        num = floor(num / 1000)
-        scale_level += 1
-        return pronounce_whole_number_sv(num, scale_level) + result
-
     result = ""
     if abs(number) >= 1000000000000000000000000:  # cannot do more than this
         return str(number)
@@ -168,14 +165,14 @@ def pronounce_number_sv(number, places=2, short_scale=True, scientific=False,
         return "minus " + pronounce_number_sv(abs(number), places)
     else:
         if number == int(number):
-            return pronounce_whole_number_sv(number)
+            return _pronounce_whole_number_sv(number)
         else:
             whole_number_part = floor(number)
             fractional_part = number - whole_number_part
-            result += pronounce_whole_number_sv(whole_number_part)
+            result += _pronounce_whole_number_sv(whole_number_part)
             if places > 0:
                 result += " komma"
-                result += pronounce_fractional_sv(fractional_part, places)
+                result += _pronounce_fractional_sv(fractional_part, places)
             return result
 
 
@@ -27,9 +27,8 @@ from lingua_franca.lang.common_data_ca import _NUMBERS_CA, \
     _FEMALE_DETERMINANTS_CA, _FEMALE_ENDINGS_CA, \
     _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA, \
     _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA
-from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
-import json
+from lingua_franca.bundle import read_locale_json
+from lingua_franca.lang.parse_common import Normalizer, cached_normalizer
 import re
 
 
@@ -236,28 +235,19 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
 
 
 class CatalanNormalizer(Normalizer):
-    with open(resolve_resource_file("text/ca-es/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = read_locale_json("ca-es", "normalize")
+    # unlike Portuguese, things like amo-te are not split
+    _DROP_FINAL_HYPHEN = True
 
-    @staticmethod
-    def tokenize(utterance):
-        # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
-        # Split things like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
-        # Don't split things like amo-te
-        #utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \3",
-        #                   utterance)
-        tokens = utterance.split()
-        if tokens[-1] == '-':
-            tokens = tokens[:-1]
 
-        return tokens
+def get_normalizer_ca(**config):
+    """ The normalizer of normalize(), see parse.get_normalizer() """
+    return cached_normalizer(CatalanNormalizer, config)
 
 
 def normalize_ca(text, remove_articles=True):
     """ CA string normalization """
-    return CatalanNormalizer().normalize(text, remove_articles)
+    return get_normalizer_ca().normalize(text, remove_articles)
 
 
 def extract_datetime_ca(text, anchorDate=None, default_time=None):
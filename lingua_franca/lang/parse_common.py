@@ -14,27 +14,54 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from itertools import accumulate, count
+from operator import add, sub
 import re
 
+from dateutil.relativedelta import relativedelta
+
 
 class Normalizer:
     """
     individual languages may subclass this if needed
 
     normalize_XX should pass a valid config read from json
+
+    normalize() runs the stages chosen by the config as one pipeline, which
+    is built on its first call and kept: consecutive word stages are fused
+    into a single pass over the words, and removing symbols and accents is
+    a single str.translate(). A stage a subclass overrides is run by
+    calling its method instead.
     """
     _default_config = {}
+    # Split things like 12% and #1, as (character, pattern, replacement):
+    # the pattern is only searched for in text with the character
+    _TOKEN_SPLITS = (("%", re.compile(r"([0-9]+)([\%])"), r"\1 \2"),
+                     ("#", re.compile(r"(\#)([0-9]+\b)"), r"\1 \2"))
+    # whether tokenize() drops a "-" ending the utterance
+    _DROP_FINAL_HYPHEN = False
+    # words remembered by each fused pass, and by the tokenizer
+    _WORD_CACHE_SIZE = 10000
 
     def __init__(self, config=None):
         self.config = config or self._default_config
-
-    @staticmethod
-    def tokenize(utterance):
-        # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
-        # Split thins like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
-        return utterance.split()
+        self._pipelines = {}
+
+    @classmethod
+    def tokenizer(cls):
+        """ The Tokenizer of _TOKEN_SPLITS, built once for each class """
+        tokenizer = cls.__dict__.get("_tokenizer")
+        if tokenizer is None:
+            tokenizer = cls._tokenizer = Tokenizer(
+                cls._TOKEN_SPLITS, cls._DROP_FINAL_HYPHEN,
+                cls._WORD_CACHE_SIZE)
+        return tokenizer
+
+    @classmethod
+    def tokenize(cls, utterance):
+        return cls.tokenizer().words(utterance)
 
     @property
     def should_lowercase(self):
@@ -108,20 +135,12 @@ class Normalizer:
 
     def expand_contractions(self, utterance):
         """ Expand common contractions, e.g. "isn't" -> "is not" """
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.contractions:
-                words[idx] = self.contractions[w]
-        utterance = " ".join(words)
-        return utterance
+        replacer = self.phrase_replacer(self.contractions)
+        return " ".join(replacer.replace(self.tokenize(utterance)))
 
     def numbers_to_digits(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.number_replacements:
-                words[idx] = self.number_replacements[w]
-        utterance = " ".join(words)
-        return utterance
+        replacer = self.phrase_replacer(self.number_replacements)
+        return " ".join(replacer.replace(self.tokenize(utterance)))
 
     def remove_articles(self, utterance):
         words = self.tokenize(utterance)
@@ -155,45 +174,475 @@ class Normalizer:
         return utterance
 
     def replace_words(self, utterance):
-        words = self.tokenize(utterance)
-        for idx, w in enumerate(words):
-            if w in self.word_replacements:
-                words[idx] = self.word_replacements[w]
-        utterance = " ".join(words)
-        return utterance
+        replacer = self.phrase_replacer(self.word_replacements)
+        return " ".join(replacer.replace(self.tokenize(utterance)))
 
     def normalize(self, utterance="", remove_articles=None):
+        # TODO deprecate remove_articles param, backwards compat
+        remove_articles = bool(remove_articles) or self.should_remove_articles
+        pipeline = self._pipelines.get(remove_articles)
+        if pipeline is None:
+            pipeline = self._pipelines[remove_articles] = \
+                self._build_pipeline(remove_articles)
+
+        words = None  # the words of the utterance, while in a word stage
+        for stage in pipeline:
+            if isinstance(stage, tuple):
+                words = self._replace_in_words(
+                    utterance if words is None else words, *stage)
+            else:
+                if words is not None:
+                    utterance = " ".join(words)
+                    words = None
+                utterance = stage(utterance)
+        if words is not None:
+            utterance = " ".join(words)
+        # remove extra spaces
+        utterance = " ".join([w for w in utterance.split(" ") if w])
+        return utterance
+
+    def phrase_replacer(self, phrases):
+        """
+        The PhraseReplacer of a dictionary of replacements, built once for
+        each dictionary, and shared by the normalizers given it.
+
+        Args:
+            phrases (dict or PhraseReplacer): {phrase: replacement}
+
+        Returns:
+            PhraseReplacer
+        """
+        if isinstance(phrases, PhraseReplacer):
+            return phrases
+        # the dictionary is kept with its replacer, so its id stays its own
+        found = _PHRASE_REPLACERS.get(id(phrases))
+        if found is None or found[0] is not phrases:
+            if len(_PHRASE_REPLACERS) >= _PHRASE_REPLACERS_SIZE:
+                _PHRASE_REPLACERS.clear()
+            found = _PHRASE_REPLACERS[id(phrases)] = \
+                (phrases, PhraseReplacer(phrases))
+        return found[1]
+
+    def _overrides(self, name):
+        return getattr(type(self), name) is not getattr(Normalizer, name)
+
+    def _build_pipeline(self, remove_articles):
+        """
+        The stages of normalize(), in order. A word stage is a tuple
+        (mappings, cache): each word is replaced by mappings[0], the result
+        split into words which are replaced by mappings[1], and so on. Any
+        other stage is a function of the utterance.
+        """
+        # the word stages need splitting an utterance to be the same as
+        # splitting each of its words. A subclass may override tokenize()
+        # as a classmethod, a staticmethod or a plain method.
+        own_tokenize = next(klass for klass in type(self).__mro__
+                            if "tokenize" in vars(klass)) is not Normalizer
+        stages = []
+
+        def add_words(name, mapping):
+            if own_tokenize or self._overrides(name):
+                stages.append(getattr(self, name))
+                return False
+            if isinstance(mapping, PhraseReplacer):
+                if mapping.longest > 1:
+                    # phrases span words, so they are found on their own
+                    stages.append(((mapping,), None))
+                    return True
+                mapping = mapping.words
+            if stages and isinstance(stages[-1], tuple) and \
+                    stages[-1][1] is not None:
+                # fused into the word stage before it
+                stages[-1] = (stages[-1][0] + (mapping,), {})
+            else:
+                stages.append(((mapping,), {}))
+            return True
+
         # mutations
         if self.should_lowercase:
-            utterance = utterance.lower()
+            stages.append(str.lower)
         if self.should_expand_contractions:
-            utterance = self.expand_contractions(utterance)
+            add_words("expand_contractions",
+                      self.phrase_replacer(self.contractions))
         if self.should_numbers_to_digits:
-            utterance = self.numbers_to_digits(utterance)
-        utterance = self.replace_words(utterance)
+            add_words("numbers_to_digits",
+                      self.phrase_replacer(self.number_replacements))
+        add_words("replace_words",
+                  self.phrase_replacer(self.word_replacements))
 
         # removals
-        if self.should_remove_symbols:
-            utterance = self.remove_symbols(utterance)
-        if self.should_remove_accents:
-            utterance = self.remove_accents(utterance)
-        # TODO deprecate remove_articles param, backwards compat
-        if remove_articles is not None and remove_articles:
-            utterance = self.remove_articles(utterance)
-        elif self.should_remove_articles:
-            utterance = self.remove_articles(utterance)
+        removals = [name for name, wanted in
+                    (("remove_symbols", self.should_remove_symbols),
+                     ("remove_accents", self.should_remove_accents))
+                    if wanted]
+        table = self._translate_table(removals)
+        if table is not None:
+            stages.append(lambda utterance: utterance.translate(table))
+        else:
+            stages.extend(getattr(self, name) for name in removals)
+        if remove_articles:
+            add_words("remove_articles", dict.fromkeys(self.articles, ""))
         if self.should_remove_stopwords:
-            utterance = self.remove_stopwords(utterance)
-        # remove extra spaces
-        utterance = " ".join([w for w in utterance.split(" ") if w])
-        return utterance
+            if add_words("remove_stopwords",
+                         dict.fromkeys(self.stopwords, "")):
+                stages.append(_strip_final_hyphen)
+        return stages
+
+    def _translate_table(self, removals):
+        """
+        The str.translate() table doing remove_symbols() then
+        remove_accents() for the ones in removals, or None if that can't
+        be done with a table.
+        """
+        if not removals or any(self._overrides(name) for name in removals):
+            return None
+        accents = self.accents if "remove_accents" in removals else {}
+        symbols = self.symbols if "remove_symbols" in removals else []
+        if any(len(char) != 1 for char in list(accents) + list(symbols)) or \
+                any(char in value for value in accents.values()
+                    for char in accents):
+            # replacing one at a time would replace the replacements
+            return None
+        table = {ord(char): value for char, value in accents.items()}
+        # symbols are removed first, so they are never accents
+        table.update((ord(char), " ") for char in symbols)
+        return table
+
+    def _split_word(self, word):
+        return self.tokenizer().split_word(word)
+
+    def _resplit(self, words):
+        """ tokenize() of the utterance made of words """
+        words = [split for word in words for split in self._split_word(word)]
+        if self._DROP_FINAL_HYPHEN and words and words[-1] == '-':
+            words.pop()
+        return words
+
+    def _replace_in_words(self, utterance, mappings, cache):
+        """
+        One word stage of normalize(): the words of utterance, a string or
+        the words of the stage before, with each mapping applied in turn.
+        """
+        if isinstance(utterance, str):
+            words = self.tokenize(utterance)
+        else:
+            words = self._resplit(utterance)
+        if len(mappings) == 1:
+            mapping = mappings[0]
+            if isinstance(mapping, PhraseReplacer):
+                return mapping.replace(words)
+            return [mapping.get(word, word) for word in words]
+
+        last = []
+        if self._DROP_FINAL_HYPHEN and words:
+            # tokenize() drops a final "-" again after each mapping, so the
+            # last word is replaced on its own. If all of it goes, the word
+            # before becomes the last one, and each mapping is applied to
+            # all the words in turn instead.
+            last = words[-1:]
+            for idx, mapping in enumerate(mappings):
+                if idx:
+                    last = self._resplit(last)
+                if not last:
+                    for idx, mapping in enumerate(mappings):
+                        if idx:
+                            words = self._resplit(words)
+                        words = [mapping.get(word, word) for word in words]
+                    return words
+                last = [mapping.get(word, word) for word in last]
+            words = words[:-1]
+
+        replaced = []
+        for word in words:
+            result = cache.get(word)
+            if result is None:
+                result = [word]
+                for idx, mapping in enumerate(mappings):
+                    if idx:
+                        result = [split for part in result
+                                  for split in self._split_word(part)]
+                    result = [mapping.get(part, part) for part in result]
+                if len(cache) >= self._WORD_CACHE_SIZE:
+                    cache.clear()
+                cache[word] = result
+            replaced.extend(result)
+        return replaced + last
+
+
+class PhraseReplacer(Mapping):
+    """
+    Replaces the phrases of a dictionary in a list of words.
+
+    The phrases, of one or more words, are stored in a trie of their
+    words, so finding them takes one pass over the words: at each word,
+    the trie is followed for as long as the next words allow, and the
+    longest phrase found there is replaced, or else the word is kept.
+
+    A replacer is read-only, so one built from a large dictionary can be
+    shared, e.g. passed as the word_replacements of get_normalizer() for
+    several languages.
+
+    Args:
+        phrases (dict): {phrase: replacement}. A phrase is matched against
+                        the words it is made of, split on whitespace.
+    """
+    # the key of a trie node which holds the replacement of its phrase
+    _END = object()
+
+    def __init__(self, phrases):
+        self._phrases = dict(phrases)
+        self._trie = {}
+        # the number of words of the longest phrase
+        self.longest = 0
+        for phrase, replacement in self._phrases.items():
+            words = phrase.split()
+            if not words:
+                continue
+            node = self._trie
+            for word in words:
+                node = node.setdefault(word, {})
+            node[self._END] = replacement
+            self.longest = max(self.longest, len(words))
+        # the phrases of one word, as {word: replacement}
+        self.words = {word: node[self._END]
+                      for word, node in self._trie.items()
+                      if self._END in node}
+
+    def __getitem__(self, phrase):
+        return self._phrases[phrase]
+
+    def __iter__(self):
+        return iter(self._phrases)
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def replace(self, words):
+        """
+        Replace the phrases found in words, longest first.
+
+        Args:
+            words (list(str)): the words to search
+
+        Returns:
+            list(str): the words, each phrase replaced by its replacement
+        """
+        if self.longest <= 1:
+            return [self.words.get(word, word) for word in words]
+        end_key = self._END
+        replaced = []
+        idx = 0
+        while idx < len(words):
+            node = self._trie.get(words[idx])
+            replacement, end = words[idx], idx + 1
+            position = idx + 1
+            while node is not None:
+                if end_key in node:
+                    replacement, end = node[end_key], position
+                if position == len(words):
+                    break
+                node = node.get(words[position])
+                position += 1
+            replaced.append(replacement)
+            idx = end
+        return replaced
+
+
+# {id(phrases): (phrases, PhraseReplacer(phrases))} of phrase_replacer()
+_PHRASE_REPLACERS = {}
+_PHRASE_REPLACERS_SIZE = 64
+
+
+def _strip_final_hyphen(utterance):
+    # Remove trailing whitespaces from utterance along with orphaned
+    # hyphens, more characters may be added later
+    return _FINAL_HYPHEN.sub('', utterance)
+
+
+_FINAL_HYPHEN = re.compile(r'- *$')
+
+
+def cached_normalizer(normalizer_class, config):
+    """
+    The normalizer_class with its default config updated with config.
+
+    Each is built once and kept, so that what normalize() compiles from
+    its config is reused.
+
+    Args:
+        normalizer_class (type): a subclass of Normalizer
+        config (dict): normalize.json settings to change
+
+    Returns:
+        Normalizer
+    """
+    key = (normalizer_class, _hashable(config))
+    normalizer = _NORMALIZERS.get(key)
+    if normalizer is None:
+        normalizer = _NORMALIZERS[key] = normalizer_class(
+            dict(normalizer_class._default_config, **config))
+    return normalizer
+
+
+def _hashable(value):
+    if isinstance(value, PhraseReplacer):
+        # shared as it is, and kept alive by the normalizer built from it
+        return PhraseReplacer, id(value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item))
+                            for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+_NORMALIZERS = {}
+
+
+class Tokenizer:
+    """
+    Splits text into words, and finds where each word is.
+
+    The text is split on whitespace, and by the splitting rules of a
+    language, like "12%" into "12" and "%". A rule is (character, pattern,
+    replacement): text with the character in it has the pattern replaced,
+    the replacement putting spaces where the text is split. Rules never
+    look past a space, so a word is split the same way wherever it is.
+
+    Args:
+        splits ((str, re.Pattern, str)): the splitting rules, in the order
+            they are applied
+        drop_final_hyphen (bool): drop a "-" ending the text
+        cache_size (int): the number of words split_word() remembers
+    """
+
+    def __init__(self, splits=(), drop_final_hyphen=False, cache_size=10000):
+        self.splits = tuple(splits)
+        self.drop_final_hyphen = drop_final_hyphen
+        self.cache_size = cache_size
+        self._parts = {}
+
+    def _split(self, text):
+        for char, pattern, replacement in self.splits:
+            if char in text:
+                text = pattern.sub(replacement, text)
+        return text.split()
+
+    def split_word(self, word):
+        """
+        The words a word without whitespace is split into, remembered.
+
+        Args:
+            word (str): the word
+
+        Returns:
+            [str]: shared with later calls, so not to be changed
+        """
+        parts = self._parts.get(word)
+        if parts is None:
+            if len(self._parts) >= self.cache_size:
+                self._parts.clear()
+            parts = self._parts[word] = self._split(word)
+        return parts
+
+    def words(self, text):
+        """
+        The words of a text.
+
+        Args:
+            text (str): the text to split
+
+        Returns:
+            [str]
+        """
+        words = self._split(text)
+        if self.drop_final_hyphen and words and words[-1] == '-':
+            words.pop()
+        return words
+
+    def offsets(self, text, words):
+        """
+        Where each of words(text) is in the text.
+
+        Args:
+            text (str): the split text
+            words [str]: words(text)
+
+        Returns:
+            [(int, int)]: the character offsets of the start and end
+                          (exclusive) of each word
+        """
+        if text.count(" ") == len(words) - 1 and " ".join(words) == text:
+            # the words are one space apart, as they usually are, so their
+            # ends are counted without a loop in Python
+            lengths = list(map(len, words))
+            ends = list(map(add, accumulate(lengths), count()))
+            return list(zip(map(sub, ends, lengths), ends))
+        # each word starts at the first character after the word before it
+        # which isn't whitespace, which is where it is found
+        offsets = []
+        position = 0
+        find = text.find
+        for word in words:
+            start = find(word, position)
+            if start < 0:  # a rule changed the word
+                start = position
+            position = start + len(word)
+            offsets.append((start, position))
+        return offsets
+
+    def spans(self, text):
+        """
+        The words of a text, and where each of them is.
+
+        Args:
+            text (str): the text to split
+
+        Returns:
+            [(str, int, int)]: each word, with the character offsets of its
+                               start and end (exclusive) in the text
+        """
+        words = self.words(text)
+        return [(word, start, end) for word, (start, end)
+                in zip(words, self.offsets(text, words))]
+
+
+_WHITESPACE = Tokenizer()
+
+
+class Token:
+    """
+    A word of a string, and its index among the words of that string.
+
+    Token is intended to be used in the number processing functions in
+    this module. The parsing requires slicing and dividing of the original
+    text. To ensure things parse correctly, we need to know where text came
+    from in the original input, hence the index.
+
+    One is made for every word of a text, so it only has the two slots.
+    """
+    __slots__ = ("word", "index")
+
+    def __init__(self, word, index):
+        self.word = word
+        self.index = index
 
+    def __eq__(self, other):
+        if not isinstance(other, Token):
+            return NotImplemented
+        return self.word == other.word and self.index == other.index
 
-# Token is intended to be used in the number processing functions in
-# this module. The parsing requires slicing and dividing of the original
-# text. To ensure things parse correctly, we need to know where text came
-# from in the original input, hence this nametuple.
-Token = namedtuple('Token', 'word index')
+    def __hash__(self):
+        return hash((self.word, self.index))
+
+    def __repr__(self):
+        return "Token(word={!r}, index={!r})".format(self.word, self.index)
+
+
+# Something found in a string, by character offsets: text[start:end] is the
+# text the value was read from, and kind tells what it is ("number",
+# "duration").
+Span = namedtuple('Span', 'start end value kind')
 
 
 class ReplaceableNumber:
@@ -206,9 +655,11 @@ class ReplaceableNumber:
     the string.
     """
 
+    __slots__ = ("value", "tokens")
+
     def __init__(self, value, tokens: [Token]):
-        self.value = value
-        self.tokens = tokens
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "tokens", tokens)
 
     def __bool__(self):
         return bool(self.value is not None and self.value is not False)
@@ -226,12 +677,7 @@ class ReplaceableNumber:
         return ' '.join([t.word for t in self.tokens])
 
     def __setattr__(self, key, value):
-        try:
-            getattr(self, key)
-        except AttributeError:
-            super().__setattr__(key, value)
-        else:
-            raise Exception("Immutable!")
+        raise Exception("Immutable!")
 
     def __str__(self):
         return "({v}, {t})".format(v=self.value, t=self.tokens)
@@ -255,6 +701,23 @@ def tokenize(text):
             for index, word in enumerate(Normalizer.tokenize(text))]
 
 
+def tokenize_with_offsets(text):
+    """
+    tokenize() a string, and find where each Token is, in a single pass.
+
+    Args:
+        text str: Text to tokenize.
+
+    Returns:
+        ([Token], [(int, int)]): the tokens, and the character offsets of
+                                 the start and end (exclusive) of each
+    """
+    tokenizer = Normalizer.tokenizer()
+    words = tokenizer.words(text)
+    return (list(map(Token, words, count())),
+            tokenizer.offsets(text, words))
+
+
 def partition_list(items, split_on):
     """
     Partition a list of items.
@@ -285,6 +748,216 @@ def partition_list(items, split_on):
     return list(filter(lambda x: len(x) != 0, splits))
 
 
+def split_number_segments(tokens, is_number_word, markers=()):
+    """
+    Split a list of Tokens into segments which can be searched for numbers
+    independently of each other.
+
+    A number never spans a word which can't be part of a number, so the
+    text is cut at such words. The exception are fraction and decimal
+    markers ('and', 'point') which appear only once in the text: those join
+    the closest numbers on each side, as in "two cups and a half", so the
+    words in between are kept in the marker's segment. Only the tokens
+    given are counted, so a part of a text may be split differently than
+    the whole of it.
+
+    Args:
+        tokens [Token]: the tokens to split, in order.
+        is_number_word callable: should return True if a word may be part
+            of a number, including articles and negatives. Called once per
+            distinct word.
+        markers (set(str)): fraction and decimal markers, if fractions and
+            decimals are being searched for.
+
+    Returns:
+        [[Token]]
+
+    """
+    known_words = {}
+    keep = []
+    marker_counts = {}
+    for token in tokens:
+        if token.word not in known_words:
+            known_words[token.word] = bool(is_number_word(token.word))
+        keep.append(known_words[token.word])
+        if token.word in markers:
+            marker_counts[token.word] = marker_counts.get(token.word, 0) + 1
+
+    for idx, token in enumerate(tokens):
+        # partition_list() only splits on a marker in the middle of the text
+        if marker_counts.get(token.word) != 1 or \
+                not 0 < idx < len(tokens) - 1:
+            continue
+        keep[idx] = True
+        for step in (-1, 1):
+            other = idx + step
+            while 0 <= other < len(tokens) and not keep[other]:
+                other += step
+            if 0 <= other < len(tokens):
+                for between in range(min(idx, other), max(idx, other)):
+                    keep[between] = True
+
+    segments = []
+    current_segment = []
+    for token, kept in zip(tokens, keep):
+        if kept:
+            current_segment.append(token)
+        elif current_segment:
+            segments.append(current_segment)
+            current_segment = []
+    if current_segment:
+        segments.append(current_segment)
+    return segments
+
+
+# Segments shorter than this are read whole: cutting them into numbers
+# costs more than it saves
+_SHORT_SEGMENT = 8
+
+
+def extract_numbers_with_text(tokens, extract_number, is_number_word,
+                              markers=()):
+    """
+    Extract all numbers from a list of Tokens, with the words that
+    represent them.
+
+    Finding a number and starting over with that number replaced by
+    placeholders is quadratic in the length of the text. Instead, the text
+    is cut into the segments of split_number_segments(), and each segment
+    into its numbers by number_pieces(), in one pass from left to right.
+    Each piece holds one number, or the numbers around a marker, and is
+    read on its own. Short segments, as in most sentences, are read whole.
+
+    A word which the language ignores, like "half" with ordinals=None, no
+    longer hides the numbers that follow it, so normalize("half of twenty")
+    gives "half of 20".
+
+    Args:
+        tokens [Token]: the tokens to parse.
+        extract_number callable: extracts the first number found in a list
+            of Tokens, as a ReplaceableNumber.
+        is_number_word callable: see split_number_segments()
+        markers (set(str)): see split_number_segments()
+
+    Returns:
+        [ReplaceableNumber]: sorted by position in the text
+
+    """
+    numbers = {}
+    joins = {}
+
+    def is_number(word):
+        """ Whether the word is a number on its own """
+        if word not in numbers:
+            numbers[word] = extract_number([Token(word, 0)])
+        return bool(numbers[word])
+
+    def joined(previous, word):
+        """ Whether the second word is read as part of the number before """
+        if previous in markers or word in markers or \
+                not is_number(previous) or not is_number(word):
+            # e.g. an article or a negative, which belongs to what
+            # follows, or a word the language ignores. Markers are kept
+            # with their numbers by number_pieces().
+            return True
+        if (previous, word) not in joins:
+            number = extract_number([Token(previous, 0), Token(word, 1)])
+            # Some languages keep only the last words of a number with
+            # its value, so a changed value also counts
+            joins[previous, word] = bool(number) and \
+                number.end_index == 1 and \
+                (number.start_index == 0 or
+                 number.value != numbers[word].value)
+        return joins[previous, word]
+
+    results = []
+    for segment in split_number_segments(tokens, is_number_word, markers):
+        pieces = [segment] if len(segment) < _SHORT_SEGMENT else \
+            number_pieces(segment, joined, is_number, markers)
+        for piece in pieces:
+            if len(piece) == 1 and is_number(piece[0].word) and \
+                    len(numbers[piece[0].word].tokens) == 1:
+                # already read by is_number()
+                results.append(ReplaceableNumber(
+                    numbers[piece[0].word].value, piece))
+            else:
+                results.extend(_extract_numbers_in_segment(piece,
+                                                           extract_number))
+    return results
+
+
+def number_pieces(segment, joined, is_number, markers=()):
+    """
+    Cut a segment of split_number_segments() into its numbers.
+
+    A new number starts at each word which the language does not read
+    together with the word before it, as in "two" + "three", while
+    "twenty" + "two" and "two" + "hundred" stay together. A marker keeps
+    the closest numbers on each side in its piece, along with what is in
+    between, as in "two cups and a half".
+
+    Args:
+        segment [Token]: a segment of split_number_segments()
+        joined callable: joined(previous, word) should return True if the
+            second word is read as part of the number before it.
+        is_number callable: should return True if a word is a number on
+            its own
+        markers (set(str)): see split_number_segments()
+
+    Returns:
+        [[Token]]: the pieces, in order
+
+    """
+    words = [token.word for token in segment]
+    starts = [idx > 0 and not joined(words[idx - 1], words[idx])
+              for idx in range(len(words))]
+    marker_positions = [idx for idx, word in enumerate(words)
+                        if word in markers]
+    if len(set(words[idx] for idx in marker_positions)) < \
+            len(marker_positions):
+        # a marker found twice is never used, whatever the pieces
+        return [segment]
+    for idx in marker_positions:
+        left = idx - 1
+        while left > 0 and (words[left] in markers or
+                            not is_number(words[left])):
+            left -= 1
+        right = idx + 1
+        while right < len(words) - 1 and (words[right] in markers or
+                                          not is_number(words[right])):
+            right += 1
+        for between in range(max(left, 0) + 1, min(right + 1, len(words))):
+            starts[between] = False
+
+    pieces = []
+    for token, start in zip(segment, starts):
+        if start or not pieces:
+            pieces.append([])
+        pieces[-1].append(token)
+    return pieces
+
+
+def _extract_numbers_in_segment(tokens, extract_number):
+    placeholder = "<placeholder>"  # inserted to maintain correct indices
+    results = []
+    while True:
+        to_replace = extract_number(tokens)
+
+        if not to_replace:
+            break
+
+        results.append(to_replace)
+
+        # the segments of split_number_segments() are not shared, so the
+        # words of the number are replaced in place
+        start, end = to_replace.start_index, to_replace.end_index
+        for position, token in enumerate(tokens):
+            if start <= token.index <= end:
+                tokens[position] = Token(placeholder, token.index)
+    results.sort(key=lambda n: n.start_index)
+    return results
+
+
 def invert_dict(original):
     """
     Produce a dictionary with the keys and values
@@ -335,53 +1008,920 @@ def look_for_fractions(split_list):
     return False
 
 
+def split_words(text):
+    """
+    Split a string on whitespace, keeping track of where each word is.
+
+    Args:
+        text str: the string to split
+
+    Returns:
+        [(str, int, int)]: each word, with the character offsets of its start
+                           and end (exclusive) in the string
+
+    """
+    return _WHITESPACE.spans(text)
+
+
+def number_word_classifier(extract_handler, joiners=(),
+                           short_scale=True, ordinals=False,
+                           decimal_markers=(), zero_words=()):
+    """
+    Build a classifier for find_number_spans() out of a
+    language's extract_number function.
+
+    A word may be part of a number if it is a number on its own, or if it
+    is one of the joining words of the language, like 'and' in
+    "three and a half", or one of its decimal markers, like 'point' in
+    "three point five", or a word for zero, as in "three point zero five".
+
+    Args:
+        extract_handler (function): function that extracts a number from a
+            string, like extract_number_de
+        joiners (set(str)): lowercase words which only ever join numbers
+        short_scale (bool): passed to extract_handler
+        ordinals (bool): passed to extract_handler
+        decimal_markers (set(str)): lowercase words between the whole and
+            the decimal part of a number
+        zero_words (set(str)): lowercase words for zero. Zeros written as
+            digits, like "0", always count.
+
+    Returns:
+        function: classify(word) -> bool
+    """
+    def classify(word):
+        lower = word.lower()
+        return lower in joiners or lower in decimal_markers or \
+            _is_zero(lower, zero_words) or \
+            bool(extract_handler(word, short_scale, ordinals))
+    return classify
+
+
+def _is_zero(word, zero_words):
+    return word in zero_words or (word.isdigit() and not word.strip("0"))
+
+
+def number_word_combiner(extract_handler, short_scale=True, ordinals=False,
+                         decimal_markers=(), zero_words=(), joiners=()):
+    """
+    Build a combiner for find_number_spans() out of a language's
+    extract_number function.
+
+    Starting at a word which is a number on its own, the number grows by one
+    word, or by two to step over a joiner or decimal marker, as long as the
+    language reads the longer text as a new value: "twenty" + "two" is 22,
+    a value neither part has on its own, while "twenty" + "forty" reads as
+    either 20 or 40, which makes two numbers. "one" (or "a") followed by a
+    fraction, as in "one half", is the exception.
+
+    After a decimal marker the number may also grow over any zeros, as in
+    "three point zero five". Zeros anywhere else end a number.
+
+    Args:
+        extract_handler (function): function that extracts a number from a
+            string, like extract_number_de
+        short_scale (bool): passed to extract_handler
+        ordinals (bool): passed to extract_handler
+        decimal_markers (set(str)): lowercase words between the whole and
+            the decimal part of a number
+        zero_words (set(str)): lowercase words for zero. Zeros written as
+            digits, like "0", always count.
+        joiners (set(str)): lowercase words which only ever join numbers
+
+    Returns:
+        function: combine(words) -> [(value, first, last)]
+    """
+    def extract(words):
+        return extract_handler(" ".join(words), short_scale, ordinals)
+
+    def steps(words, zeros, last):
+        """ The words a number ending at words[last] may grow to """
+        following = last + 1
+        if following >= len(words) or zeros[following]:
+            return
+        yield following
+        skipped = words[following].lower()
+        if skipped in decimal_markers:
+            following += 1
+            while following < len(words) - 1 and zeros[following]:
+                following += 1
+        elif skipped in joiners:
+            following += 1
+        else:
+            return
+        if following < len(words) and not zeros[following]:
+            yield following
+
+    def combine(words):
+        zeros = [_is_zero(word.lower(), zero_words) for word in words]
+        numbers = []
+        first = 0
+        while first < len(words):
+            value = extract(words[first:first + 1])
+            if not value:
+                first += 1
+                continue
+            last = first
+            grown = True
+            while grown:
+                grown = False
+                for following in steps(words, zeros, last):
+                    combined = extract(words[first:following + 1])
+                    if not combined or combined == value:
+                        continue
+                    tail = extract(words[following:following + 1])
+                    if combined != tail or \
+                            value == 1 and tail and 0 < tail < 1:
+                        value, last, grown = combined, following, True
+                        break
+            numbers.append((value, first, last))
+            first = last + 1
+        return numbers
+    return combine
+
+
+def find_number_spans(text, classify, combine):
+    """
+    Find all numbers in a string, and where they are.
+
+    Language agnostic: the string is split into words, and each run of
+    consecutive words which the language's classifier accepts is handed to
+    its combiner, which splits the run into numbers. Each word is looked at
+    once, and combiners only see the (short) runs, so this is linear in the
+    length of the string.
+
+    Args:
+        text (str): the string to extract numbers from
+        classify (function): classify(word) -> bool, True if the word may be
+            part of a number. Called once per distinct word.
+        combine (function): combine(words) -> [(value, first, last)], the
+            numbers in a run of words, with the positions of their first and
+            last words in the run.
+            See number_word_classifier() and number_word_combiner().
+
+    Returns:
+        [Span]: in the order they appear in the string
+    """
+    words = split_words(text)
+    known_words = {}
+    spans = []
+    run_start = None
+    for idx in range(len(words) + 1):
+        if idx < len(words):
+            word = words[idx][0]
+            if word not in known_words:
+                known_words[word] = bool(classify(word))
+            if known_words[word]:
+                if run_start is None:
+                    run_start = idx
+                continue
+        if run_start is not None:
+            run = words[run_start:idx]
+            for value, first, last in combine([w[0] for w in run]):
+                spans.append(Span(run[first][1], run[last][2], value,
+                                  "number"))
+            run_start = None
+    return spans
+
+
+def extract_numbers_spans_generic(text, extract_handler, short_scale=True,
+                                  ordinals=False, joiners=(),
+                                  decimal_markers=(), zero_words=()):
+    """
+    Find all numbers in a string, and where they are, using a language's
+    extract_number function.
+
+    Args:
+        text (str): the string to extract numbers from
+        extract_handler (function): function that extracts a number
+            from a string
+        short_scale (bool): passed to extract_handler
+        ordinals (bool): passed to extract_handler
+        joiners (set(str)): lowercase words joining the parts of a number,
+            like 'and' in "three and a half"
+        decimal_markers (set(str)): lowercase words between the whole and
+            the decimal part of a number, like 'point' in "three point five"
+        zero_words (set(str)): lowercase words for zero, which may follow a
+            decimal marker
+    Returns:
+        [Span]: in the order they appear in the string
+    """
+    spans = find_number_spans(
+        text,
+        number_word_classifier(extract_handler, joiners, short_scale,
+                               ordinals, decimal_markers, zero_words),
+        number_word_combiner(extract_handler, short_scale, ordinals,
+                             decimal_markers, zero_words, joiners))
+    return join_trailing_fractions(text, spans, extract_handler,
+                                   short_scale, ordinals, joiners)
+
+
+def join_trailing_fractions(text, spans, extract_handler, short_scale=True,
+                            ordinals=False, joiners=()):
+    """
+    Join a number to a fraction said after the thing it counts, as in
+    "one cup and a half".
+
+    find_number_spans() only joins words next to each other, so this looks
+    for a number, one other word, a joiner, and a fraction, and joins them
+    where the language reads the whole text as their sum.
+
+    Args:
+        text (str): the string the spans were found in
+        spans [Span]: from find_number_spans(text, ...)
+        extract_handler (function): function that extracts a number from a
+            string, like extract_number_de
+        short_scale (bool): passed to extract_handler
+        ordinals (bool): passed to extract_handler
+        joiners (set(str)): lowercase words which only ever join numbers
+
+    Returns:
+        [Span]: in the order they appear in the string
+    """
+    joined = []
+    for span in spans:
+        if joined and 0 < span.value < 1:
+            previous = joined[-1]
+            between = text[previous.end:span.start].split()
+            if len(between) == 2 and between[1].lower() in joiners and \
+                    between[0].lower() not in joiners:
+                value = extract_handler(text[previous.start:span.end],
+                                        short_scale, ordinals)
+                if value and value == previous.value + span.value:
+                    joined[-1] = previous._replace(end=span.end,
+                                                   value=value)
+                    continue
+        joined.append(span)
+    return joined
+
+
+def token_offsets(text, tokens):
+    """
+    Find where each Token of tokenize(text) is in the text.
+
+    Tokenizing only ever splits the text, so the words of the tokens are
+    found in order.
+
+    Args:
+        text (str): the tokenized string
+        tokens [Token]: tokenize(text)
+
+    Returns:
+        [(int, int)]: the character offsets of the start and end (exclusive)
+                      of each token
+    """
+    offsets = []
+    position = 0
+    for token in tokens:
+        start = text.find(token.word, position)
+        if start < 0:  # the token was changed after tokenizing
+            start = position
+        position = start + len(token.word)
+        offsets.append((start, position))
+    return offsets
+
+
+def replaceable_number_spans(text, tokens, numbers, offsets=None):
+    """
+    Convert numbers found in tokenize(text) into Spans of the text.
+
+    Args:
+        text (str): the tokenized string
+        tokens [Token]: tokenize(text)
+        numbers [ReplaceableNumber]: the numbers found in the tokens
+        offsets [(int, int)]: the offsets of tokenize_with_offsets(text),
+                              found again from the tokens if not given
+
+    Returns:
+        [Span]: with float values, in the order of numbers
+    """
+    if offsets is None:
+        offsets = token_offsets(text, tokens)
+    return [Span(offsets[number.start_index][0],
+                 offsets[number.end_index][1],
+                 float(number.value), "number")
+            for number in numbers]
+
+
 def extract_numbers_generic(text, pronounce_handler, extract_handler,
-                            short_scale=True, ordinals=False):
+                            short_scale=True, ordinals=False, joiners=(),
+                            decimal_markers=(), zero_words=()):
     """
         Takes in a string and extracts a list of numbers.
         Language agnostic, per language parsers need to be provided
 
     Args:
         text (str): the string to extract a number from
-        pronounce_handler (function): function that pronounces a number
-        extract_handler (function): function that extracts the last number
-        present in a string
+        pronounce_handler (function): unused, kept for compatibility
+        extract_handler (function): function that extracts a number
+            from a string
         short_scale (bool): Use "short scale" or "long scale" for large
             numbers -- over a million.  The default is short scale, which
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        joiners (set(str)): lowercase words joining the parts of a number,
+            like 'and' in "three and a half"
+        decimal_markers (set(str)): lowercase words between the whole and
+            the decimal part of a number, like 'point' in "three point five"
+        zero_words (set(str)): lowercase words for zero, which may follow a
+            decimal marker
     Returns:
         list: list of extracted numbers as floats
     """
-    numbers = []
-    normalized = text
-    extract = extract_handler(normalized, short_scale, ordinals)
-    to_parse = normalized
-    while extract:
-        numbers.append(extract)
-        prev = to_parse
-        num_txt = pronounce_handler(extract)
-        extract = str(extract)
-        if extract.endswith(".0"):
-            extract = extract[:-2]
-
-        # handle duplicate occurences, replace last one only
-        def replace_right(source, target, replacement, replacements=None):
-            return replacement.join(source.rsplit(target, replacements))
-
-        normalized = replace_right(normalized, num_txt, extract, 1)
-        # last biggest number was replaced, recurse to handle cases like
-        # test one two 3
-        to_parse = replace_right(to_parse, num_txt, extract, 1)
-        to_parse = replace_right(to_parse, extract, " ", 1)
-        if to_parse == prev:
-            # avoid infinite loops, occasionally pronounced number may be
-            # different from extracted text,
-            # ie pronounce(0.5) != half and extract(half) == 0.5
-            extract = False
-            # TODO fix this
+    spans = extract_numbers_spans_generic(text, extract_handler,
+                                          short_scale, ordinals, joiners,
+                                          decimal_markers, zero_words)
+    return [span.value for span in spans]
+
+
+def iter_spans(chunks, extract_spans, context_words=8, max_pending=65536):
+    """
+    Find Spans in a text which arrives in pieces, such as lines of a file.
+
+    The text is parsed a window at a time. The last `context_words` words
+    of each window, along with any span reaching into them, are held back
+    and parsed again with the next chunk, so that a number split across
+    chunks, like "two hundred" + " five", is still found whole.
+
+    Whatever `extract_spans` decides from the text as a whole only sees the
+    current window. With split_number_segments(), a marker such as 'and'
+    found once in the window joins the numbers around it even if the whole
+    text has it several times, so "two and a half" may give 2.5 here but 2
+    and 0.5 from the whole text, when other 'and's are further back.
+
+    Args:
+        chunks (iterable(str)): the text, in order
+        extract_spans (function): returns the [Span] found in a string
+        context_words (int): words held back at the end of each window.
+            Must be at least 1.
+        max_pending (int): number of characters held back past which they
+            are parsed regardless, which bounds memory use. A number longer
+            than this may be split in two.
+
+    Yields:
+        Span: in order, with offsets into the whole text
+    """
+    pending = ""
+    offset = 0  # position of pending[0] in the whole text
+    for chunk in chunks:
+        pending += chunk
+        words = split_words(pending)
+        if words and words[-1][2] == len(pending):
+            words.pop()  # may continue in the next chunk
+        if len(words) <= context_words:
+            continue
+        complete = words[-1][2]
+        cut = words[-context_words][1]
+        spans = extract_spans(pending[:complete])
+        for span in spans:
+            if span.start < cut < span.end:
+                cut = span.start
+        if len(pending) - cut > max_pending:
+            cut = complete
+        for span in spans:
+            if span.end <= cut:
+                yield span._replace(start=span.start + offset,
+                                    end=span.end + offset)
+        pending = pending[cut:]
+        offset += cut
+    for span in extract_spans(pending):
+        yield span._replace(start=span.start + offset,
+                            end=span.end + offset)
+
+
+# The results analyze() can return, by the name used in its `want` argument
+ANALYSES = ("numbers", "duration", "datetime", "normalized")
+
+
+def analyses_wanted(want=None):
+    """
+    Check the `want` argument of analyze().
+
+    Args:
+        want (iterable(str)): names from ANALYSES, or None for all of them
+
+    Returns:
+        set(str): the names wanted
+    """
+    if want is None:
+        return set(ANALYSES)
+    if isinstance(want, str):
+        want = [want]
+    want = set(want)
+    unknown = want.difference(ANALYSES)
+    if unknown:
+        raise ValueError("Unknown analyses: " + ", ".join(sorted(unknown)) +
+                         ". Expected any of: " + ", ".join(ANALYSES))
+    return want
+
+
+def compile_duration_regex(units, suffix="", separator=r"(?:\s+|\-)",
+                           end=""):
+    """
+    Compile one regex matching a number followed by any duration unit.
+
+    The regex has a "value" group, for the number, and a "unit" group, for
+    the unit word as it appears in `units`. Where one unit word starts with
+    another, the first in `units` is tried first.
+
+    Args:
+        units (dict): timedelta keyword, like "minutes", by unit word
+        suffix (str): regex for the inflected endings a unit word may have
+        separator (str): regex for what comes between number and unit
+        end (str): regex for what must follow the unit, consumed with it
+
+    Returns:
+        (re.Pattern): the compiled regex
+    """
+    return re.compile(r"(?P<value>\d+(?:\.?\d+)?)" + separator +
+                      "(?P<unit>" + "|".join(map(re.escape, units)) + ")" +
+                      suffix + end)
+
+
+def extract_duration_with_regex(text, regex, units):
+    """
+    Remove every duration matched by a compile_duration_regex() regex.
+
+    Args:
+        text (str): string containing durations, numbers written as digits
+        regex (re.Pattern): from compile_duration_regex(units)
+        units (dict): timedelta keyword by unit word, as given to the regex
+
+    Returns:
+        (timedelta, str): the sum of the durations, or None if there are
+                          none, and the rest of the text, stripped
+    """
+    time_units = {}
+
+    def repl(match):
+        unit = units[match.group("unit")]
+        time_units[unit] = time_units.get(unit, 0) + \
+            float(match.group("value"))
+        return ''
+    text = regex.sub(repl, text).strip()
+    duration = timedelta(**time_units) if any(time_units.values()) else None
+    return duration, text
+
+
+# Month names as datetime.strptime() reads them
+_MONTHS_STRPTIME = ('january', 'february', 'march', 'april', 'may', 'june',
+                    'july', 'august', 'september', 'october', 'november',
+                    'december')
+
+
+class DatetimeRules:
+    """
+    The words of one language read by extract_date_words(), and by the
+    time of day parser of extract_datetime_xx()
+
+    Arguments:
+        weekdays (iterable(str)): names of the days, monday first
+        months (iterable(str)): names of the months, january first
+        months_short (iterable(str)): abbreviated months, january first.
+            They are ignored once a word of from_words was read.
+        qualifiers_am (iterable(str)): words for a part of the morning
+        qualifiers_pm (iterable(str)): words for a part of the afternoon,
+            evening or night
+        relative_days (dict): day offset by phrase, a tuple of words like
+            ("tomorrow",) or ("day", "after", "tomorrow"). Phrases sharing
+            a first word are tried in the order given.
+        after_article (iterable(tuple)): phrases of relative_days that may
+            follow one of articles, and are not read after a number
+        units (dict): "days", "weeks", "months" or "years" by word, as in
+            "5 days", "next week"
+        year_multiples (dict): years in one of each, by word, as in "2
+            decades"
+        couple (str): the word between "2" and a unit in "2 of decades"
+        couple_units (dict): "weeks", "months" or "years", by the word for
+            them that may follow couple
+        next_words, last_words (iterable(str)): "next" and "last"
+        this_words (iterable(str)): "this", consumed before a date
+        now_words (iterable(str)): "now"
+        from_words (iterable(str)): "from" and "after", as in "5 days from
+            tomorrow"
+        ago (str): word after a day count that makes it negative, as in
+            "2 days ago"
+        ago_before (str): word before a day count that makes it negative
+        articles (iterable(str)): see after_article
+        month_day_joiner (str): the "of" in "15 of july"
+        month_homographs (dict): words that are not the month they spell
+            when followed by one of some words, by month name, like "may"
+            in "may i"
+        markers (iterable(str)): words consumed before a date or time, like
+            "at" or "on"
+        recur_markers (iterable(str)): words like "mondays" or "weekend"
+        joiner (str): "and", removed when between two consumed words
+        normalize (callable): function of a word, reducing it to the form
+            found in these rules
+        normalize_context (bool): normalize the words around a word too
+        extract_number (callable): extract_number_xx(text)
+    """
+
+    def __init__(self, weekdays, months, months_short=(), qualifiers_am=(),
+                 qualifiers_pm=(), relative_days=None, after_article=(),
+                 units=None, year_multiples=None, couple=None,
+                 couple_units=None, next_words=(), last_words=(),
+                 this_words=(), now_words=(), from_words=(), ago=None,
+                 ago_before=None, articles=(), month_day_joiner=None,
+                 month_homographs=None, markers=(), recur_markers=(),
+                 joiner="and", normalize=None, normalize_context=False,
+                 extract_number=None):
+        self.relative_days = dict(relative_days or {})
+        self.after_article = frozenset(after_article)
+        self.units = dict(units or {})
+        self.year_multiples = dict(year_multiples or {})
+        self.couple = couple
+        self.couple_units = dict(couple_units or {})
+        self.next_words = frozenset(next_words)
+        self.last_words = frozenset(last_words)
+        self.this_words = frozenset(this_words)
+        self.now_words = frozenset(now_words)
+        self.from_words = frozenset(from_words)
+        self.ago = ago
+        self.ago_before = ago_before
+        self.articles = frozenset(articles)
+        self.month_day_joiner = month_day_joiner
+        self.month_homographs = {month: frozenset(words) for month, words
+                                 in (month_homographs or {}).items()}
+        self.markers = frozenset(markers)
+        self.recur_markers = frozenset(recur_markers)
+        self.qualifiers_am = frozenset(qualifiers_am)
+        self.qualifiers_pm = frozenset(qualifiers_pm)
+        self.joiner = joiner
+        self.normalize = normalize or (lambda word: word)
+        self.normalize_context = normalize_context
+        self.extract_number = extract_number
+
+        # (category, value) by word, where category is one of
+        #   weekday     - value is the day of the week, 0 for monday
+        #   month       - value is the month, 0 for january
+        #   month_short - the same, for an abbreviated month
+        #   qualifier   - value is "am" or "pm"
+        self.words = {}
+        self.words.update((month, ('month_short', idx))
+                          for idx, month in enumerate(months_short))
+        self.words.update((month, ('month', idx))
+                          for idx, month in enumerate(months))
+        self.words.update((day, ('weekday', idx))
+                          for idx, day in enumerate(weekdays))
+        self.words.update((word, ('qualifier', 'am'))
+                          for word in qualifiers_am)
+        self.words.update((word, ('qualifier', 'pm'))
+                          for word in qualifiers_pm)
+        # phrases of relative_days by their first word
+        self.phrases = {}
+        for phrase in self.relative_days:
+            self.phrases.setdefault(phrase[0], []).append(phrase)
+        self.from_followups = frozenset(
+            [word for word, (category, _) in self.words.items()
+             if category != 'qualifier'] +
+            [phrase[0] for phrase in self.relative_days if len(phrase) == 1] +
+            list(self.next_words | self.last_words | self.this_words |
+                 self.now_words))
+
+
+class DatetimeState:
+    """
+    What extract_datetime_xx() read so far, for datetime_from_state()
+    """
+
+    def __init__(self):
+        self.found = False
+        self.from_flag = False
+        self.day_specified = False
+        self.day_offset = False
+        self.month_offset = 0
+        self.year_offset = 0
+        self.datestr = ""
+        self.has_year = False
+        self.time_qualifier = ""
+        self.hr_offset = 0
+        self.min_offset = 0
+        self.sec_offset = 0
+        self.hr_abs = None
+        self.min_abs = None
+        # set when the text was "now", to the [datetime, str] to return
+        self.result = None
+
+
+def extract_date_words(words, anchorDate, rules):
+    """
+    Read the words of a date, like "next tuesday" or "june 5th", in one
+    pass. The words read are replaced by "" in `words`, which the time of
+    day parser of the language reads next.
+
+    Args:
+        words (list(str)): the words of the text, cleaned by the language
+        anchorDate (datetime): the date "tomorrow" etc. are relative to
+        rules (DatetimeRules): the words of the language
+
+    Returns:
+        DatetimeState: what was read
+    """
+    state = DatetimeState()
+    today = int(anchorDate.strftime("%w"))
+    normalize = rules.normalize
+    if rules.normalize_context:
+        context = [normalize(word) for word in words]
+    else:
+        context = words
+
+    def consume(idx):
+        words[idx] = ""
+        context[idx] = ""
+
+    for idx, word in enumerate(words):
+        if word == "":
+            continue
+        word = normalize(word)
+        wordPrevPrev = context[idx - 2] if idx > 1 else ""
+        wordPrev = context[idx - 1] if idx > 0 else ""
+        wordNext = context[idx + 1] if idx + 1 < len(words) else ""
+        wordNextNext = context[idx + 2] if idx + 2 < len(words) else ""
+        category, value = rules.words.get(word, (None, None))
+        unit = rules.units.get(word)
+        phrase = None if state.from_flag else \
+            _match_relative_day(word, wordPrev, wordNext, wordNextNext, rules)
+        start = idx
+        used = 0
+
+        if word == rules.ago and state.day_offset:
+            state.day_offset = - state.day_offset
+            used += 1
+        if word in rules.now_words and not state.datestr:
+            resultStr = " ".join(words[idx + 1:])
+            resultStr = ' '.join(resultStr.split())
+            state.result = [anchorDate.replace(microsecond=0), resultStr]
+            return state
+        elif wordNext in rules.year_multiples:
+            multiplier = None
+            if is_numeric(word):
+                multiplier = rules.extract_number(word)
+            multiplier = int(multiplier or 1)
+            used += 2
+            state.year_offset = multiplier * rules.year_multiples[wordNext]
+        elif word == "2" and wordNext == rules.couple and \
+                wordNextNext in rules.year_multiples:
+            used += 3
+            state.year_offset = 2 * rules.year_multiples[wordNextNext]
+        elif word == "2" and wordNext == rules.couple and \
+                wordNextNext in rules.couple_units:
+            used += 3
+            couple_unit = rules.couple_units[wordNextNext]
+            if couple_unit == "years":
+                state.year_offset = 2
+            elif couple_unit == "months":
+                state.month_offset = 2
+            elif couple_unit == "weeks":
+                state.day_offset = 14
+        elif category == "qualifier":
+            state.time_qualifier = word
+        # parse today, tomorrow, day after tomorrow
+        elif phrase:
+            state.day_offset = rules.relative_days[phrase]
+            used += len(phrase)
+            if phrase in rules.after_article and wordPrev in rules.articles:
+                start -= 1
+                used += 1
+        # parse 5 days, 10 weeks, last week, next week
+        elif unit == "days":
+            if wordPrev and wordPrev[0].isdigit():
+                state.day_offset += int(wordPrev)
+                start -= 1
+                used = 2
+                if wordPrevPrev == rules.ago_before:
+                    state.day_offset = -state.day_offset
+                    used += 1
+                    start -= 1
+        # parse 10 months, next month, last month, 5 years
+        elif unit and not state.from_flag and wordPrev:
+            if wordPrev[0].isdigit():
+                count = int(wordPrev)
+            elif wordPrev in rules.next_words:
+                count = 1
+            elif wordPrev in rules.last_words:
+                count = -1
+            else:
+                count = None
+            if count is not None:
+                if unit == "weeks" and wordPrev[0].isdigit():
+                    state.day_offset += count * 7
+                elif unit == "weeks":
+                    state.day_offset = count * 7
+                elif unit == "months":
+                    state.month_offset = count
+                else:
+                    state.year_offset = count
+                start -= 1
+                used = 2
+        # parse Monday, Tuesday, etc., and next Monday,
+        # last Tuesday, etc.
+        elif category == "weekday" and not state.from_flag:
+            state.day_offset = (value + 1) - today
+            used = 1
+            if state.day_offset < 0:
+                state.day_offset += 7
+            if wordPrev in rules.next_words:
+                if state.day_offset <= 2:
+                    state.day_offset += 7
+                used += 1
+                start -= 1
+            elif wordPrev in rules.last_words:
+                state.day_offset -= 7
+                used += 1
+                start -= 1
+        # parse 15 of July, June 20th, Feb 18, 19 of February
+        elif category == "month" or \
+                category == "month_short" and not state.from_flag:
+            used += 1
+            state.datestr = _MONTHS_STRPTIME[value]
+            joined = wordPrev == rules.month_day_joiner and \
+                wordPrevPrev[:1].isdigit()
+            if wordPrev and (wordPrev[0].isdigit() or joined):
+                if joined:
+                    state.datestr += " " + words[idx - 2]
+                    used += 1
+                    start -= 1
+                else:
+                    state.datestr += " " + wordPrev
+                start -= 1
+                used += 1
+                if wordNext and wordNext[0].isdigit():
+                    state.datestr += " " + wordNext
+                    used += 1
+                    state.has_year = True
+                else:
+                    state.has_year = False
+
+            elif wordNext and wordNext[0].isdigit():
+                state.datestr += " " + wordNext
+                used += 1
+                if wordNextNext and wordNextNext[0].isdigit():
+                    state.datestr += " " + wordNextNext
+                    used += 1
+                    state.has_year = True
+                else:
+                    state.has_year = False
+
+            # if no date indicators found, it may not be the month of May
+            # may "i/we" ...
+            elif wordNext in rules.month_homographs.get(word, ()):
+                state.datestr = ""
+
+        # parse 5 days from tomorrow, 10 weeks from next thursday,
+        # 2 months from July
+        if word in rules.from_words and wordNext in rules.from_followups:
+            used = 2
+            state.from_flag = True
+            offset = rules.relative_days.get((wordNext,))
+            nextCategory, nextDay = rules.words.get(wordNext, (None, None))
+            afterCategory, afterDay = rules.words.get(wordNextNext,
+                                                      (None, None))
+            if offset:
+                state.day_offset += offset
+            elif nextCategory == "weekday":
+                tmpOffset = (nextDay + 1) - today
+                used = 2
+                if tmpOffset < 0:
+                    tmpOffset += 7
+                state.day_offset += tmpOffset
+            elif afterCategory == "weekday":
+                tmpOffset = (afterDay + 1) - today
+                used = 3
+                if wordNext in rules.next_words:
+                    if state.day_offset <= 2:
+                        tmpOffset += 7
+                    used += 1
+                    start -= 1
+                elif wordNext in rules.last_words:
+                    tmpOffset -= 7
+                    used += 1
+                    start -= 1
+                state.day_offset += tmpOffset
+        if used > 0:
+            if start - 1 > 0 and words[start - 1] in rules.this_words:
+                start -= 1
+                used += 1
+
+            for i in range(0, used):
+                consume(i + start)
+
+            if start - 1 >= 0 and words[start - 1] in rules.markers:
+                consume(start - 1)
+            state.found = True
+            state.day_specified = True
+    return state
+
+
+def _match_relative_day(word, wordPrev, wordNext, wordNextNext, rules):
+    """ The phrase of rules.relative_days starting at word, or None """
+    following = (word, wordNext, wordNextNext)
+    for phrase in rules.phrases.get(word, ()):
+        if following[:len(phrase)] != phrase:
+            continue
+        if phrase in rules.after_article and \
+                wordPrev and wordPrev[0].isdigit():
+            continue
+        return phrase
+    return None
+
+
+def datetime_from_state(words, anchorDate, state, rules, default_time=None):
+    """
+    The result of extract_datetime_xx(), once it read the text
+
+    Args:
+        words (list(str)): the words of the text, "" where they were read
+        anchorDate (datetime): the date "tomorrow" etc. are relative to
+        state (DatetimeState): what was read
+        rules (DatetimeRules): the words of the language
+        default_time (time): time to set if no time was found in the text
+
+    Returns:
+        [datetime, str]: the datetime and the words that were not read, or
+                         None if no date or time was found
+    """
+    if state.result is not None:
+        return state.result
+    if not (state.found or state.datestr != "" or
+            state.year_offset != 0 or state.month_offset != 0 or
+            state.day_offset is True or state.hr_offset != 0 or
+            state.hr_abs or state.min_offset != 0 or
+            state.min_abs or state.sec_offset != 0):
+        return None
+
+    dayOffset = state.day_offset or 0
+    hrAbs, minAbs = state.hr_abs, state.min_abs
+    currentYear = anchorDate.year
+
+    # perform date manipulation
+
+    extractedDate = anchorDate.replace(microsecond=0)
+
+    if state.datestr != "":
+        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
+        try:
+            temp = datetime.strptime(state.datestr, "%B %d")
+        except ValueError:
+            # Try again, allowing the year
+            temp = datetime.strptime(state.datestr, "%B %d %Y")
+        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
+        if not state.has_year:
+            temp = temp.replace(year=extractedDate.year,
+                                tzinfo=extractedDate.tzinfo)
+            if extractedDate < temp:
+                extractedDate = extractedDate.replace(
+                    year=currentYear, month=temp.month, day=temp.day,
+                    tzinfo=extractedDate.tzinfo)
+            else:
+                extractedDate = extractedDate.replace(
+                    year=currentYear + 1, month=temp.month, day=temp.day,
+                    tzinfo=extractedDate.tzinfo)
+        else:
+            extractedDate = extractedDate.replace(
+                year=temp.year, month=temp.month, day=temp.day,
+                tzinfo=extractedDate.tzinfo)
+    else:
+        # ignore the current HH:MM:SS if relative using days or greater
+        if state.hr_offset == 0 and state.min_offset == 0 and \
+                state.sec_offset == 0:
+            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
+
+    if state.year_offset != 0:
+        extractedDate = extractedDate + relativedelta(years=state.year_offset)
+    if state.month_offset != 0:
+        extractedDate = extractedDate + \
+            relativedelta(months=state.month_offset)
+    if dayOffset != 0:
+        extractedDate = extractedDate + relativedelta(days=dayOffset)
+    if hrAbs != -1 and minAbs != -1:
+        # If no time was supplied in the string set the time to default
+        # time if it's available
+        if hrAbs is None and minAbs is None and default_time is not None:
+            hrAbs, minAbs = default_time.hour, default_time.minute
         else:
-            extract = extract_handler(to_parse, short_scale, ordinals)
-    numbers.reverse()
-    return numbers
+            hrAbs = hrAbs or 0
+            minAbs = minAbs or 0
+
+        extractedDate = extractedDate + relativedelta(hours=hrAbs,
+                                                      minutes=minAbs)
+        if (hrAbs != 0 or minAbs != 0) and state.datestr == "":
+            if not state.day_specified and anchorDate > extractedDate:
+                extractedDate = extractedDate + relativedelta(days=1)
+    if state.hr_offset != 0:
+        extractedDate = extractedDate + relativedelta(hours=state.hr_offset)
+    if state.min_offset != 0:
+        extractedDate = extractedDate + \
+            relativedelta(minutes=state.min_offset)
+    if state.sec_offset != 0:
+        extractedDate = extractedDate + \
+            relativedelta(seconds=state.sec_offset)
+    for idx, word in enumerate(words):
+        if words[idx] == rules.joiner and \
+                words[idx - 1] == "" and words[idx + 1] == "":
+            words[idx] = ""
+
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    return [extractedDate, resultStr]
@@ -13,20 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
-
-from dateutil.relativedelta import relativedelta
+from datetime import timedelta
+from functools import lru_cache
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    extract_numbers_with_text, replaceable_number_spans, Normalizer, \
+    compile_duration_regex, extract_duration_with_regex, DatetimeRules, \
+    extract_date_words, datetime_from_state, cached_normalizer, \
+    tokenize_with_offsets
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_CS  # _ARTICLES_CS
 
 import re
-import json
-from lingua_franca import resolve_resource_file
+from lingua_franca.bundle import read_locale_json
 from lingua_franca.time import now_local
 
 
@@ -138,26 +140,13 @@ def _extract_numbers_with_text_cs(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_cs(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda segment: _extract_number_with_text_cs(
+            segment, short_scale, ordinals, fractional_numbers),
+        lambda word: _extract_whole_number_with_text_cs(
+            [Token(word, 0)], short_scale, ordinals)[1],
+        _FRACTION_MARKER | _DECIMAL_MARKER if fractional_numbers else ())
 
 
 def _extract_number_with_text_cs(tokens, short_scale=True,
@@ -301,7 +290,9 @@ def _extract_decimal_with_text_cs(tokens, short_scale, ordinals):
             decimal = numbers2[0]
 
             # TODO handle number dot number number number
-            if "." not in str(decimal.text):
+            # The decimal part is a whole number, not e.g. "two half"
+            if "." not in str(decimal.text) and \
+                    str(decimal.value).isdigit():
                 return number.value + float('0.' + str(decimal.value)), \
                     number.tokens + partitions[1] + decimal.tokens
     return None, None
@@ -465,7 +456,7 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
                 current_val = val
 
         else:
-            if all([
+            if current_val and all([
                     prev_word in _SUMS,
                     word not in _SUMS,
                     word not in multiplies,
@@ -553,6 +544,7 @@ def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
@@ -599,6 +591,12 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
+# For day: den, dny, dnů - short patern not applicable, list all
+_DURATION_REGEX_CS = compile_duration_regex(_TIME_UNITS_CONVERSION,
+                                            suffix="[ay]?")
+
+
 def extract_duration_cs(text):
     """
     Convert an english phrase into a number of seconds
@@ -628,34 +626,50 @@ def extract_duration_cs(text):
     if not text:
         return None
 
-    # Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
-    # For day: den, dny, dnů - short patern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
     text = _convert_words_to_numbers_cs(text)
-
-    for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return extract_duration_with_regex(text, _DURATION_REGEX_CS,
+                                       _TIME_UNITS_CONVERSION)
+
+
+_WEEKDAYS_CS = ['pondělí', 'úterý', 'středa', 'čtvrtek', 'pátek', 'sobota',
+                'neděle']
+_DATETIME_RULES_CS = DatetimeRules(
+    weekdays=_WEEKDAYS_CS,
+    months=_MONTHS_CZECH,
+    months_short=['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
+                  'zář', 'říj', 'lis', 'pro'],
+    qualifiers_am=['ráno', 'dopoledne'],
+    qualifiers_pm=['odpoledne', 'večer', 'noc', 'noci'],
+    relative_days={
+        ('dnes',): 0,
+        ('zítra',): 1,
+        ('den', 'před', 'včera'): -2,
+        ('před', 'včera'): -2,
+        ('včera',): -1,
+        ('den', 'po', 'zítra'): 2
+    },
+    after_article=[('den', 'po', 'zítra')],
+    units={'den': 'days', 'týden': 'weeks', 'měsíc': 'months',
+           'rok': 'years'},
+    year_multiples={'desetiletí': 10, 'století': 100, 'tisíciletí': 1000},
+    couple='krát',
+    couple_units={'týden': 'weeks', 'měsíc': 'months', 'rok': 'years'},
+    next_words=['další', 'příští'],
+    last_words=['poslední'],
+    this_words=['toto', 'této', 'tento'],
+    now_words=['nyní', 'teď'],
+    from_words=['od', 'po', 'do'],
+    # "před 5 dny", 5 days ago
+    ago_before='před',
+    articles=['ten'],
+    markers=['na', 'v', 'do', 'tento', 'okolo', 'toto', 'během', 'za',
+             'této'],
+    recur_markers=_WEEKDAYS_CS + [d + 'ho' for d in _WEEKDAYS_CS] +
+    ['víkend', 'všední'],
+    joiner='a',
+    normalize=lambda word: _text_cs_inflection_normalize(word, 2),
+    normalize_context=True,
+    extract_number=extract_number_cs)
 
 
 def extract_datetime_cs(text, anchorDate=None, default_time=None):
@@ -750,302 +764,22 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
         return wordList
 
-    def date_found():
-        return found or \
-            (
-                datestr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
-
     if text == "":
         return None
 
     anchorDate = anchorDate or now_local()
-    found = False
-    daySpecified = False
-    dayOffset = False
-    monthOffset = 0
-    yearOffset = 0
-    today = anchorDate.strftime("%w")
-    currentYear = anchorDate.strftime("%Y")
-    fromFlag = False
-    datestr = ""
-    hasYear = False
-    timeQualifier = ""
-
-    timeQualifiersAM = ['ráno', 'dopoledne']
-    timeQualifiersPM = ['odpoledne', 'večer', 'noc', 'noci']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['na', 'v', 'do', 'na', 'tento',
-               'okolo', 'toto', 'během', 'za', 'této']
-    days = ['pondělí', 'úterý', 'středa',
-            'čtvrtek', 'pátek', 'sobota', 'neděle']
-    months = _MONTHS_CZECH
-    recur_markers = days + [d + 'ho' for d in days] + \
-        ['víkend', 'všední']  # Check this
-    monthsShort = ['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
-                   'zář', 'říj', 'lis', 'pro']
-    year_multiples = ["desetiletí", "století", "tisíciletí"]
-    day_multiples = ["týden", "měsíc", "rok"]
-
     words = clean_string(text)
-
-    for idx, word in enumerate(words):
-        if word == "":
-            continue
-
-        word = _text_cs_inflection_normalize(word, 2)
-        wordPrevPrev = _text_cs_inflection_normalize(
-            words[idx - 2], 2) if idx > 1 else ""
-        wordPrev = _text_cs_inflection_normalize(
-            words[idx - 1], 2) if idx > 0 else ""
-        wordNext = _text_cs_inflection_normalize(
-            words[idx + 1], 2) if idx + 1 < len(words) else ""
-        wordNextNext = _text_cs_inflection_normalize(
-            words[idx + 2], 2) if idx + 2 < len(words) else ""
-
-        # this isn't in clean string because I don't want to save back to words
-        #word = word.rstrip('s')
-        start = idx
-        used = 0
-        # save timequalifier for later
-        # if word == "před" and dayOffset:
-        #    dayOffset = - dayOffset
-        #    used += 1
-        if word == "nyní" and not datestr:
-            resultStr = " ".join(words[idx + 1:])
-            resultStr = ' '.join(resultStr.split())
-            extractedDate = anchorDate.replace(microsecond=0)
-            return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
-            multiplier = None
-            if is_numeric(word):
-                multiplier = extract_number_cs(word)
-            multiplier = multiplier or 1
-            multiplier = int(multiplier)
-            used += 2
-            if wordNext == "desetiletí":
-                yearOffset = multiplier * 10
-            elif wordNext == "století":
-                yearOffset = multiplier * 100
-            elif wordNext == "tisíciletí":
-                yearOffset = multiplier * 1000
-        # couple of
-        elif word == "2" and wordNext == "krát" and \
-                wordNextNext in year_multiples:
-            multiplier = 2
-            used += 3
-            if wordNextNext == "desetiletí":
-                yearOffset = multiplier * 10
-            elif wordNextNext == "století":
-                yearOffset = multiplier * 100
-            elif wordNextNext == "tisíciletí":
-                yearOffset = multiplier * 1000
-        elif word == "2" and wordNext == "krát" and \
-                wordNextNext in day_multiples:
-            multiplier = 2
-            used += 3
-            if wordNextNext == "rok":
-                yearOffset = multiplier
-            elif wordNextNext == "měsíc":
-                monthOffset = multiplier
-            elif wordNextNext == "týden":
-                dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
-            timeQualifier = word
-        # parse today, tomorrow, day after tomorrow
-        elif word == "dnes" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "zítra" and not fromFlag:
-            dayOffset = 1
-            used += 1
-        elif word == "den" and wordNext == "před" and wordNextNext == "včera" and not fromFlag:
-            dayOffset = -2
-            used += 3
-        elif word == "před" and wordNext == "včera" and not fromFlag:
-            dayOffset = -2
-            used += 2
-        elif word == "včera" and not fromFlag:
-            dayOffset = -1
-            used += 1
-        elif (word == "den" and
-              wordNext == "po" and
-              wordNextNext == "zítra" and
-              not fromFlag and
-              (not wordPrev or not wordPrev[0].isdigit())):
-            dayOffset = 2
-            used = 3
-            if wordPrev == "ten":
-                start -= 1
-                used += 1
-                # parse 5 days, 10 weeks, last week, next week
-        elif word == "den":
-            if wordPrev and wordPrev[0].isdigit():
-                dayOffset += int(wordPrev)
-                start -= 1
-                used = 2
-                if wordPrevPrev == "před":
-                    dayOffset = -dayOffset
-                    used += 1
-                    start -= 1
-
-        elif word == "týden" and not fromFlag and wordPrev:
-            if wordPrev[0].isdigit():
-                dayOffset += int(wordPrev) * 7
-                start -= 1
-                used = 2
-            elif wordPrev == "další" or wordPrev == "příští":
-                dayOffset = 7
-                start -= 1
-                used = 2
-            elif wordPrev == "poslední":
-                dayOffset = -7
-                start -= 1
-                used = 2
-                # parse 10 months, next month, last month
-        elif word == "měsíc" and not fromFlag and wordPrev:
-            if wordPrev[0].isdigit():
-                monthOffset = int(wordPrev)
-                start -= 1
-                used = 2
-            elif wordPrev == "další" or wordPrev == "příští":
-                monthOffset = 1
-                start -= 1
-                used = 2
-            elif wordPrev == "poslední":
-                monthOffset = -1
-                start -= 1
-                used = 2
-        # parse 5 years, next year, last year
-        elif word == "rok" and not fromFlag and wordPrev:
-            if wordPrev[0].isdigit():
-                yearOffset = int(wordPrev)
-                start -= 1
-                used = 2
-            elif wordPrev == "další" or wordPrev == "příští":
-                yearOffset = 1
-                start -= 1
-                used = 2
-            elif wordPrev == "poslední":
-                yearOffset = -1
-                start -= 1
-                used = 2
-        # parse Monday, Tuesday, etc., and next Monday,
-        # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
-            used = 1
-            if dayOffset < 0:
-                dayOffset += 7
-            if wordPrev == "další" or wordPrev == "příští":
-                if dayOffset <= 2:
-                    dayOffset += 7
-                used += 1
-                start -= 1
-            elif wordPrev == "poslední":
-                dayOffset -= 7
-                used += 1
-                start -= 1
-                # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
-            used += 1
-            # Convert czech months to english
-            datestr = _MONTHS_CONVERSION.get(m)
-            if wordPrev and (wordPrev[0].isdigit() or
-                             (wordPrev == " " and wordPrevPrev[0].isdigit())):
-                if wordPrev == " " and wordPrevPrev[0].isdigit():
-                    datestr += " " + words[idx - 2]
-                    used += 1
-                    start -= 1
-                else:
-                    datestr += " " + wordPrev
-                start -= 1
-                used += 1
-                if wordNext and wordNext[0].isdigit():
-                    datestr += " " + wordNext
-                    used += 1
-                    hasYear = True
-                else:
-                    hasYear = False
-
-            elif wordNext and wordNext[0].isdigit():
-                datestr += " " + wordNext
-                used += 1
-                if wordNextNext and wordNextNext[0].isdigit():
-                    datestr += " " + wordNextNext
-                    used += 1
-                    hasYear = True
-                else:
-                    hasYear = False
-
-            # if no date indicators found, it may not be the month of May
-            # may "i/we" ...
-            # "... may be"
-            # elif word == 'may' and wordNext in ['i', 'we', 'be']:
-            #    datestr = ""
-
-        # parse 5 days from tomorrow, 10 weeks from next thursday,
-        # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("dnes")
-        validFollowups.append("zítra")
-        validFollowups.append("včera")
-        validFollowups.append("další")
-        validFollowups.append("příští")
-        validFollowups.append("poslední")
-        validFollowups.append("teď")
-        validFollowups.append("toto")
-        validFollowups.append("této")
-        validFollowups.append("tento")
-        if (word == "od" or word == "po" or word == "do") and wordNext in validFollowups:
-            used = 2
-            fromFlag = True
-            if wordNext == "zítra":
-                dayOffset += 1
-            elif wordNext == "včera":
-                dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
-                used = 2
-                if tmpOffset < 0:
-                    tmpOffset += 7
-                dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
-                used = 3
-                if wordNext == "další" or wordPrev == "příští":
-                    if dayOffset <= 2:
-                        tmpOffset += 7
-                    used += 1
-                    start -= 1
-                elif wordNext == "poslední":
-                    tmpOffset -= 7
-                    used += 1
-                    start -= 1
-                dayOffset += tmpOffset
-        if used > 0:
-            if start - 1 > 0 and (words[start - 1] == "toto" or words[start - 1] == "této" or words[start - 1] == "tento"):
-                start -= 1
-                used += 1
-
-            for i in range(0, used):
-                words[i + start] = ""
-
-            if start - 1 >= 0 and words[start - 1] in markers:
-                words[start - 1] = ""
-            found = True
-            daySpecified = True
+    dates = extract_date_words(words, anchorDate, _DATETIME_RULES_CS)
+    if dates.result:
+        return dates.result
+    found = dates.found
+    daySpecified = dates.day_specified
+    dayOffset = dates.day_offset
+    timeQualifier = dates.time_qualifier
+    timeQualifiersAM = _DATETIME_RULES_CS.qualifiers_am
+    timeQualifiersPM = _DATETIME_RULES_CS.qualifiers_pm
+    markers = _DATETIME_RULES_CS.markers
+    recur_markers = _DATETIME_RULES_CS.recur_markers
 
     # parse time
     hrOffset = 0
@@ -1454,84 +1188,14 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
             idx += used - 1
             found = True
-    # check that we found a date
-    if not date_found():
-        return None
-
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-    if datestr != "":
-        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrAbs != -1 and minAbs != -1:
-        # If no time was supplied in the string set the time to default
-        # time if it's available
-        if hrAbs is None and minAbs is None and default_time is not None:
-            hrAbs, minAbs = default_time.hour, default_time.minute
-        else:
-            hrAbs = hrAbs or 0
-            minAbs = minAbs or 0
-
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "a" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
-
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+    dates.found = found
+    dates.day_specified = daySpecified
+    dates.day_offset = dayOffset
+    dates.hr_offset, dates.min_offset, dates.sec_offset = \
+        hrOffset, minOffset, secOffset
+    dates.hr_abs, dates.min_abs = hrAbs, minAbs
+    return datetime_from_state(words, anchorDate, dates, _DATETIME_RULES_CS,
+                               default_time)
 
 
 def isFractional_cs(input_str, short_scale=True):
@@ -1560,6 +1224,23 @@ def isFractional_cs(input_str, short_scale=True):
     return False
 
 
+def extract_numbers_spans_cs(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value (a float) and character offsets of each number
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    return replaceable_number_spans(
+        text, tokens,
+        _extract_numbers_with_text_cs(tokens, short_scale, ordinals), offsets)
+
+
 def extract_numbers_cs(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1574,19 +1255,22 @@ def extract_numbers_cs(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_cs(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [span.value for span in
+            extract_numbers_spans_cs(text, short_scale, ordinals)]
 
 
 class CzechNormalizer(Normalizer):
-    with open(resolve_resource_file("text/cs-cz/normalize.json"), encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = read_locale_json("cs-cz", "normalize")
+
+
+def get_normalizer_cs(**config):
+    """ The normalizer of normalize(), see parse.get_normalizer() """
+    return cached_normalizer(CzechNormalizer, config)
 
 
 def normalize_cs(text, remove_articles=True):
     """ Czech string normalization """
-    return CzechNormalizer().normalize(text, remove_articles)
+    return get_normalizer_cs().normalize(text, remove_articles)
 
 
 def _text_cs_inflection_normalize(word, arg):
@@ -16,9 +16,8 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_spans_generic, Normalizer
 from lingua_franca.lang.common_data_da import _DA_NUMBERS
-from lingua_franca.lang.format_da import pronounce_number_da
 from lingua_franca.time import now_local
 
 
@@ -869,6 +868,24 @@ def normalize_da(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
+def extract_numbers_spans_da(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value and character offsets of each number
+    """
+    return extract_numbers_spans_generic(text, extract_number_da,
+                                         short_scale, ordinals,
+                                         joiners={"og"},
+                                         decimal_markers={"komma"},
+                                         zero_words={"nul"})
+
+
 def extract_numbers_da(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -883,8 +900,8 @@ def extract_numbers_da(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_da, extract_number_da,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [span.value for span in
+            extract_numbers_spans_da(text, short_scale, ordinals)]
 
 
 class DanishNormalizer(Normalizer):
@@ -17,9 +17,9 @@ import re
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_spans_generic, Normalizer, compile_duration_regex, \
+    extract_duration_with_regex
 from lingua_franca.lang.common_data_de import _DE_NUMBERS
-from lingua_franca.lang.format_de import pronounce_number_de
 from lingua_franca.time import now_local
 
 
@@ -86,6 +86,20 @@ de_numbers = {
 # reasons.
 
 
+# Einzahl und Mehrzahl: 'n'/'e' is removed from each unit
+_DURATION_UNITS_DE = {
+    'mikrosekunde': 'microseconds',
+    'millisekunde': 'milliseconds',
+    'sekunde': 'seconds',
+    'minute': 'minutes',
+    'stunde': 'hours',
+    'tag': 'days',
+    'woche': 'weeks'
+}
+_DURATION_REGEX_DE = compile_duration_regex(_DURATION_UNITS_DE,
+                                            suffix="[ne]?")
+
+
 def extract_duration_de(text):
     """
     Convert an german phrase into a number of seconds
@@ -110,37 +124,12 @@ def extract_duration_de(text):
         return None
 
     text = text.lower()
-    # die time_unit values werden für timedelta() mit dem jeweiligen Wert überschrieben
-    time_units = {
-        'microseconds': 'mikrosekunden',
-        'milliseconds': 'millisekunden',
-        'seconds': 'sekunden',
-        'minutes': 'minuten',
-        'hours': 'stunden',
-        'days': 'tage',
-        'weeks': 'wochen'
-    }
-
-    # Einzahl und Mehrzahl
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ne]?"
 
     # TODO Einstiegspunkt für Text-zu-Zahlen Konversion
     #text = _convert_words_to_numbers_de(text)
 
-    for (unit_en, unit_de) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_de[:-1])  # remove 'n'/'e' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return extract_duration_with_regex(text, _DURATION_REGEX_DE,
+                                       _DURATION_UNITS_DE)
 
 
 def extract_number_de(text, short_scale=True, ordinals=False):
@@ -1003,6 +992,24 @@ def normalize_de(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
+def extract_numbers_spans_de(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value and character offsets of each number
+    """
+    return extract_numbers_spans_generic(text, extract_number_de,
+                                         short_scale, ordinals,
+                                         joiners={"und"},
+                                         decimal_markers={"komma"},
+                                         zero_words={"null"})
+
+
 def extract_numbers_de(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1017,8 +1024,8 @@ def extract_numbers_de(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_de, extract_number_de,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [span.value for span in
+            extract_numbers_spans_de(text, short_scale, ordinals)]
 
 
 class GermanNormalizer(Normalizer):
@@ -13,23 +13,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime, timedelta
-
-from dateutil.relativedelta import relativedelta
+from bisect import bisect_right
+from datetime import timedelta
+from functools import lru_cache
 
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    extract_numbers_with_text, replaceable_number_spans, \
+    tokenize_with_offsets, Span, Normalizer, analyses_wanted, \
+    compile_duration_regex, extract_duration_with_regex, DatetimeRules, \
+    extract_date_words, datetime_from_state, cached_normalizer
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _NUM_STRING_EN, \
     _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, \
     _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
     _MULTIPLIES_SHORT_SCALE_EN, _FRACTION_MARKER_EN, _DECIMAL_MARKER_EN, \
     _STRING_NUM_EN, _STRING_SHORT_ORDINAL_EN, _STRING_LONG_ORDINAL_EN, \
-    _FRACTION_STRING_EN, _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN
+    _FRACTION_STRING_EN, _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN, \
+    _WEEKDAYS_EN, _MONTHS_EN, _MONTHS_SHORT_EN, _TIME_QUALIFIERS_AM_EN, \
+    _TIME_QUALIFIERS_PM_EN, _DATETIME_MARKERS_EN, _RECUR_MARKERS_EN, \
+    _YEAR_MULTIPLES_EN, _RELATIVE_DAYS_EN
 
 import re
-import json
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.bundle import read_locale_json
 
 
 def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
@@ -46,25 +52,50 @@ def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
         The original text, with numbers subbed in where appropriate.
 
     """
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_en(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
+    words = _tokens_to_numbers_en(tokenize(text), short_scale, ordinals)
+    return ' '.join(word for word, _, _ in words)
+
+
+def _tokens_to_numbers_en(tokens, short_scale=True, ordinals=False,
+                          numbers=None):
+    """
+    Replace the numbers in a list of Tokens with their values.
+
+    Args:
+        tokens [Token]:
+        short_scale boolean: True if short scale numbers should be used.
+        ordinals boolean: True if ordinals (e.g. first, second, third) should
+                          be parsed to their number values (1, 2, 3...)
+        numbers [ReplaceableNumber]: the numbers in tokens, if they have
+                                     already been extracted
+
+    Returns:
+        [(str, int, int)]
+        Each resulting word, with the indexes of the first and last tokens
+        it comes from.
+
+    """
+    if numbers is None:
+        numbers = _extract_numbers_with_text_en(tokens, short_scale, ordinals)
+    numbers_to_replace = sorted(numbers,
+                                key=lambda number: number.start_index)
 
     results = []
     for token in tokens:
         if not numbers_to_replace or \
                 token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
+            results.append((token.word, token.index, token.index))
         else:
             if numbers_to_replace and \
                     token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
+                number = numbers_to_replace[0]
+                results.append((str(number.value),
+                                number.start_index, number.end_index))
             if numbers_to_replace and \
                     token.index == numbers_to_replace[0].end_index:
                 numbers_to_replace.pop(0)
 
-    return ' '.join(results)
+    return results
 
 
 def _extract_numbers_with_text_en(tokens, short_scale=True,
@@ -87,26 +118,13 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda segment: _extract_number_with_text_en(
+            segment, short_scale, ordinals, fractional_numbers),
+        lambda word: _extract_whole_number_with_text_en(
+            [Token(word, 0)], short_scale, ordinals)[1],
+        _FRACTION_MARKER_EN | _DECIMAL_MARKER_EN if fractional_numbers else ())
 
 
 def _extract_number_with_text_en(tokens, short_scale=True,
@@ -250,7 +268,9 @@ def _extract_decimal_with_text_en(tokens, short_scale, ordinals):
             decimal = numbers2[0]
 
             # TODO handle number dot number number number
-            if "." not in str(decimal.text):
+            # The decimal part is a whole number, not e.g. "two half"
+            if "." not in str(decimal.text) and \
+                    str(decimal.value).isdigit():
                 return number.value + float('0.' + str(decimal.value)), \
                     number.tokens + partitions[1] + decimal.tokens
     return None, None
@@ -500,11 +520,14 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data_en(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The dictionaries
+    are built once for each scale and shared between calls, so they must
+    not be modified.
 
     Args:
         short_scale (bool):
@@ -550,6 +573,19 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# timedelta keyword by unit word; each may take an 's'
+_DURATION_UNITS_EN = {
+    'microsecond': 'microseconds',
+    'millisecond': 'milliseconds',
+    'second': 'seconds',
+    'minute': 'minutes',
+    'hour': 'hours',
+    'day': 'days',
+    'week': 'weeks'
+}
+_DURATION_REGEX_EN = compile_duration_regex(_DURATION_UNITS_EN, suffix="s?")
+
+
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -578,32 +614,89 @@ def extract_duration_en(text):
     """
     if not text:
         return None
+    return _extract_duration_converted_en(_convert_words_to_numbers_en(text))
+
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
+def _extract_duration_converted_en(text):
+    """ extract_duration_en(), on a string whose number words have already
+        been converted, by _convert_words_to_numbers_en(text)
+    """
+    return extract_duration_with_regex(text, _DURATION_REGEX_EN,
+                                       _DURATION_UNITS_EN)
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
-    text = _convert_words_to_numbers_en(text)
 
-    for unit_en in time_units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])   # remove 's' from unit
+def extract_duration_spans_en(text):
+    """
+    Find the durations in a string, and where they are.
 
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    Each value and unit pair, like "5 minutes" or "two and a half hours", is
+    a separate span.
 
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
+    Args:
+        text (str): string containing durations
 
-    return (duration, text)
+    Returns:
+        list(Span): the timedelta and character offsets of each duration,
+                    in the order they appear in the string
+    """
+    if not text:
+        return []
+
+    tokens, offsets = tokenize_with_offsets(text)
+    words = _tokens_to_numbers_en(tokens)
+    word_starts = []
+    position = 0
+    for word, _, _ in words:
+        word_starts.append(position)
+        position += len(word) + 1
+    converted = ' '.join(word for word, _, _ in words)
+
+    def text_offset(position, end=False):
+        # offset in text of a position in the converted string
+        idx = bisect_right(word_starts, position - end) - 1
+        word, first, last = words[idx]
+        if first == last and word == tokens[first].word:
+            return offsets[first][0] + position - word_starts[idx]
+        return offsets[last][1] if end else offsets[first][0]
+
+    spans = []
+    for match in _DURATION_REGEX_EN.finditer(converted):
+        unit = _DURATION_UNITS_EN[match.group("unit")]
+        spans.append(Span(text_offset(match.start()),
+                          text_offset(match.end(), end=True),
+                          timedelta(**{unit: float(match.group("value"))}),
+                          "duration"))
+    return spans
+
+
+_DATETIME_RULES_EN = DatetimeRules(
+    weekdays=_WEEKDAYS_EN,
+    months=_MONTHS_EN,
+    months_short=_MONTHS_SHORT_EN,
+    qualifiers_am=_TIME_QUALIFIERS_AM_EN,
+    qualifiers_pm=_TIME_QUALIFIERS_PM_EN,
+    relative_days=_RELATIVE_DAYS_EN,
+    after_article=[('day', 'after', 'tomorrow')],
+    units={'day': 'days', 'week': 'weeks', 'month': 'months',
+           'year': 'years'},
+    year_multiples=_YEAR_MULTIPLES_EN,
+    couple='of',
+    couple_units={'weeks': 'weeks', 'months': 'months', 'years': 'years'},
+    next_words=['next'],
+    last_words=['last'],
+    this_words=['this'],
+    now_words=['now'],
+    from_words=['from', 'after'],
+    ago='ago',
+    articles=['the'],
+    month_day_joiner='of',
+    month_homographs={'may': ['i', 'we', 'be']},
+    markers=_DATETIME_MARKERS_EN,
+    recur_markers=_RECUR_MARKERS_EN,
+    joiner='and',
+    # plurals are read as the singular
+    normalize=lambda word: word.rstrip('s'),
+    extract_number=extract_number_en)
 
 
 def extract_datetime_en(text, anchorDate=None, default_time=None):
@@ -636,10 +729,20 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return _extract_datetime_converted_en(
+        _convert_words_to_numbers_en(text, ordinals=None),
+        anchorDate, default_time)
+
+
+def _extract_datetime_converted_en(text, anchorDate=None, default_time=None):
+    """ extract_datetime_en(), on a string whose number words have
+        already been converted, by _convert_words_to_numbers_en(text,
+        ordinals=None)
+    """
 
     def clean_string(s):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_en(s, ordinals=None)
         # clean unneeded punctuation and capitalization among other things.
         s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
             .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
@@ -653,9 +756,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         for idx, word in enumerate(wordList):
             word = word.replace("'s", "")
 
-            ordinals = ["rd", "st", "nd", "th"]
             if word[0].isdigit():
-                for ordinal in ordinals:
+                for ordinal in ("rd", "st", "nd", "th"):
                     # "second" is the only case we should not do this
                     if ordinal in word and "second" not in word:
                         word = word.replace(ordinal, "")
@@ -663,290 +765,17 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         return wordList
 
-    def date_found():
-        return found or \
-            (
-                datestr != "" or
-                yearOffset != 0 or monthOffset != 0 or
-                dayOffset is True or hrOffset != 0 or
-                hrAbs or minOffset != 0 or
-                minAbs or secOffset != 0
-            )
-
     if not anchorDate:
         anchorDate = now_local()
 
-    if text == "":
-        return None
-
-    found = False
-    daySpecified = False
-    dayOffset = False
-    monthOffset = 0
-    yearOffset = 0
-    today = anchorDate.strftime("%w")
-    currentYear = anchorDate.strftime("%Y")
-    fromFlag = False
-    datestr = ""
-    hasYear = False
-    timeQualifier = ""
-
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['at', 'in', 'on', 'by', 'this', 'around', 'for', 'of', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
-
     words = clean_string(text)
-
-    for idx, word in enumerate(words):
-        if word == "":
-            continue
-        wordPrevPrev = words[idx - 2] if idx > 1 else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
-
-        # this isn't in clean string because I don't want to save back to words
-        word = word.rstrip('s')
-        start = idx
-        used = 0
-        # save timequalifier for later
-        if word == "ago" and dayOffset:
-            dayOffset = - dayOffset
-            used += 1
-        if word == "now" and not datestr:
-            resultStr = " ".join(words[idx + 1:])
-            resultStr = ' '.join(resultStr.split())
-            extractedDate = anchorDate.replace(microsecond=0)
-            return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
-            multiplier = None
-            if is_numeric(word):
-                multiplier = extract_number_en(word)
-            multiplier = multiplier or 1
-            multiplier = int(multiplier)
-            used += 2
-            if wordNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNext == "millennium":
-                yearOffset = multiplier * 1000
-        # couple of
-        elif word == "2" and wordNext == "of" and \
-                wordNextNext in year_multiples:
-            multiplier = 2
-            used += 3
-            if wordNextNext == "decade":
-                yearOffset = multiplier * 10
-            elif wordNextNext == "century":
-                yearOffset = multiplier * 100
-            elif wordNextNext == "millennium":
-                yearOffset = multiplier * 1000
-        elif word == "2" and wordNext == "of" and \
-                wordNextNext in day_multiples:
-            multiplier = 2
-            used += 3
-            if wordNextNext == "years":
-                yearOffset = multiplier
-            elif wordNextNext == "months":
-                monthOffset = multiplier
-            elif wordNextNext == "weeks":
-                dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
-            timeQualifier = word
-        # parse today, tomorrow, day after tomorrow
-        elif word == "today" and not fromFlag:
-            dayOffset = 0
-            used += 1
-        elif word == "tomorrow" and not fromFlag:
-            dayOffset = 1
-            used += 1
-        elif word == "day" and wordNext == "before" and wordNextNext == "yesterday" and not fromFlag:
-            dayOffset = -2
-            used += 3
-        elif word == "before" and wordNext == "yesterday" and not fromFlag:
-            dayOffset = -2
-            used += 2
-        elif word == "yesterday" and not fromFlag:
-            dayOffset = -1
-            used += 1
-        elif (word == "day" and
-              wordNext == "after" and
-              wordNextNext == "tomorrow" and
-              not fromFlag and
-              (not wordPrev or not wordPrev[0].isdigit())):
-            dayOffset = 2
-            used = 3
-            if wordPrev == "the":
-                start -= 1
-                used += 1
-                # parse 5 days, 10 weeks, last week, next week
-        elif word == "day":
-            if wordPrev and wordPrev[0].isdigit():
-                dayOffset += int(wordPrev)
-                start -= 1
-                used = 2
-        elif word == "week" and not fromFlag and wordPrev:
-            if wordPrev[0].isdigit():
-                dayOffset += int(wordPrev) * 7
-                start -= 1
-                used = 2
-            elif wordPrev == "next":
-                dayOffset = 7
-                start -= 1
-                used = 2
-            elif wordPrev == "last":
-                dayOffset = -7
-                start -= 1
-                used = 2
-                # parse 10 months, next month, last month
-        elif word == "month" and not fromFlag and wordPrev:
-            if wordPrev[0].isdigit():
-                monthOffset = int(wordPrev)
-                start -= 1
-                used = 2
-            elif wordPrev == "next":
-                monthOffset = 1
-                start -= 1
-                used = 2
-            elif wordPrev == "last":
-                monthOffset = -1
-                start -= 1
-                used = 2
-        # parse 5 years, next year, last year
-        elif word == "year" and not fromFlag and wordPrev:
-            if wordPrev[0].isdigit():
-                yearOffset = int(wordPrev)
-                start -= 1
-                used = 2
-            elif wordPrev == "next":
-                yearOffset = 1
-                start -= 1
-                used = 2
-            elif wordPrev == "last":
-                yearOffset = -1
-                start -= 1
-                used = 2
-        # parse Monday, Tuesday, etc., and next Monday,
-        # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
-            used = 1
-            if dayOffset < 0:
-                dayOffset += 7
-            if wordPrev == "next":
-                if dayOffset <= 2:
-                    dayOffset += 7
-                used += 1
-                start -= 1
-            elif wordPrev == "last":
-                dayOffset -= 7
-                used += 1
-                start -= 1
-                # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
-            used += 1
-            datestr = months[m]
-            if wordPrev and (wordPrev[0].isdigit() or
-                             (wordPrev == "of" and wordPrevPrev[0].isdigit())):
-                if wordPrev == "of" and wordPrevPrev[0].isdigit():
-                    datestr += " " + words[idx - 2]
-                    used += 1
-                    start -= 1
-                else:
-                    datestr += " " + wordPrev
-                start -= 1
-                used += 1
-                if wordNext and wordNext[0].isdigit():
-                    datestr += " " + wordNext
-                    used += 1
-                    hasYear = True
-                else:
-                    hasYear = False
-
-            elif wordNext and wordNext[0].isdigit():
-                datestr += " " + wordNext
-                used += 1
-                if wordNextNext and wordNextNext[0].isdigit():
-                    datestr += " " + wordNextNext
-                    used += 1
-                    hasYear = True
-                else:
-                    hasYear = False
-
-            # if no date indicators found, it may not be the month of May
-            # may "i/we" ...
-            # "... may be"
-            elif word == 'may' and wordNext in ['i', 'we', 'be']:
-                datestr = ""
-
-        # parse 5 days from tomorrow, 10 weeks from next thursday,
-        # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("now")
-        validFollowups.append("this")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
-            used = 2
-            fromFlag = True
-            if wordNext == "tomorrow":
-                dayOffset += 1
-            elif wordNext == "yesterday":
-                dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
-                used = 2
-                if tmpOffset < 0:
-                    tmpOffset += 7
-                dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
-                used = 3
-                if wordNext == "next":
-                    if dayOffset <= 2:
-                        tmpOffset += 7
-                    used += 1
-                    start -= 1
-                elif wordNext == "last":
-                    tmpOffset -= 7
-                    used += 1
-                    start -= 1
-                dayOffset += tmpOffset
-        if used > 0:
-            if start - 1 > 0 and words[start - 1] == "this":
-                start -= 1
-                used += 1
-
-            for i in range(0, used):
-                words[i + start] = ""
-
-            if start - 1 >= 0 and words[start - 1] in markers:
-                words[start - 1] = ""
-            found = True
-            daySpecified = True
+    dates = extract_date_words(words, anchorDate, _DATETIME_RULES_EN)
+    if dates.result:
+        return dates.result
+    found = dates.found
+    daySpecified = dates.day_specified
+    dayOffset = dates.day_offset
+    timeQualifier = dates.time_qualifier
 
     # parse time
     hrOffset = 0
@@ -1001,21 +830,22 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 secOffset = 2
         # parse half an hour, quarter hour
         elif word == "hour" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _DATETIME_MARKERS_EN or
+                 wordPrevPrev in _DATETIME_MARKERS_EN):
             if wordPrev == "half":
                 minOffset = 30
             elif wordPrev == "quarter":
                 minOffset = 15
             elif wordPrevPrev == "quarter":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in markers:
+                if idx > 2 and words[idx - 3] in _DATETIME_MARKERS_EN:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             elif wordPrev == "within":
                 hrOffset = 1
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1128,7 +958,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _TIME_QUALIFIERS_PM_EN):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1162,9 +992,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_EN or
+                        wordNext in _RECUR_MARKERS_EN or
+                        wordNextNext in _RECUR_MARKERS_EN):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1257,21 +1087,23 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                qualifiers = {
+                                    _DATETIME_RULES_EN.words.get(word)
+                                    for word in (wordNextNext,
+                                                 wordNextNextNext)}
+                                if ('qualifier', 'pm') in qualifiers:
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if ('qualifier', 'am') in qualifiers:
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _TIME_QUALIFIERS_PM_EN:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _TIME_QUALIFIERS_AM_EN:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1302,7 +1134,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     # has passed, assume the next morning
                     dayOffset += 1
 
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_EN and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1331,96 +1163,38 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_EN:
                 words[idx - 1] = ""
                 if wordPrev == "this":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
 
             idx += used - 1
             found = True
-    # check that we found a date
-    if not date_found():
-        return None
+    dates.found = found
+    dates.day_specified = daySpecified
+    dates.day_offset = dayOffset
+    dates.hr_offset, dates.min_offset, dates.sec_offset = \
+        hrOffset, minOffset, secOffset
+    dates.hr_abs, dates.min_abs = hrAbs, minAbs
+    return datetime_from_state(words, anchorDate, dates, _DATETIME_RULES_EN,
+                               default_time)
+
+
+def _fractions_en(ordinals):
+    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    return fracts
 
-    if dayOffset is False:
-        dayOffset = 0
-
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-
-    if datestr != "":
-        # date included an explicit date, e.g. "june 5" or "june 2, 2017"
-        try:
-            temp = datetime.strptime(datestr, "%B %d")
-        except ValueError:
-            # Try again, allowing the year
-            temp = datetime.strptime(datestr, "%B %d %Y")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrAbs != -1 and minAbs != -1:
-        # If no time was supplied in the string set the time to default
-        # time if it's available
-        if hrAbs is None and minAbs is None and default_time is not None:
-            hrAbs, minAbs = default_time.hour, default_time.minute
-        else:
-            hrAbs = hrAbs or 0
-            minAbs = minAbs or 0
-
-        extractedDate = extractedDate + relativedelta(hours=hrAbs,
-                                                      minutes=minAbs)
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-    for idx, word in enumerate(words):
-        if words[idx] == "and" and \
-                words[idx - 1] == "" and words[idx + 1] == "":
-            words[idx] = ""
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+# the denominator of each fraction word, by scale
+_FRACTIONS_SHORT_EN = _fractions_en(_SHORT_ORDINAL_EN)
+_FRACTIONS_LONG_EN = _fractions_en(_LONG_ORDINAL_EN)
 
 
 def is_fractional_en(input_str, short_scale=True, spoken=True):
@@ -1438,21 +1212,29 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
+    fracts = _FRACTIONS_SHORT_EN if short_scale else _FRACTIONS_LONG_EN
     if input_str.lower() in fracts and spoken:
         return 1.0 / fracts[input_str.lower()]
     return False
 
 
+def extract_numbers_spans_en(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value (a float) and character offsets of each number
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    return replaceable_number_spans(
+        text, tokens,
+        _extract_numbers_with_text_en(tokens, short_scale, ordinals), offsets)
+
+
 def extract_numbers_en(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1467,19 +1249,91 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_en(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [span.value for span in
+            extract_numbers_spans_en(text, short_scale, ordinals)]
 
 
 class EnglishNormalizer(Normalizer):
-    with open(resolve_resource_file("text/en-us/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = read_locale_json("en-us", "normalize")
 
     def numbers_to_digits(self, utterance):
         return _convert_words_to_numbers_en(utterance, ordinals=None)
 
 
+def get_normalizer_en(**config):
+    """ The normalizer of normalize(), see parse.get_normalizer() """
+    return cached_normalizer(EnglishNormalizer, config)
+
+
 def normalize_en(text, remove_articles=True):
     """ English string normalization """
-    return EnglishNormalizer().normalize(text, remove_articles)
+    return get_normalizer_en().normalize(text, remove_articles)
+
+
+class _SharedEnglishNormalizer(EnglishNormalizer):
+    """ EnglishNormalizer reusing the numbers converted by analyze_en() """
+
+    def __init__(self, tokens, converted):
+        super().__init__()
+        self._words = [token.word for token in tokens]
+        self._converted = converted
+
+    def numbers_to_digits(self, utterance):
+        if self.tokenize(utterance) == self._words:
+            return self._converted()
+        return super().numbers_to_digits(utterance)
+
+
+def analyze_en(text, want=None, anchorDate=None, default_time=None,
+               remove_articles=True):
+    """
+    Run several extractors on one string, doing the work they have in
+    common once: the string is tokenized once, and its numbers are
+    extracted once for extract_numbers() and extract_duration(), and once
+    for extract_datetime() and normalize().
+
+    Args:
+        text (str): the string to analyze
+        want (iterable(str)): any of "numbers", "duration", "datetime" and
+                              "normalized". Defaults to all of them.
+        anchorDate (datetime): as for extract_datetime_en()
+        default_time (time): as for extract_datetime_en()
+        remove_articles (bool): as for normalize_en()
+
+    Returns:
+        dict: {name: result} for each name in want
+    """
+    want = analyses_wanted(want)
+    tokens, offsets = tokenize_with_offsets(text)
+    numbers = {}
+
+    def numbers_in(ordinals):
+        if ordinals not in numbers:
+            numbers[ordinals] = _extract_numbers_with_text_en(
+                tokens, ordinals=ordinals)
+        return numbers[ordinals]
+
+    def converted(ordinals):
+        return ' '.join(word for word, _, _ in _tokens_to_numbers_en(
+            tokens, ordinals=ordinals, numbers=numbers_in(ordinals)))
+
+    results = {}
+    if "numbers" in want:
+        results["numbers"] = [span.value for span in
+                              replaceable_number_spans(text, tokens,
+                                                       numbers_in(False),
+                                                       offsets)]
+    if "duration" in want:
+        results["duration"] = \
+            _extract_duration_converted_en(converted(False)) if text \
+            else None
+    if "datetime" in want:
+        results["datetime"] = \
+            _extract_datetime_converted_en(converted(None), anchorDate,
+                                           default_time) if text != "" \
+            else None
+    if "normalized" in want:
+        normalizer = _SharedEnglishNormalizer(tokens,
+                                              lambda: converted(None))
+        results["normalized"] = normalizer.normalize(text, remove_articles)
+    return results
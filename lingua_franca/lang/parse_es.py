@@ -17,7 +17,6 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
-from lingua_franca.lang.format_es import pronounce_number_es
 from lingua_franca.lang.parse_common import *
 from lingua_franca.lang.common_data_es import _ARTICLES_ES, _STRING_NUM_ES
 
@@ -171,8 +170,11 @@ def extract_number_es(text, short_scale=True, ordinals=False):
                     zeros += 1
                 else:
                     break
-            afterDotVal = str(extract_number_es(newText[:-1]))
-            afterDotVal = zeros * "0" + afterDotVal
+            afterDotVal = extract_number_es(newText[:-1])
+            if afterDotVal is False or afterDotVal != int(afterDotVal):
+                # no whole number after the decimal mark to append
+                break
+            afterDotVal = zeros * "0" + str(int(afterDotVal))
             result = float(str(result) + "." + afterDotVal)
             break
         count += 1
@@ -268,6 +270,24 @@ def _es_number_parse(words, i):
     return es_number(i)
 
 
+def extract_numbers_spans_es(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value and character offsets of each number
+    """
+    return extract_numbers_spans_generic(text, extract_number_es,
+                                         short_scale, ordinals,
+                                         joiners={"y"},
+                                         decimal_markers={"punto", "coma"},
+                                         zero_words={"cero"})
+
+
 def extract_numbers_es(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -282,9 +302,8 @@ def extract_numbers_es(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_es,
-                                   extract_number_es, short_scale=short_scale,
-                                   ordinals=ordinals)
+    return [span.value for span in
+            extract_numbers_spans_es(text, short_scale, ordinals)]
 
 
 def normalize_es(text, remove_articles=True):
@@ -18,13 +18,28 @@ from dateutil.tz import gettz
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
-from lingua_franca.lang.format_fr import pronounce_number_fr
+    extract_numbers_spans_generic, Normalizer, compile_duration_regex, \
+    extract_duration_with_regex
 from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
     _ORDINAL_ENDINGS_FR
 from lingua_franca.time import now_local
 
 
+# unit words, without their plural 's'
+_DURATION_UNITS_FR = {
+    'microseconde': 'microseconds',
+    'milliseconde': 'milliseconds',
+    'seconde': 'seconds',
+    'minute': 'minutes',
+    'heure': 'hours',
+    'jour': 'days',
+    'semaine': 'weeks'
+}
+_DURATION_REGEX_FR = compile_duration_regex(_DURATION_UNITS_FR,
+                                            suffix="[s]?",
+                                            end=r"(?:\s+|,|$)")
+
+
 def extract_duration_fr(text):
     """
     Convert an french phrase into a number of seconds
@@ -49,32 +64,8 @@ def extract_duration_fr(text):
         return None
 
     text = normalize_fr(text)
-
-    time_units = {
-        'microseconds': 'microsecondes',
-        'milliseconds': 'millisecondes',
-        'seconds': 'secondes',
-        'minutes': 'minutes',
-        'hours': 'heures',
-        'days': 'jours',
-        'weeks': 'semaines'
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?(\s+|,|$)"
-
-    for (unit_en, unit_fr) in time_units.items():
-        unit_pattern = pattern.format(unit=unit_fr[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return extract_duration_with_regex(text, _DURATION_REGEX_FR,
+                                       _DURATION_UNITS_FR)
 
 def _number_parse_fr(words, i):
     """ Parses a list of words to find a number
@@ -447,7 +438,7 @@ def extract_number_fr(text, short_scale=True, ordinals=False):
                     break
             afterDotVal = None
             # extract the number after the zeros
-            if newWords[zeros].isdigit():
+            if zeros < len(newWords) and newWords[zeros].isdigit():
                 afterDotVal = newWords[zeros]
                 countDot = count + zeros + 2
             # if a number was extracted (since comma is also a
@@ -1068,6 +1059,24 @@ def normalize_fr(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
+def extract_numbers_spans_fr(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value and character offsets of each number
+    """
+    return extract_numbers_spans_generic(text, extract_number_fr,
+                                         short_scale, ordinals,
+                                         joiners={"et"},
+                                         decimal_markers={"virgule"},
+                                         zero_words={"zéro"})
+
+
 def extract_numbers_fr(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1082,8 +1091,8 @@ def extract_numbers_fr(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_fr, extract_number_fr,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [span.value for span in
+            extract_numbers_spans_fr(text, short_scale, ordinals)]
 
 
 class FrenchNormalizer(Normalizer):
@@ -14,13 +14,18 @@
 # limitations under the License.
 #
 from lingua_franca.time import now_local
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, cached_normalizer
 
 
 class HungarianNormalizer(Normalizer):
     """ TODO implement language specific normalizer"""
 
 
+def get_normalizer_hu(**config):
+    """ The normalizer of normalize(), see parse.get_normalizer() """
+    return cached_normalizer(HungarianNormalizer, config)
+
+
 def normalize_hu(text, remove_articles=True):
     """ English string normalization """
-    return HungarianNormalizer().normalize(text, remove_articles)
+    return get_normalizer_hu().normalize(text, remove_articles)
@@ -23,9 +23,8 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
-from lingua_franca.lang.format_it import _LONG_SCALE_IT, _SHORT_SCALE_IT, \
-    pronounce_number_it
+    extract_numbers_spans_generic, Normalizer
+from lingua_franca.lang.format_it import _LONG_SCALE_IT, _SHORT_SCALE_IT
 from lingua_franca.lang.common_data_it import _SHORT_ORDINAL_STRING_IT, \
     _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT
 
@@ -1148,6 +1147,25 @@ def get_gender_it(word, context=""):
     return gender
 
 
+def extract_numbers_spans_it(text, short_scale=False, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value and character offsets of each number
+    """
+    return extract_numbers_spans_generic(text, extract_number_it,
+                                         short_scale, ordinals,
+                                         joiners={"e"},
+                                         decimal_markers={"virgola",
+                                                          "punto"},
+                                         zero_words={"zero"})
+
+
 def extract_numbers_it(text, short_scale=False, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1162,9 +1180,8 @@ def extract_numbers_it(text, short_scale=False, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_it,
-                                   extract_number_it,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [span.value for span in
+            extract_numbers_spans_it(text, short_scale, ordinals)]
 
 
 class ItalianNormalizer(Normalizer):
@@ -14,11 +14,14 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
 from .parse_common import is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict
+    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict, \
+    extract_numbers_with_text, replaceable_number_spans, \
+    compile_duration_regex, extract_duration_with_regex, tokenize_with_offsets
 from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
     _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, _LONG_ORDINAL_STRING_NL,\
     _LONG_SCALE_NL, _MULTIPLIES_LONG_SCALE_NL, _MULTIPLIES_SHORT_SCALE_NL,\
@@ -79,26 +82,13 @@ def _extract_numbers_with_text_nl(tokens, short_scale=True,
         [_ReplaceableNumber]: A list of tuples, each containing a number and a
                          string.
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_nl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda segment: _extract_number_with_text_nl(
+            segment, short_scale, ordinals, fractional_numbers),
+        lambda word: _extract_whole_number_with_text_nl(
+            [Token(word, 0)], short_scale, ordinals)[1],
+        _FRACTION_MARKER_NL | _DECIMAL_MARKER_NL if fractional_numbers else ())
 
 
 def _extract_number_with_text_nl(tokens, short_scale=True,
@@ -234,7 +224,9 @@ def _extract_decimal_with_text_nl(tokens, short_scale, ordinals):
             decimal = numbers2[0]
 
             # TODO handle number dot number number number
-            if "." not in str(decimal.text):
+            # The decimal part is a whole number, not e.g. "two half"
+            if "." not in str(decimal.text) and \
+                    str(decimal.value).isdigit():
                 return number.value + float('0.' + str(decimal.value)), \
                     number.tokens + partitions[1] + decimal.tokens
     return None, None
@@ -390,6 +382,7 @@ def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data_nl(short_scale):
     """Generate dictionaries of words to numbers, based on scale.
 
@@ -433,6 +426,24 @@ def extract_number_nl(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+_DURATION_WORDS_NL = {
+    'microseconds': ["microsecond", "microseconde", "microseconden",
+                     "microsecondje", "microsecondjes"],
+    'milliseconds': ["millisecond", "milliseconde", "milliseconden",
+                     "millisecondje", "millisecondjes"],
+    'seconds': ["second", "seconde", "seconden", "secondje", "secondjes"],
+    'minutes': ["minuut", "minuten", "minuutje", "minuutjes"],
+    'hours': ["uur", "uren", "uurtje", "uurtjes"],
+    'days': ["dag", "dagen", "dagje", "dagjes"],
+    'weeks': ["week", "weken", "weekje", "weekjes"]
+}
+# timedelta keyword by unit word, the longest words of each unit first
+_DURATION_UNITS_NL = {word: unit for unit, words in _DURATION_WORDS_NL.items()
+                      for word in sorted(words, key=len, reverse=True)}
+_DURATION_REGEX_NL = compile_duration_regex(_DURATION_UNITS_NL,
+                                            separator=r"\s+")
+
+
 def extract_duration_nl(text):
     """Convert an english phrase into a number of seconds
 
@@ -461,43 +472,9 @@ def extract_duration_nl(text):
     if not text:
         return None
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    nl_translations = {
-        'microseconds': ["microsecond", "microseconde", "microseconden", "microsecondje", "microsecondjes"],
-        'milliseconds': ["millisecond", "milliseconde", "milliseconden", "millisecondje", "millisecondjes"],
-        'seconds': ["second", "seconde", "seconden", "secondje", "secondjes"],
-        'minutes': ["minuut", "minuten", "minuutje", "minuutjes"],
-        'hours': ["uur", "uren", "uurtje", "uurtjes"],
-        'days': ["dag", "dagen", "dagje", "dagjes"],
-        'weeks': ["week", "weken", "weekje", "weekjes"]
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
     text = _convert_words_to_numbers_nl(text)
-
-    for unit in time_units:
-        unit_nl_words = nl_translations[unit]
-        unit_nl_words.sort(key=len, reverse=True)
-        for unit_nl in unit_nl_words:
-            unit_pattern = pattern.format(unit=unit_nl)
-            matches = re.findall(unit_pattern, text)
-            value = sum(map(float, matches))
-            time_units[unit] = time_units[unit] + value
-            text = re.sub(unit_pattern, '', text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return extract_duration_with_regex(text, _DURATION_REGEX_NL,
+                                       _DURATION_UNITS_NL)
 
 
 def extract_datetime_nl(text, anchorDate=None, default_time=None):
@@ -1294,6 +1271,23 @@ def is_fractional_nl(input_str, short_scale=True):
     return False
 
 
+def extract_numbers_spans_nl(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value (a float) and character offsets of each number
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    return replaceable_number_spans(
+        text, tokens,
+        _extract_numbers_with_text_nl(tokens, short_scale, ordinals), offsets)
+
+
 def extract_numbers_nl(text, short_scale=True, ordinals=False):
     """Takes in a string and extracts a list of numbers.
 
@@ -1307,9 +1301,8 @@ def extract_numbers_nl(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_nl(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [span.value for span in
+            extract_numbers_spans_nl(text, short_scale, ordinals)]
 
 
 def normalize_nl(text, remove_articles=True):
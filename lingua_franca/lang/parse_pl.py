@@ -14,11 +14,14 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    extract_numbers_with_text, replaceable_number_spans, \
+    compile_duration_regex, extract_duration_with_regex, tokenize_with_offsets
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _FRACTION_STRING_PL, _TIME_UNITS_CONVERSION, \
     _TIME_UNITS_NORMALIZATION, _MONTHS_TO_EN, _DAYS_TO_EN, _ORDINAL_BASE_PL, \
@@ -165,26 +168,14 @@ def _extract_numbers_with_text_pl(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_pl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda segment: _extract_number_with_text_pl(
+            segment, short_scale, ordinals, fractional_numbers),
+        lambda word: (word in _NEGATIVES or
+                      _extract_whole_number_with_text_pl(
+                          [Token(word, 0)], short_scale, ordinals)[1]),
+        _FRACTION_MARKER | _DECIMAL_MARKER if fractional_numbers else ())
 
 
 def _extract_number_with_text_pl(tokens, short_scale=True,
@@ -326,7 +317,9 @@ def _extract_decimal_with_text_pl(tokens, short_scale, ordinals):
             decimal = numbers2[0]
 
             # TODO handle number dot number number number
-            if "." not in str(decimal.text):
+            # The decimal part is a whole number, not e.g. "two half"
+            if "." not in str(decimal.text) and \
+                    str(decimal.value).isdigit():
                 return number.value + float('0.' + str(decimal.value)), \
                     number.tokens + partitions[1] + decimal.tokens
     return None, None
@@ -465,9 +458,8 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
             aPieces = word.split('/')
             if look_for_fractions(aPieces):
                 val = float(aPieces[0]) / float(aPieces[1])
-                number_words.append(tokens[idx + 1])
         else:
-            if all([
+            if current_val and all([
                     prev_word in _SUMS,
                     word not in _SUMS,
                     word not in multiplies,
@@ -555,6 +547,7 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
@@ -596,6 +589,10 @@ def extract_number_pl(text, short_scale=True, ordinals=False):
                                         True, ordinals).value
 
 
+_DURATION_REGEX_PL = compile_duration_regex(_TIME_UNITS_CONVERSION,
+                                            suffix="[ayeę]?")
+
+
 def extract_duration_pl(text):
     """
     Convert an english phrase into a number of seconds
@@ -625,32 +622,9 @@ def extract_duration_pl(text):
     if not text:
         return None
 
-    time_units = {
-        'microseconds': None,
-        'milliseconds': None,
-        'seconds': None,
-        'minutes': None,
-        'hours': None,
-        'days': None,
-        'weeks': None
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
     text = _convert_words_to_numbers_pl(text)
-
-    for unit in _TIME_UNITS_CONVERSION:
-        unit_pattern = pattern.format(unit=unit)
-        matches = re.findall(unit_pattern, text)
-        value = sum(map(float, matches))
-        unit_en = _TIME_UNITS_CONVERSION.get(unit)
-        if time_units[unit_en] is None or time_units.get(unit_en) == 0:
-            time_units[unit_en] = value
-        text = re.sub(unit_pattern, '', text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return extract_duration_with_regex(text, _DURATION_REGEX_PL,
+                                       _TIME_UNITS_CONVERSION)
 
 
 def extract_datetime_pl(string, dateNow=None, default_time=None):
@@ -1333,6 +1307,23 @@ def isFractional_pl(input_str, short_scale=True):
     return False
 
 
+def extract_numbers_spans_pl(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value (a float) and character offsets of each number
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    return replaceable_number_spans(
+        text, tokens,
+        _extract_numbers_with_text_pl(tokens, short_scale, ordinals), offsets)
+
+
 def extract_numbers_pl(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1347,9 +1338,8 @@ def extract_numbers_pl(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_pl(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [span.value for span in
+            extract_numbers_spans_pl(text, short_scale, ordinals)]
 
 
 def normalize_word_pl(word):
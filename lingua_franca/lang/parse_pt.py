@@ -26,10 +26,9 @@ from lingua_franca.lang.parse_common import is_numeric, look_for_fractions
 from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
-from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.bundle import read_locale_json
+from lingua_franca.lang.parse_common import Normalizer, cached_normalizer
 from lingua_franca.time import now_local
-import json
 import re
 
 
@@ -200,28 +199,21 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
 
 
 class PortugueseNormalizer(Normalizer):
-    with open(resolve_resource_file("text/pt-pt/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = read_locale_json("pt-pt", "normalize")
+    # Split things like amo-te
+    _TOKEN_SPLITS = Normalizer._TOKEN_SPLITS + (
+        ("-", re.compile(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)"), r"\1 \2 \3"),)
+    _DROP_FINAL_HYPHEN = True
 
-    @staticmethod
-    def tokenize(utterance):
-        # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
-        # Split things like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
-        # Split things like amo-te
-        utterance = re.sub(r"([a-zA-Z]+)(-)([a-zA-Z]+\b)", r"\1 \2 \3",
-                           utterance)
-        tokens = utterance.split()
-        if tokens[-1] == '-':
-            tokens = tokens[:-1]
 
-        return tokens
+def get_normalizer_pt(**config):
+    """ The normalizer of normalize(), see parse.get_normalizer() """
+    return cached_normalizer(PortugueseNormalizer, config)
 
 
 def normalize_pt(text, remove_articles=True):
     """ PT string normalization """
-    return PortugueseNormalizer().normalize(text, remove_articles)
+    return get_normalizer_pt().normalize(text, remove_articles)
 
 
 def extract_datetime_pt(text, anchorDate=None, default_time=None):
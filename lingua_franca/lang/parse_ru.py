@@ -14,19 +14,22 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    extract_numbers_with_text, replaceable_number_spans, Normalizer, \
+    compile_duration_regex, extract_duration_with_regex, cached_normalizer, \
+    tokenize_with_offsets
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _LONG_ORDINAL_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, \
     _FRACTION_STRING_RU, _MONTHS_CONVERSION, _MONTHS_RU, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_RU
 
 import re
-import json
-from lingua_franca import resolve_resource_file
+from lingua_franca.bundle import read_locale_json
 from lingua_franca.time import now_local
 
 
@@ -184,26 +187,13 @@ def _extract_numbers_with_text_ru(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_ru(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda segment: _extract_number_with_text_ru(
+            segment, short_scale, ordinals, fractional_numbers),
+        lambda word: _extract_whole_number_with_text_ru(
+            [Token(word, 0)], short_scale, ordinals)[1],
+        _FRACTION_MARKER | _DECIMAL_MARKER if fractional_numbers else ())
 
 
 def _extract_number_with_text_ru(tokens, short_scale=True,
@@ -345,7 +335,9 @@ def _extract_decimal_with_text_ru(tokens, short_scale, ordinals):
             decimal = numbers2[0]
 
             # TODO handle number dot number number number
-            if "." not in str(decimal.text):
+            # The decimal part is a whole number, not e.g. "two half"
+            if "." not in str(decimal.text) and \
+                    str(decimal.value).isdigit():
                 return number.value + float('0.' + str(decimal.value)), \
                        number.tokens + partitions[1] + decimal.tokens
     return None, None
@@ -495,7 +487,7 @@ def _extract_whole_number_with_text_ru(tokens, short_scale, ordinals):
             if look_for_fractions(a_pieces):
                 val = float(a_pieces[0]) / float(a_pieces[1])
         else:
-            if all([
+            if current_val and all([
                 prev_word in _SUMS,
                 word not in _SUMS,
                 word not in multiplies,
@@ -584,6 +576,7 @@ def _extract_whole_number_with_text_ru(tokens, short_scale, ordinals):
     return val, number_words
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers, based on scale.
@@ -630,6 +623,13 @@ def extract_number_ru(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Russian inflection for time: минута, минуты, минут - safe to use минута
+# as pattern
+# For day: день, дня, дней - short pattern not applicable, list all
+_DURATION_REGEX_RU = compile_duration_regex(_TIME_UNITS_CONVERSION,
+                                            suffix="(?:а|ов|у|ут|уту)?")
+
+
 def extract_duration_ru(text):
     """
     Convert an english phrase into a number of seconds
@@ -659,35 +659,9 @@ def extract_duration_ru(text):
     if not text:
         return None
 
-    # Russian inflection for time: минута, минуты, минут - safe to use минута as pattern
-    # For day: день, дня, дней - short pattern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?"
     text = _convert_words_to_numbers_ru(text)
-
-    for (unit_ru, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_ru)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return duration, text
+    return extract_duration_with_regex(text, _DURATION_REGEX_RU,
+                                       _TIME_UNITS_CONVERSION)
 
 
 def extract_datetime_ru(text, anchor_date=None, default_time=None):
@@ -1577,6 +1551,23 @@ def is_fractional_ru(input_str, short_scale=True):
     return False
 
 
+def extract_numbers_spans_ru(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list(Span): the value (a float) and character offsets of each number
+    """
+    tokens, offsets = tokenize_with_offsets(text)
+    return replaceable_number_spans(
+        text, tokens,
+        _extract_numbers_with_text_ru(tokens, short_scale, ordinals), offsets)
+
+
 def extract_numbers_ru(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1591,19 +1582,22 @@ def extract_numbers_ru(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_ru(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [span.value for span in
+            extract_numbers_spans_ru(text, short_scale, ordinals)]
 
 
 class RussianNormalizer(Normalizer):
-    with open(resolve_resource_file("text/ru-ru/normalize.json"), encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = read_locale_json("ru-ru", "normalize")
+
+
+def get_normalizer_ru(**config):
+    """ The normalizer of normalize(), see parse.get_normalizer() """
+    return cached_normalizer(RussianNormalizer, config)
 
 
 def normalize_ru(text, remove_articles=True):
     """ Russian string normalization """
-    return RussianNormalizer().normalize(text, remove_articles)
+    return get_normalizer_ru().normalize(text, remove_articles)
 
 
 def _text_ru_inflection_normalize(word, arg):
@@ -14,18 +14,27 @@
 # limitations under the License.
 #
 
+from collections import Counter
 from difflib import SequenceMatcher
-from warnings import warn
-from lingua_franca.time import now_local
+from functools import partial
+from heapq import heappush, heapreplace
+from lingua_franca import config
+from lingua_franca.batch import map_chunks, map_localized
+from lingua_franca.time import now_local, to_local
 from lingua_franca.internal import populate_localized_function_dict, \
-    get_active_langs, get_full_lang_code, get_primary_lang_code, \
-    get_default_lang, localized_function, _raise_unsupported_language
+    get_active_langs, localized_function, FunctionNotLocalizedError
+from lingua_franca.lang.parse_common import extract_numbers_spans_generic, \
+    iter_spans, analyses_wanted
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
+                         "extract_numbers_spans",
                          "extract_number",
                          "extract_duration",
+                         "extract_duration_spans",
                          "extract_datetime",
                          "normalize",
+                         "get_normalizer",
+                         "analyze",
                          "get_gender",
                          "is_fractional",
                          "is_ordinal")
@@ -33,6 +42,15 @@ _REGISTERED_FUNCTIONS = ("extract_numbers",
 populate_localized_function_dict("parse", langs=get_active_langs())
 
 
+def _read_chunks(stream, chunk_size):
+    """ Iterate over the pieces of a str, text file or iterable of str """
+    if isinstance(stream, str):
+        return iter((stream,))
+    if hasattr(stream, "read"):
+        return iter(partial(stream.read, chunk_size), "")
+    return iter(stream)
+
+
 def fuzzy_match(x: str, against: str) -> float:
     """Perform a 'fuzzy' comparison between two strings.
 
@@ -49,11 +67,14 @@ def match_one(query, choices):
 
         Args:
             query (str): string to test
-            choices (list): list or dictionary of choices
+            choices (list): list or dictionary of choices, or a FuzzyIndex
+                            of them
 
         Returns:
             tuple: (best match, score)
     """
+    if isinstance(choices, FuzzyIndex):
+        return choices.match_one(query)
     if isinstance(choices, dict):
         _choices = list(choices.keys())
     elif isinstance(choices, list):
@@ -73,7 +94,178 @@ def match_one(query, choices):
         return best
 
 
-@localized_function()
+def match_many(queries, choices, workers=None, chunksize=None):
+    """
+        Find the best match of each query from one list or dictionary
+
+        Equivalent to calling match_one() for each query, with the choices
+        indexed once for all of them, as a FuzzyIndex.
+
+        Args:
+            queries (iterable(str)): strings to test
+            choices (list): list or dictionary of choices, or a FuzzyIndex
+                            of them
+            workers (int, optional): number of processes to share the
+                                     queries between. None or 1 matches
+                                     them in this process.
+            chunksize (int, optional): number of queries sent to a worker
+                                       at a time. The index is sent along
+                                       with each chunk, so by default each
+                                       worker gets a single chunk.
+
+        Returns:
+            list(tuple): (best match, score) of each query, in order
+    """
+    queries = list(queries)
+    if not isinstance(choices, FuzzyIndex):
+        choices = FuzzyIndex(choices)
+    if not workers or workers == 1 or len(queries) < 2:
+        return choices.match_many(queries)
+    if not len(choices):
+        raise ValueError('no choices to match against')
+    if not chunksize:
+        chunksize = -(-len(queries) // workers)
+    return map_chunks(partial(_match_many_in_worker, choices), queries,
+                      workers, chunksize)
+
+
+def _match_many_in_worker(index, queries):
+    return index.match_many(queries)
+
+
+class FuzzyIndex:
+    """
+    Choices to find the best fuzzy_match() of a query among, many times
+
+    Building the index reads each choice once. A query then skips the
+    choices which cannot score well enough, using upper bounds of their
+    score: those of SequenceMatcher.real_quick_ratio(), from the lengths,
+    and SequenceMatcher.quick_ratio(), from the characters in common. Only
+    the remaining choices are scored, with fuzzy_match(query, choice), so
+    the scores are exactly those of fuzzy_match() and match_one().
+
+    Args:
+        choices (list): list or dictionary of choices. As for match_one(),
+                        the values of a dictionary are returned, and its
+                        keys are matched.
+    """
+
+    def __init__(self, choices):
+        if isinstance(choices, dict):
+            self._keys = list(choices.keys())
+            self._values = [choices[key] for key in self._keys]
+        elif isinstance(choices, list):
+            self._keys = self._values = list(choices)
+        else:
+            raise ValueError('a list or dict of choices must be provided')
+        self._counts = [Counter(key) for key in self._keys]
+        # indexes of the choices, by their length
+        self._by_length = {}
+        for idx, key in enumerate(self._keys):
+            self._by_length.setdefault(len(key), []).append(idx)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def match(self, query, top_k=1, score_cutoff=0.0):
+        """
+        Find the best matches of a query
+
+        Args:
+            query (str): string to test
+            top_k (int): matches to return at most, or None for all
+            score_cutoff (float): lowest score of a match returned
+
+        Returns:
+            list((match, score)): best first; of equal scores, the choice
+                                  given first comes first
+        """
+        return self._match([query], top_k, score_cutoff)[0]
+
+    def match_one(self, query):
+        """
+        Find the best match of a query, as match_one(query, choices) does
+
+        Args:
+            query (str): string to test
+
+        Returns:
+            tuple: (best match, score)
+        """
+        return self.match_many([query])[0]
+
+    def match_many(self, queries):
+        """
+        Find the best match of each query, as match_one(query, choices) does
+
+        The choices are read once for all the queries, each one being
+        compared with every query which could still match it.
+
+        Args:
+            queries (list): strings to test
+
+        Returns:
+            list(tuple): (best match, score) of each query, in order
+        """
+        if not self._keys:
+            raise ValueError('no choices to match against')
+        return [matches[0] for matches in self._match(queries, 1, 0.0)]
+
+    def _match(self, queries, top_k, score_cutoff):
+        if not queries or top_k is not None and top_k < 1:
+            return [[] for _ in queries]
+        query_lens = [len(query) for query in queries]
+        query_counts = [list(Counter(query).items()) for query in queries]
+        # (score, -index) of the best matches of each query so far, worst
+        # first, and the score a choice needs to be one of them
+        best = [[] for _ in queries]
+        thresholds = [score_cutoff for _ in queries]
+
+        def upper_bound(query_len, length, matches):
+            total = query_len + length
+            return 2.0 * matches / total if total else 1.0
+
+        bounds = {length: [upper_bound(query_len, length,
+                                       min(query_len, length))
+                           for query_len in query_lens]
+                  for length in self._by_length}
+        # the lengths, highest bound first, so that the best matches are
+        # found early and raise the thresholds
+        for length in sorted(bounds, key=lambda length: max(bounds[length]),
+                             reverse=True):
+            wanted = [i for i, bound in enumerate(bounds[length])
+                      if bound >= thresholds[i]]
+            if not wanted:
+                continue
+            for idx in self._by_length[length]:
+                counts = self._counts[idx]
+                matcher = None
+                for i in wanted:
+                    matches = 0
+                    for char, count in query_counts[i]:
+                        matches += min(count, counts[char])
+                    if upper_bound(query_lens[i], length,
+                                   matches) < thresholds[i]:
+                        continue
+                    if matcher is None:
+                        # the choice is indexed once for all the queries
+                        matcher = SequenceMatcher(None, "", self._keys[idx])
+                    matcher.set_seq1(queries[i])
+                    score = matcher.ratio()
+                    if score < thresholds[i]:
+                        continue
+                    if top_k is None or len(best[i]) < top_k:
+                        heappush(best[i], (score, -idx))
+                    elif (score, -idx) > best[i][0]:
+                        heapreplace(best[i], (score, -idx))
+                    if top_k is not None and len(best[i]) == top_k:
+                        thresholds[i] = max(best[i][0][0], score_cutoff)
+        return [[(self._values[-idx], score)
+                 for score, idx in sorted(matches, reverse=True)]
+                for matches in best]
+
+
+@localized_function(cache_results=True)
 def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
         Takes in a string and extracts a list of numbers.
@@ -92,7 +284,84 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
-@localized_function()
+@localized_function(run_own_code_on=[FunctionNotLocalizedError],
+                    cache_results=True)
+def extract_numbers_spans(text, short_scale=True, ordinals=False, lang=''):
+    """
+        Takes in a string and finds all numbers, and where they are.
+
+    Unlike extract_numbers(), this tells which part of the text each number
+    was read from, so the text can be spliced without parsing it again:
+
+        >>> extract_numbers_spans("two cats and 3 dogs")
+        [Span(start=0, end=3, value=2.0, kind='number'),
+         Span(start=13, end=14, value=3.0, kind='number')]
+
+    Languages without their own implementation find numbers word by word,
+    with their extract_number().
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        list(Span): (start, end, value, kind) of each number, in the order
+                    they appear in the text. text[start:end] is the text the
+                    value was read from, and kind is "number".
+    """
+    def extract_handler(text, short_scale, ordinals):
+        # by keyword, which languages without short_scale leave out
+        return extract_number(text, short_scale=short_scale,
+                              ordinals=ordinals, lang=lang)
+
+    return extract_numbers_spans_generic(text, extract_handler,
+                                         short_scale, ordinals)
+
+
+def iter_numbers(stream, short_scale=True, ordinals=False, lang='',
+                 chunk_size=65536):
+    """
+        Finds all numbers in a text too large to handle in one piece.
+
+    The text is read a chunk at a time, and memory use stays bounded
+    however long it is. Numbers split across chunks are still found whole.
+    A fraction or decimal marker ('and', 'point') found only once near a
+    number joins it to the next, as in "two and a half", even where the
+    whole text has it more than once and extract_numbers_spans() would not
+    join them; see parse_common.iter_spans().
+
+        >>> list(iter_numbers(["two hundred", " five"]))
+        [Span(start=0, end=16, value=205.0, kind='number')]
+
+    Args:
+        stream (str, file or iterable(str)): the text. Files, or anything
+            else with a read() method, are read `chunk_size` characters at
+            a time. Other iterables, such as a list of lines, are read an
+            item at a time.
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        chunk_size (int): characters read from a file at a time
+    Yields:
+        Span: as from extract_numbers_spans(), with offsets counted from the
+              start of the whole text
+    """
+    def extract_spans(text):
+        return extract_numbers_spans(text, short_scale, ordinals, lang=lang)
+
+    return iter_spans(_read_chunks(stream, chunk_size), extract_spans)
+
+
+@localized_function(cache_results=True)
 def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """Takes in a string and extracts a number.
 
@@ -111,7 +380,35 @@ def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
-@localized_function()
+def extract_number_batch(texts, short_scale=True, ordinals=False, lang='',
+                         workers=None, chunksize=None):
+    """Takes a list of strings and extracts a number from each
+
+    Equivalent to calling extract_number() on each text, with the language
+    resolved once for the whole batch.
+
+    Args:
+        texts (iterable(str)): the strings to extract numbers from
+        short_scale (bool): Use "short scale" or "long scale" for large
+            numbers -- over a million.  The default is short scale, which
+            is now common in most English speaking countries.
+            See https://en.wikipedia.org/wiki/Names_of_large_numbers
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): number of processes to share the batch
+                                 between. None or 1 runs it in this process.
+        chunksize (int, optional): number of texts sent to a worker at a
+                                   time.
+    Returns:
+        list: the result of extract_number() for each text, in order
+    """
+    return map_localized("parse", "extract_number", texts, lang=lang,
+                         workers=workers, chunksize=chunksize,
+                         short_scale=short_scale, ordinals=ordinals)
+
+
+@localized_function(cache_results=True)
 def extract_duration(text, lang=''):
     """ Convert an english phrase into a number of seconds
 
@@ -143,7 +440,52 @@ def extract_duration(text, lang=''):
     """
 
 
-@localized_function()
+@localized_function(cache_results=True)
+def extract_duration_spans(text, lang=''):
+    """ Find the durations in a string, and where they are
+
+    Unlike extract_duration(), which adds up everything it finds, each
+    value and unit pair is a separate span:
+
+        >>> extract_duration_spans("set a timer for 5 minutes and 30 seconds")
+        [Span(start=16, end=25, value=timedelta(seconds=300), kind='duration'),
+         Span(start=30, end=40, value=timedelta(seconds=30), kind='duration')]
+
+    Args:
+        text (str): string containing durations
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+
+    Returns:
+        list(Span): (start, end, value, kind) of each duration, in the order
+                    they appear in the text. text[start:end] is the text the
+                    timedelta was read from, and kind is "duration".
+    """
+
+
+def iter_durations(stream, lang='', chunk_size=65536):
+    """ Find the durations in a text too large to handle in one piece
+
+    The streaming counterpart of extract_duration_spans(), read a chunk at
+    a time, as with iter_numbers().
+
+    Args:
+        stream (str, file or iterable(str)): the text
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        chunk_size (int): characters read from a file at a time
+
+    Yields:
+        Span: as from extract_duration_spans(), with offsets counted from the
+              start of the whole text
+    """
+    def extract_spans(text):
+        return extract_duration_spans(text, lang=lang)
+
+    return iter_spans(_read_chunks(stream, chunk_size), extract_spans)
+
+
+@localized_function(cache_results=True, anchor_param="anchorDate")
 def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
     Extracts date and time information from a sentence.  Parses many of the
@@ -197,7 +539,39 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
-@localized_function()
+def extract_datetime_batch(texts, anchorDate=None, lang='', default_time=None,
+                           workers=None, chunksize=None):
+    """Extracts date and time information from each of a list of sentences
+
+    Equivalent to calling extract_datetime() on each text, with the language
+    resolved once for the whole batch. Every text is parsed relative to the
+    same anchorDate, which defaults to the time the batch started.
+
+    Args:
+        texts (iterable(str)): the texts to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating. Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+        workers (int, optional): number of processes to share the batch
+                                 between. None or 1 runs it in this process.
+        chunksize (int, optional): number of texts sent to a worker at a
+                                   time.
+
+    Returns:
+        list: the result of extract_datetime() for each text, in order
+    """
+    anchorDate = anchorDate or now_local()
+    if config.inject_timezones and anchorDate.tzinfo is None:
+        anchorDate = to_local(anchorDate)
+    # The anchor is passed positionally, as languages name it differently
+    return map_localized("parse", "extract_datetime", texts, lang=lang,
+                         workers=workers, chunksize=chunksize,
+                         extra_args=(anchorDate,), default_time=default_time)
+
+
+@localized_function(cache_results=True)
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
 
@@ -217,6 +591,103 @@ def normalize(text, lang='', remove_articles=True):
 
 
 @localized_function()
+def get_normalizer(lang='', **settings):
+    """Get the normalizer normalize() uses, to keep and call many times
+
+    A normalizer is built once for each language and settings, and kept.
+    Its first call compiles what its settings ask for into one pipeline,
+    which its later calls reuse:
+
+        >>> normalizer = get_normalizer("en", remove_articles=False)
+        >>> normalizer.normalize("it's one")
+        'it is 1'
+
+    Args:
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        **settings: settings of the language's normalize.json to change,
+                    like lowercase=True or remove_symbols=True
+
+    Returns:
+        (Normalizer): call its normalize(text, remove_articles) method
+    """
+
+
+def normalize_batch(texts, lang='', remove_articles=True, workers=None,
+                    chunksize=None):
+    """Prepare a list of strings for parsing
+
+    Equivalent to calling normalize() on each text, with the language
+    resolved once for the whole batch.
+
+    Args:
+        texts (iterable(str)): the strings to normalize
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        remove_articles (bool): whether to remove articles (like 'a', or
+                                'the'). True by default.
+        workers (int, optional): number of processes to share the batch
+                                 between. None or 1 runs it in this process.
+        chunksize (int, optional): number of texts sent to a worker at a
+                                   time.
+
+    Returns:
+        list(str): the normalized strings, in order
+    """
+    return map_localized("parse", "normalize", texts, lang=lang,
+                         workers=workers, chunksize=chunksize,
+                         remove_articles=remove_articles)
+
+
+@localized_function(run_own_code_on=[FunctionNotLocalizedError],
+                    cache_results=True, anchor_param="anchorDate")
+def analyze(text, want=None, anchorDate=None, default_time=None,
+            remove_articles=True, lang=''):
+    """Run several extractors on the same text, and return all the results
+
+        >>> analyze("wake me up in twenty minutes", want={"numbers",
+        ...                                               "duration"})
+        {'numbers': [20.0],
+         'duration': (datetime.timedelta(seconds=1200), 'wake me up in')}
+
+    Languages which implement analyze() share the work the extractors have
+    in common, such as tokenizing the text and finding its numbers, which
+    makes this faster than calling each of them. Other languages call them
+    one after the other.
+
+    Args:
+        text (str): the text to analyze
+        want (iterable(str), optional): which results to return, any of
+            "numbers": extract_numbers(text)
+            "duration": extract_duration(text)
+            "datetime": extract_datetime(text, anchorDate, default_time)
+            "normalized": normalize(text, remove_articles)
+            Defaults to all of them.
+        anchorDate (:obj:`datetime`, optional): as for extract_datetime()
+        default_time (datetime.time): as for extract_datetime()
+        remove_articles (bool): as for normalize()
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+
+    Returns:
+        dict: {name: result} for each name in `want`
+    """
+    want = analyses_wanted(want)
+    results = {}
+    if "numbers" in want:
+        results["numbers"] = extract_numbers(text, lang=lang)
+    if "duration" in want:
+        results["duration"] = extract_duration(text, lang=lang)
+    if "datetime" in want:
+        results["datetime"] = extract_datetime(text, anchorDate, lang=lang,
+                                               default_time=default_time)
+    if "normalized" in want:
+        results["normalized"] = normalize(text, lang=lang,
+                                          remove_articles=remove_articles)
+    return results
+
+
+@localized_function(cache_results=True)
 def get_gender(word, context="", lang=''):
     """ Guess the gender of a word
 
@@ -235,7 +706,7 @@ def get_gender(word, context="", lang=''):
     """
 
 
-@localized_function()
+@localized_function(cache_results=True)
 def is_fractional(input_str, short_scale=True, lang=''):
     """
     This function takes the given text and checks if it is a fraction.
@@ -254,7 +725,7 @@ def is_fractional(input_str, short_scale=True, lang=''):
     """
 
 
-@localized_function()
+@localized_function(cache_results=True)
 def is_ordinal(input_str, lang=''):
     """
     This function takes the given text and checks if it is an ordinal number.
@@ -0,0 +1,199 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+from importlib import import_module
+from warnings import warn
+
+from lingua_franca.internal import load_language, get_primary_lang_code, \
+    _localized_functions, _SUPPORTED_FULL_LOCALIZATIONS
+
+WarmUpStage = namedtuple('WarmUpStage', ('seconds', 'memory', 'peak'))
+WarmUpStage.__doc__ = """ Cost of one warm-up stage for one language
+
+    seconds (float): wall-clock time spent
+    memory (int): bytes still allocated at the end of the stage, or None
+                  if memory was not traced
+    peak (int): highest bytes allocated during the stage, or None
+"""
+
+_WARM_UP_STAGES = ("import", "resolve", "resources", "calls")
+
+# Arguments (args, kwargs) used for the warm-up call of each registered
+# function. Values are deliberately trivial, as the point is to reach every
+# code path which loads data, not to exercise the parsers.
+_WARM_UP_ARGS = {
+    "extract_numbers": (("1 2",), {}),
+    "extract_numbers_spans": (("1 2",), {}),
+    "extract_number": (("1",), {}),
+    "extract_duration": (("1",), {}),
+    "extract_duration_spans": (("1",), {}),
+    "extract_datetime": (("1 2", datetime(2017, 6, 27, 13, 4)), {}),
+    "normalize": (("1",), {}),
+    "get_normalizer": ((), {}),
+    "analyze": (("1",), {"want": ("numbers", "normalized")}),
+    "get_gender": (("1",), {}),
+    "is_fractional": (("1",), {}),
+    "is_ordinal": (("1",), {}),
+    # some localizations have no default for 'speech'
+    "nice_number": ((1.5,), {"speech": True}),
+    "nice_time": ((datetime(2017, 6, 27, 13, 4),), {}),
+    "pronounce_number": ((1,), {}),
+    "nice_response": (("1",), {}),
+    "nice_duration": ((90,), {}),
+}
+
+
+class _Stage:
+    """ Context manager timing (and optionally tracing) one stage """
+
+    def __init__(self, report, name, trace_memory):
+        self.report = report
+        self.name = name
+        self.trace_memory = trace_memory
+
+    def __enter__(self):
+        if self.trace_memory:
+            if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+            self.memory = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        memory = peak = None
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            memory = current - self.memory
+            peak = peak - self.memory
+        self.report[self.name] = WarmUpStage(seconds, memory, peak)
+
+
+def _full_lang_codes(lang_code):
+    return [full_code for full_code in _SUPPORTED_FULL_LOCALIZATIONS
+            if full_code.split('-')[0] == lang_code]
+
+
+def warm_up(langs, functions=None, trace_memory=True):
+    """ Load everything a language needs ahead of time
+
+    Intended for long-running services, which would rather pay the cost of
+    importing modules and reading resources at startup than on their first
+    requests. For each language, in order:
+
+        import    - load the language and import its lang/* modules,
+                    including data files read at import, like normalize.json
+        resolve   - look up each localized function
+        resources - read date_time.json, compiling its regexes, and every
+                    .word file of each of the language's localizations
+        calls     - call each function once
+
+    Arguments:
+        langs (str or list(str)): language codes to warm up
+        functions (list(str), optional): names of the registered functions
+            to resolve and call, e.g. ["extract_datetime", "nice_number"].
+            Defaults to every function registered by lingua_franca.parse
+            and lingua_franca.format.
+        trace_memory (bool): measure memory with tracemalloc. Tracing slows
+            everything down, so stage timings are lower without it.
+
+    Returns:
+        dict: {lang_code: {stage_name: WarmUpStage}}, where each language
+              also has a "total" entry summing its stages.
+    """
+    import lingua_franca.format
+    import lingua_franca.parse
+    from lingua_franca.format import date_time_format, _translate_word
+
+    if isinstance(langs, str):
+        langs = [langs]
+    modules = {"parse": lingua_franca.parse, "format": lingua_franca.format}
+    registered = {(module_name, function_name)
+                  for module_name, module in modules.items()
+                  for function_name in module._REGISTERED_FUNCTIONS
+                  if functions is None or function_name in functions}
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    report = {}
+    try:
+        for lang in langs:
+            lang_code = get_primary_lang_code(lang)
+            lang_report = report[lang_code] = {}
+
+            with _Stage(lang_report, "import", trace_memory):
+                load_language(lang_code)
+                for module_name in ("common_data",) + tuple(modules):
+                    try:
+                        import_module(".lang." + module_name + "_" +
+                                      lang_code, "lingua_franca")
+                    except ModuleNotFoundError:
+                        pass
+
+            with _Stage(lang_report, "resolve", trace_memory):
+                for module_name, function_name in registered:
+                    _localized_functions[module_name][lang_code][
+                        function_name]
+
+            with _Stage(lang_report, "resources", trace_memory):
+                for full_code in _full_lang_codes(lang_code):
+                    date_time_format.cache(full_code)
+                    res_dir = os.path.join(date_time_format.config_path,
+                                           full_code)
+                    if not os.path.isdir(res_dir):
+                        continue
+                    for filename in sorted(os.listdir(res_dir)):
+                        name, ext = os.path.splitext(filename)
+                        if ext == ".word":
+                            _translate_word(name, full_code)
+
+            with _Stage(lang_report, "calls", trace_memory):
+                for module_name, function_name in sorted(registered):
+                    function = getattr(modules[module_name], function_name)
+                    warm_up_args = _WARM_UP_ARGS.get(function_name)
+                    if warm_up_args is None:
+                        # e.g. a function registered after this table
+                        warn("warm_up: no arguments to call {}.{} with, it "
+                             "is only resolved".format(module_name,
+                                                       function_name))
+                        continue
+                    args, kwargs = warm_up_args
+                    try:
+                        function(*args, lang=lang_code, **kwargs)
+                    except NotImplementedError:
+                        # Not localized in this language
+                        pass
+                    except Exception as e:
+                        # A broken localization shouldn't stop the service
+                        # from starting, but it should be noticed.
+                        warn("warm_up: {}.{} failed for '{}': {!r}".format(
+                            module_name, function_name, lang_code, e))
+
+            lang_report["total"] = WarmUpStage(
+                sum(lang_report[stage].seconds for stage in _WARM_UP_STAGES),
+                sum(lang_report[stage].memory for stage in _WARM_UP_STAGES)
+                if trace_memory else None,
+                max(lang_report[stage].peak for stage in _WARM_UP_STAGES)
+                if trace_memory else None)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return report
@@ -0,0 +1,155 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from lingua_franca import aio, load_language, unload_language, \
+    set_default_lang
+from lingua_franca.format import nice_number
+from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.parse import extract_datetime, extract_number
+from lingua_franca.time import default_timezone
+
+
+def setUpModule():
+    load_language('en')
+    set_default_lang('en')
+
+
+def tearDownModule():
+    aio.shutdown()
+    unload_language('en')
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.batches = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.batches.append(len(args[-1]))
+        return super().submit(fn, *args, **kwargs)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAio(unittest.TestCase):
+    def test_functions(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+
+        async def calls():
+            return await asyncio.gather(
+                aio.extract_number("two hundred"),
+                aio.extract_datetime("tomorrow at 5 pm", anchor),
+                aio.nice_number(1.5, lang="en-us"),
+                aio.extract_number("the third", True, True, "en"))
+
+        self.assertEqual(run(calls()),
+                         [extract_number("two hundred"),
+                          extract_datetime("tomorrow at 5 pm", anchor),
+                          nice_number(1.5), 3])
+        self.assertEqual(aio.extract_number.__name__, "extract_number")
+
+    def test_unknown_arguments(self):
+        async def calls():
+            return await asyncio.gather(
+                aio.extract_number("one", not_a_param=True),
+                aio.pronounce_number(3, lang="en", not_a_param=True),
+                aio.extract_number("one", True, False, "en", "extra"),
+                return_exceptions=True)
+
+        results = run(calls())
+        self.assertEqual(results[:2], [1, "three"])
+        self.assertIsInstance(results[2], TypeError)
+
+    def test_batching(self):
+        executor = CountingExecutor()
+        frontend = aio.AsyncFrontend(executor, max_batch_size=4,
+                                     max_batch_delay=0.05)
+
+        async def calls():
+            return await asyncio.gather(*(
+                frontend.call("parse", "extract_number", (str(n),))
+                for n in range(10)))
+
+        self.assertEqual(run(calls()), list(range(10)))
+        self.assertEqual(executor.batches, [4, 4, 2])
+        frontend.shutdown()
+
+    def test_batch_per_language(self):
+        executor = CountingExecutor()
+        frontend = aio.AsyncFrontend(executor, max_batch_delay=0.05)
+
+        async def calls():
+            return await asyncio.gather(
+                frontend.call("parse", "extract_number", ("one",)),
+                frontend.call("format", "pronounce_number", (1,)),
+                frontend.call("parse", "extract_number", ("two",)),
+                frontend.call("parse", "get_gender", ("person",)),
+                return_exceptions=True)
+
+        results = run(calls())
+        self.assertEqual(results[:3], [1, "one", 2])
+        self.assertIsInstance(results[3], (AttributeError,
+                                           FunctionNotLocalizedError))
+        self.assertEqual(sorted(executor.batches), [1, 1, 2])
+        frontend.shutdown()
+
+    def test_backpressure(self):
+        executor = CountingExecutor()
+        frontend = aio.AsyncFrontend(executor, max_batch_size=100,
+                                     max_batch_delay=0.01, max_pending=3)
+
+        async def calls():
+            return await asyncio.gather(*(
+                frontend.call("parse", "extract_number", (str(n),))
+                for n in range(7)))
+
+        self.assertEqual(run(calls()), list(range(7)))
+        self.assertEqual(executor.batches, [3, 3, 1])
+        frontend.shutdown()
+
+    def test_process_executor(self):
+        frontend = aio.AsyncFrontend("process", max_workers=1)
+
+        async def calls():
+            return await asyncio.gather(
+                frontend.call("parse", "extract_number", ("two",)),
+                frontend.call("format", "pronounce_number", (2,),
+                              {"lang": "en-us"}))
+
+        self.assertEqual(run(calls()), [2, "two"])
+        frontend.shutdown()
+
+    def test_configure(self):
+        self.assertRaises(ValueError, aio.AsyncFrontend, "fibers")
+        frontend = aio.configure(max_batch_size=1)
+        self.assertEqual(run(aio.extract_number("seven")), 7)
+        self.assertIs(aio._frontend, frontend)
+        aio.shutdown()
+        self.assertIsNone(aio._frontend)
+
+
+if __name__ == "__main__":
+    unittest.main()
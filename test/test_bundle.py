@@ -0,0 +1,130 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from lingua_franca import load_language, unload_language, \
+    resolve_resource_file, invalidate_resource_cache, config
+from lingua_franca import bundle
+from lingua_franca.format import _translate_word, DateTimeFormat, \
+    date_time_format
+
+
+def setUpModule():
+    load_language('en')
+
+
+def tearDownModule():
+    unload_language('en')
+
+
+class TestBundle(unittest.TestCase):
+    def tearDown(self):
+        bundle.unload_bundles()
+
+    def test_build_bundle(self):
+        en = bundle.build_bundle('en-us')
+        self.assertEqual(en['words']['and'], 'and')
+        self.assertEqual(en['words']['minutes'], 'minutes')
+        with open(resolve_resource_file('text/en-us/normalize.json')) as f:
+            self.assertEqual(en['normalize'], json.load(f))
+        self.assertIn('date_time', en)
+        self.assertNotIn('normalize', bundle.build_bundle('de-de'))
+
+    def test_bundle_is_used(self):
+        en = bundle.build_bundle('en-us')
+        en['words']['and'] = 'plus'
+        bundle._loaded_bundles['en-us'] = en
+        self.assertEqual(_translate_word('and', 'en-us'), 'plus')
+        self.assertEqual(_translate_word('not a word', 'en-us'), 'not a word')
+        self.assertIs(bundle.read_locale_json('en-us', 'normalize'),
+                      en['normalize'])
+
+    def test_loose_files_without_bundle(self):
+        bundle._loaded_bundles['en-us'] = None
+        self.assertEqual(_translate_word('and', 'en-us'), 'and')
+        self.assertEqual(bundle.read_locale_json('en-us', 'normalize'),
+                         bundle.build_bundle('en-us')['normalize'])
+        self.assertIsNone(bundle.read_locale_json('de-de', 'normalize'))
+
+    def test_date_time_format(self):
+        bundled = DateTimeFormat(date_time_format.config_path)
+        self.assertTrue(bundled.use_bundles)
+        en = bundle.build_bundle('en-us')
+        bundle._loaded_bundles['en-us'] = en
+        bundled.cache('en-us')
+        self.assertIs(bundled.lang_config['en-us'], en['date_time'])
+        self.assertEqual(bundled.year_format(datetime(1984, 1, 1),
+                                             'en-us', False),
+                         'nineteen eighty four')
+        self.assertFalse(DateTimeFormat('/tmp').use_bundles)
+
+
+class TestBundleRefresh(unittest.TestCase):
+    """ Bundles built into a temporary folder, with a temporary home """
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.bundle_dir = tempfile.TemporaryDirectory()
+        patches = (mock.patch.dict(os.environ, {"HOME": self.home.name}),
+                   mock.patch.object(bundle, "_BUNDLE_DIR",
+                                     self.bundle_dir.name))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        invalidate_resource_cache()
+        bundle.write_bundles(['en-us'])
+
+    def tearDown(self):
+        config.resource_revalidation_interval = None
+        invalidate_resource_cache()
+        self.home.cleanup()
+        self.bundle_dir.cleanup()
+
+    def add_override(self):
+        override_dir = os.path.join(self.home.name, ".mycroft", "text",
+                                    "en-us")
+        os.makedirs(override_dir)
+        with open(os.path.join(override_dir, "and.word"), "w") as f:
+            f.write("AND")
+
+    def test_invalidate(self):
+        self.assertEqual(_translate_word('and', 'en-us'), 'and')
+        self.assertIsNotNone(bundle._loaded_bundles['en-us'])
+        self.add_override()
+        invalidate_resource_cache()
+        self.assertEqual(_translate_word('and', 'en-us'), 'AND')
+        self.assertIsNone(bundle._loaded_bundles['en-us'])
+
+    def test_revalidation(self):
+        self.assertEqual(_translate_word('and', 'en-us'), 'and')
+        self.add_override()
+        self.assertEqual(_translate_word('and', 'en-us'), 'and')
+        config.resource_revalidation_interval = 0
+        self.assertEqual(_translate_word('and', 'en-us'), 'AND')
+
+    def test_stale_bundle(self):
+        path = os.path.join(self.bundle_dir.name, "en-us.json")
+        os.utime(path, (0, 0))
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(bundle.load_bundle('en-us'))
+        self.assertEqual(_translate_word('and', 'en-us'), 'and')
+        bundle.write_bundles(['en-us'])
+        self.assertIsNotNone(bundle.load_bundle('en-us'))
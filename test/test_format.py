@@ -27,12 +27,14 @@ from lingua_franca import load_languages, unload_languages, set_default_lang, \
     get_primary_lang_code, get_active_langs, get_supported_langs
 from lingua_franca.internal import UnsupportedLanguageError
 from lingua_franca.format import nice_number
+from lingua_franca.format import nice_numbers
 from lingua_franca.format import nice_time
 from lingua_franca.format import nice_date
 from lingua_franca.format import nice_date_time
 from lingua_franca.format import nice_year
 from lingua_franca.format import nice_duration
 from lingua_franca.format import pronounce_number
+from lingua_franca.format import pronounce_numbers
 from lingua_franca.format import date_time_format
 from lingua_franca.format import join_list
 from lingua_franca.time import default_timezone
@@ -129,8 +131,49 @@ class TestNiceNumberFormat(unittest.TestCase):
         # its input as a string
         self.assertWarns(UserWarning, bypass_warning)
 
+    def test_nice_numbers(self):
+        numbers = list(NUMBERS_FIXTURE_EN) * 2
+        self.assertEqual(nice_numbers(numbers),
+                         [nice_number(number) for number in numbers])
+        self.assertEqual(nice_numbers(iter([6.777, 6.0]), speech=False),
+                         ['6 7/9', '6'])
+        self.assertEqual(nice_numbers([5.5, 2.333], denominators=[1, 2]),
+                         ['5 and a half', '2.333'])
+        self.assertEqual(nice_numbers([5.5, 5.5], lang='as-df'),
+                         ['5.5', '5.5'])
+        self.assertEqual(nice_numbers([]), [])
+
 
 class TestPronounceNumber(unittest.TestCase):
+    def test_pronounce_numbers(self):
+        numbers = [0, 1, 1.0, 21, 1, 1e6, 33.5, -0.05, 21, 4000000000]
+        self.assertEqual(pronounce_numbers(numbers),
+                         [pronounce_number(number) for number in numbers])
+        self.assertEqual(pronounce_numbers(iter([3, 3, 101]), ordinals=True),
+                         ["third", "third", "one hundred and first"])
+        self.assertEqual(pronounce_numbers([1e12], short_scale=False),
+                         ["one billion"])
+        self.assertEqual(pronounce_numbers([2, 1, 2], lang="de"),
+                         ["zwei", "eins", "zwei"])
+        self.assertEqual(pronounce_numbers(numbers, workers=2, chunksize=2),
+                         pronounce_numbers(numbers))
+        self.assertEqual(pronounce_numbers([]), [])
+
+    def test_pronounce_numbers_array(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        numbers = numpy.array([[7, 1000], [7, 12]])
+        self.assertEqual(pronounce_numbers(numbers),
+                         ["seven", "one thousand", "seven", "twelve"])
+        numbers = numpy.array([0.5, 2.25, 0.5])
+        self.assertEqual(pronounce_numbers(numbers, places=1),
+                         ["zero point five", "two point two",
+                          "zero point five"])
+        self.assertEqual(nice_numbers(numbers), ["a half", "2 and a forth",
+                                                 "a half"])
+
     def test_convert_int(self):
         self.assertEqual(pronounce_number(0), "zero")
         self.assertEqual(pronounce_number(1), "one")
@@ -16,6 +16,7 @@
 #
 
 import unittest
+from lingua_franca.lang.format_common import ChunkTable
 from lingua_franca.lang.format_common import convert_to_mixed_fraction as cmf
 
 
@@ -26,3 +27,24 @@ class TestMixedFraction(unittest.TestCase):
         self.assertEqual(cmf(8.5), (8, 1, 2))
         self.assertEqual(cmf(8.587465135), None)
         self.assertEqual(cmf(8.587465135, range(1, 101)), (8, 47, 80))
+
+
+class TestChunkTable(unittest.TestCase):
+    def test_chunk_table(self):
+        calls = []
+
+        def pronounce(n):
+            calls.append(n)
+            if n == 3:
+                raise KeyError(n)
+            return str(n)
+
+        table = ChunkTable(pronounce, 5)
+        self.assertEqual(calls, [0, 1, 2, 3, 4])
+        self.assertEqual(table[4], "4")
+        self.assertEqual(len(calls), 5)
+        self.assertNotIn(3, table)
+        with self.assertRaises(KeyError):
+            table[3]
+        self.assertEqual(table[7], "7")
+        self.assertEqual(calls[5:], [3, 7])
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from sys import version
 
@@ -115,6 +116,40 @@ class TestLanguageLoading(unittest.TestCase):
             lingua_franca.parse.extract_number("uno", lang="es")
         unload_all_languages()
 
+    def test_load_on_demand_residency(self):
+        unload_all_languages()
+        lingua_franca.load_language("en")
+        lingua_franca.config.load_langs_on_demand = True
+        lingua_franca.config.max_langs_on_demand = 2
+        lingua_franca.reset_residency_stats()
+
+        self.assertEqual(lingua_franca.parse.extract_number("uno", lang="es"),
+                         1)
+        self.assertEqual(lingua_franca.parse.extract_number("um", lang="pt"),
+                         1)
+        self.assertEqual(lingua_franca.parse.extract_number("dos", lang="es"),
+                         2)
+        self.assertEqual(lingua_franca.get_resident_langs(), ['pt', 'es'])
+        # Loading a third language evicts the least recently used
+        self.assertEqual(lingua_franca.parse.extract_number("ein", lang="de"),
+                         1)
+        self.assertEqual(lingua_franca.get_resident_langs(), ['es', 'de'])
+        self.assertNotIn('pt', lingua_franca.get_active_langs())
+        self.assertIn('en', lingua_franca.get_active_langs())
+        self.assertEqual(lingua_franca.get_residency_stats(),
+                         {"resident": 2, "hits": 1, "misses": 3,
+                          "evictions": 1})
+
+        # Explicitly loading a resident language pins it
+        lingua_franca.load_language('es')
+        self.assertEqual(lingua_franca.get_resident_langs(), ['de'])
+        lingua_franca.unload_language('de')
+        self.assertEqual(lingua_franca.get_resident_langs(), [])
+
+        lingua_franca.config.max_langs_on_demand = 0
+        lingua_franca.config.load_langs_on_demand = False
+        unload_all_languages()
+
     def test_load_language(self):
         lingua_franca.load_language('en')
 
@@ -239,3 +274,273 @@ class TestGetter(unittest.TestCase):
 #                lingua_franca.internal.UnsupportedLanguageError):
 #            lingua_franca.get_full_lang_code("bob robertson")
         unload_all_languages()
+
+
+class TestDispatchTable(unittest.TestCase):
+    def test_table_follows_loaded_languages(self):
+        unload_all_languages()
+        table = lingua_franca.internal._localized_dispatch[
+            ('parse', 'extract_number')]
+        self.assertFalse(table)
+        lingua_franca.load_languages(['en', 'es'])
+        # Functions enter the table on their first call in each language
+        lingua_franca.parse.extract_number('one', lang='en')
+        lingua_franca.parse.extract_number('uno', lang='es')
+        self.assertIn('en', table)
+        self.assertIn('en-au', table)
+        self.assertIn('es', table)
+        lingua_franca.unload_language('es')
+        self.assertNotIn('es', table)
+        self.assertNotIn('es-es', table)
+        unload_all_languages()
+        self.assertFalse(table)
+
+    def test_functions_resolved_on_first_use(self):
+        unload_all_languages()
+        lingua_franca.internal._localized_function_cache.pop(('parse', 'sv'),
+                                                             None)
+        lingua_franca.load_language('sv')
+        functions = lingua_franca.internal._localized_functions['parse']['sv']
+        self.assertNotIn('extract_number', functions)
+        self.assertEqual(lingua_franca.parse.extract_number('två'), 2)
+        self.assertIn('extract_number', functions)
+        self.assertNotIn('extract_datetime', functions)
+        # Resolved functions stay in the table across reloads
+        lingua_franca.load_language('en')
+        self.assertIn('sv', lingua_franca.internal._localized_dispatch[
+            ('parse', 'extract_number')])
+        unload_all_languages()
+
+    def test_unlocalized_functions_not_in_table(self):
+        lingua_franca.load_language('en')
+        self.assertNotIn('en', lingua_franca.internal._localized_dispatch[
+            ('parse', 'is_ordinal')])
+        unload_all_languages()
+
+    def test_dispatch_matches_full_lookup(self):
+        lingua_franca.load_languages(['en', 'es'])
+        self.assertEqual(lingua_franca.parse.extract_number('uno', lang='es'),
+                         lingua_franca.parse.extract_number('uno', True,
+                                                            False, 'es'))
+        self.assertEqual(
+            lingua_franca.parse.extract_number('one', lang='en-us'), 1)
+        self.assertEqual(
+            lingua_franca.format.pronounce_number(3, lang='en',
+                                                  not_a_param=True),
+            'three')
+        self.assertEqual(lingua_franca.format.nice_number(123, lang='cz'),
+                         "123")
+        unload_all_languages()
+
+    def test_dispatch_positional_lang(self):
+        lingua_franca.load_language('en')
+        first = lingua_franca.parse.extract_datetime('tomorrow', 'en')
+        # The second call goes through the table the first one filled in
+        second = lingua_franca.parse.extract_datetime('tomorrow', 'en')
+        self.assertEqual(first[0].date(), second[0].date())
+        self.assertEqual(first[1], second[1])
+        unload_all_languages()
+
+
+class TestWarmUp(unittest.TestCase):
+    def test_warm_up(self):
+        unload_all_languages()
+        report = lingua_franca.warm_up(['en', 'es-es'],
+                                       functions=['extract_number',
+                                                  'pronounce_number'])
+        self.assertEqual(set(report), {'en', 'es'})
+        self.assertEqual(set(report['en']),
+                         {'import', 'resolve', 'resources', 'calls', 'total'})
+        self.assertIsNotNone(report['en']['total'].memory)
+        self.assertEqual(lingua_franca.get_active_langs(), ['en', 'es'])
+        for table in (('parse', 'extract_number'),
+                      ('format', 'pronounce_number')):
+            self.assertIn('es-es',
+                          lingua_franca.internal._localized_dispatch[table])
+        self.assertIn('es-es', lingua_franca.format.date_time_format
+                      .lang_config)
+        unload_all_languages()
+
+    def test_warm_up_without_arguments(self):
+        from lingua_franca.preload import _WARM_UP_ARGS
+        with mock.patch.dict(_WARM_UP_ARGS):
+            del _WARM_UP_ARGS['extract_number']
+            with self.assertWarns(UserWarning):
+                report = lingua_franca.warm_up(
+                    'en', functions=['extract_number', 'pronounce_number'],
+                    trace_memory=False)
+        self.assertIn('calls', report['en'])
+        self.assertIn('en-us', lingua_franca.internal._localized_dispatch[
+            ('parse', 'extract_number')])
+        unload_all_languages()
+
+    def test_warm_up_without_tracing(self):
+        report = lingua_franca.warm_up('en', trace_memory=False)
+        self.assertIsNone(report['en']['calls'].memory)
+        self.assertGreater(report['en']['total'].seconds, 0)
+        unload_all_languages()
+
+
+class TestResourceCache(unittest.TestCase):
+    def setUp(self):
+        from lingua_franca import bundle
+        lingua_franca.invalidate_resource_cache()
+        lingua_franca.load_language('en')
+        # Use the loose resource files, even if bundles have been built
+        bundle._loaded_bundles['en-us'] = None
+
+    def tearDown(self):
+        from lingua_franca import bundle
+        lingua_franca.config.resource_revalidation_interval = None
+        lingua_franca.invalidate_resource_cache()
+        bundle.unload_bundles()
+        unload_all_languages()
+
+    def test_translate_word_is_cached(self):
+        from lingua_franca.format import _translate_word
+        before = lingua_franca.get_resource_cache_stats()
+        self.assertEqual(_translate_word("and", "en-us"), "and")
+        self.assertEqual(_translate_word("and", "en-us"), "and")
+        self.assertEqual(_translate_word("no such word", "en-us"),
+                         "no such word")
+        stats = lingua_franca.get_resource_cache_stats()
+        self.assertEqual(stats["misses"] - before["misses"], 2)
+        self.assertEqual(stats["hits"] - before["hits"], 1)
+
+    def test_invalidate(self):
+        lingua_franca.resolve_resource_file("text/en-us/and.word")
+        lingua_franca.resolve_resource_file("text/en-us/or.word")
+        self.assertEqual(lingua_franca.get_resource_cache_stats()["entries"],
+                         2)
+        lingua_franca.invalidate_resource_cache("text/en-us/and.word")
+        self.assertEqual(lingua_franca.get_resource_cache_stats()["entries"],
+                         1)
+        lingua_franca.invalidate_resource_cache()
+        self.assertEqual(lingua_franca.get_resource_cache_stats()["entries"],
+                         0)
+
+    def test_revalidation(self):
+        import tempfile
+        from os.path import join
+        with tempfile.TemporaryDirectory() as data_dir:
+            read = lingua_franca.read_resource_file
+            self.assertIsNone(read("test.word", str.upper, data_dir))
+            with open(join(data_dir, "test.word"), "w") as f:
+                f.write("test")
+            # Still cached
+            self.assertIsNone(read("test.word", str.upper, data_dir))
+            lingua_franca.config.resource_revalidation_interval = 0
+            self.assertEqual(read("test.word", str.upper, data_dir),
+                             join(data_dir, "test.word").upper())
+            self.assertEqual(
+                lingua_franca.get_resource_cache_stats()["reloads"], 1)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        lingua_franca.load_language('en')
+        lingua_franca.config.result_cache_size = 16
+        lingua_franca.clear_result_cache()
+        lingua_franca.reset_result_cache_stats()
+
+    def tearDown(self):
+        lingua_franca.config.result_cache_size = 0
+        lingua_franca.config.result_cache_ttl = None
+        lingua_franca.clear_result_cache()
+        unload_all_languages()
+
+    def test_off_by_default(self):
+        lingua_franca.config.result_cache_size = 0
+        lingua_franca.parse.extract_number("one")
+        lingua_franca.parse.extract_number("one")
+        stats = lingua_franca.get_result_cache_stats()
+        self.assertEqual((stats["entries"], stats["hits"]), (0, 0))
+
+    def test_hits(self):
+        extract_numbers = lingua_franca.parse.extract_numbers
+        self.assertEqual(extract_numbers("one two"), [1, 2])
+        # Defaults and explicit values share an entry
+        numbers = extract_numbers("one two", True, lang="en")
+        self.assertEqual(numbers, [1, 2])
+        # Results are copies
+        numbers.append(3)
+        self.assertEqual(extract_numbers("one two"), [1, 2])
+        self.assertEqual(extract_numbers("one two", ordinals=True), [1, 2])
+        stats = lingua_franca.get_result_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+
+    def test_size_and_ttl(self):
+        lingua_franca.config.result_cache_size = 2
+        for text in ("one", "two", "three", "one"):
+            lingua_franca.parse.extract_number(text)
+        stats = lingua_franca.get_result_cache_stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (2, 2))
+        lingua_franca.config.result_cache_ttl = 0
+        self.assertEqual(lingua_franca.parse.extract_number("four"), 4)
+        self.assertEqual(lingua_franca.parse.extract_number("four"), 4)
+        self.assertEqual(lingua_franca.get_result_cache_stats()
+                         ["expirations"], 1)
+
+    def test_anchor_date(self):
+        from datetime import datetime, timedelta
+        from lingua_franca.time import default_timezone
+        extract_datetime = lingua_franca.parse.extract_datetime
+        anchor = datetime(2017, 6, 27, 13, 4, 5, tzinfo=default_timezone())
+        later = anchor + timedelta(hours=2, minutes=5, seconds=7)
+        # Depends on the day only: shared by both anchors
+        tomorrow = extract_datetime("tomorrow", anchor)
+        self.assertEqual(extract_datetime("tomorrow", later), tomorrow)
+        self.assertEqual(lingua_franca.get_result_cache_stats()["hits"], 1)
+        # Depends on the exact anchor: never shared
+        soon = extract_datetime("in 5 minutes", anchor)
+        self.assertEqual(extract_datetime("in 5 minutes", later)[0],
+                         soon[0] + (later - anchor))
+        self.assertEqual(extract_datetime("in 5 minutes", anchor), soon)
+        self.assertEqual(lingua_franca.get_result_cache_stats()["hits"], 2)
+        # No anchor is the time of the call
+        now = extract_datetime("in 5 minutes")[0]
+        self.assertNotEqual(now, soon[0])
+
+    def test_anchor_probes(self):
+        from datetime import datetime, timedelta
+        from lingua_franca.time import default_timezone
+        extract_datetime = lingua_franca.parse.extract_datetime
+        anchor = datetime(2017, 6, 27, 13, 4, 5, tzinfo=default_timezone())
+
+        def probes(text, anchor):
+            before = lingua_franca.get_result_cache_stats()["probes"]
+            extract_datetime(text, anchor)
+            return lingua_franca.get_result_cache_stats()["probes"] - before
+
+        # Shared within the hour: the day is only probed on the first miss
+        self.assertEqual(probes("at 5 pm", anchor), 4)
+        for hours in range(1, 4):
+            self.assertEqual(probes("at 5 pm",
+                                    anchor + timedelta(hours=hours)), 2)
+        # Depends on the exact anchor: no probes until the next minute
+        self.assertEqual(probes("in 5 minutes", anchor), 3)
+        self.assertEqual(probes("in 5 minutes",
+                                anchor + timedelta(seconds=10)), 0)
+        self.assertEqual(probes("in 5 minutes",
+                                anchor + timedelta(minutes=1)), 1)
+
+    def test_arguments_not_cached(self):
+        # Calls the cache can't key are passed on as they are
+        self.assertEqual(
+            lingua_franca.parse.extract_number("one", not_a_param=True), 1)
+        tomorrow = lingua_franca.parse.extract_datetime("tomorrow", "en")
+        self.assertEqual(tomorrow[0].date(),
+                         lingua_franca.parse.extract_datetime("tomorrow")[0]
+                         .date())
+        self.assertEqual(lingua_franca.get_result_cache_stats()["entries"],
+                         1)
+
+    def test_unloading_clears(self):
+        lingua_franca.parse.extract_number("one")
+        self.assertEqual(lingua_franca.get_result_cache_stats()["entries"],
+                         1)
+        unload_all_languages()
+        self.assertEqual(lingua_franca.get_result_cache_stats()["entries"],
+                         0)
+        self.assertRaises(ModuleNotFoundError,
+                          lingua_franca.parse.extract_number, "one")
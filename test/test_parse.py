@@ -14,19 +14,25 @@
 # limitations under the License.
 #
 import unittest
+from io import StringIO
 from datetime import datetime, timedelta
 from dateutil import tz
 
 from lingua_franca import load_language, unload_language, set_default_lang
-from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.internal import FunctionNotLocalizedError, \
+    UnsupportedLanguageError
 from lingua_franca.time import default_timezone
-from lingua_franca.parse import extract_datetime
-from lingua_franca.parse import extract_duration
+from lingua_franca.parse import analyze
+from lingua_franca.parse import extract_datetime, extract_datetime_batch
+from lingua_franca.parse import extract_duration, extract_duration_spans
 from lingua_franca.parse import extract_number, extract_numbers
-from lingua_franca.parse import fuzzy_match
+from lingua_franca.parse import extract_number_batch
+from lingua_franca.parse import extract_numbers_spans
+from lingua_franca.parse import iter_numbers, iter_durations
+from lingua_franca.parse import fuzzy_match, FuzzyIndex
 from lingua_franca.parse import get_gender
-from lingua_franca.parse import match_one
-from lingua_franca.parse import normalize
+from lingua_franca.parse import match_many, match_one
+from lingua_franca.parse import normalize, normalize_batch, get_normalizer
 
 
 def setUpModule():
@@ -60,6 +66,53 @@ class TestFuzzyMatch(unittest.TestCase):
         self.assertEqual(match_one('frank', choices)[0], 1)
         self.assertEqual(match_one('enry', choices)[0], 4)
 
+    def test_fuzzy_index(self):
+        choices = ['frank', 'kate', 'harry', 'henry', 'hank', 'frankie',
+                   'katie', '', 'harriet', 'kate']
+        index = FuzzyIndex(choices)
+        for query in ['frank', 'fran', 'enry', 'katt', 'k', '', 'harr']:
+            self.assertEqual(index.match_one(query),
+                             match_one(query, choices))
+            self.assertEqual(match_one(query, index),
+                             match_one(query, choices))
+            # best first, and the choice given first on equal scores
+            ranked = sorted(((fuzzy_match(query, choice), -idx)
+                             for idx, choice in enumerate(choices)),
+                            reverse=True)
+            ranked = [(choices[-idx], score) for score, idx in ranked]
+            self.assertEqual(index.match(query, top_k=None), ranked)
+            self.assertEqual(index.match(query, top_k=3), ranked[:3])
+            self.assertEqual(index.match(query, top_k=None, score_cutoff=0.5),
+                             [match for match in ranked if match[1] >= 0.5])
+        self.assertEqual(index.match('kate', top_k=2),
+                         [('kate', 1.0), ('kate', 1.0)])
+        self.assertEqual(index.match('zzz', score_cutoff=0.1), [])
+        # dictionary of choices
+        index = FuzzyIndex({'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4})
+        self.assertEqual(index.match_one('enry'), (4, 0.8888888888888888))
+        self.assertEqual(index.match('hxrry', top_k=2),
+                         [(3, 0.8), (4, 0.6)])
+        with self.assertRaises(ValueError):
+            FuzzyIndex('frank')
+        with self.assertRaises(ValueError):
+            FuzzyIndex([]).match_one('frank')
+
+    def test_match_many(self):
+        choices = ['frank', 'kate', 'harry', 'henry', 'hank', 'frankie']
+        queries = ['frank', 'fran', 'enry', 'katt', '', 'harr']
+        expected = [match_one(query, choices) for query in queries]
+        self.assertEqual(match_many(queries, choices), expected)
+        self.assertEqual(match_many(iter(queries), FuzzyIndex(choices)),
+                         expected)
+        self.assertEqual(match_many(queries, choices, workers=2,
+                                    chunksize=2), expected)
+        choices = {'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4}
+        self.assertEqual(match_many(['enry', 'frank'], choices),
+                         [(4, 0.8888888888888888), (1, 1.0)])
+        self.assertEqual(match_many([], choices), [])
+        with self.assertRaises(ValueError):
+            match_many(['frank'], [])
+
 
 class TestNormalize(unittest.TestCase):
     def test_articles(self):
@@ -325,6 +378,69 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_duration("5-minutes"),
                          (timedelta(minutes=5), ""))
 
+    def test_extract_numbers_spans_en(self):
+        text = "two cats and 3 dogs"
+        spans = extract_numbers_spans(text)
+        self.assertEqual([(s.start, s.end, s.value, s.kind) for s in spans],
+                         [(0, 3, 2, "number"), (13, 14, 3, "number")])
+        self.assertEqual(text[spans[0].start:spans[0].end], "two")
+        spans = extract_numbers_spans("I have two and a half apples")
+        self.assertEqual([(s.start, s.end, s.value) for s in spans],
+                         [(7, 21, 2.5)])
+        self.assertEqual(extract_numbers_spans("no numbers here"), [])
+
+    def test_extract_duration_spans_en(self):
+        text = "set a timer for 5 minutes and 30 seconds"
+        spans = extract_duration_spans(text)
+        self.assertEqual([(s.start, s.end, s.value, s.kind) for s in spans],
+                         [(16, 25, timedelta(minutes=5), "duration"),
+                          (30, 40, timedelta(seconds=30), "duration")])
+        text = "wait two and a half hours, please"
+        spans = extract_duration_spans(text)
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(text[spans[0].start:spans[0].end],
+                         "two and a half hours")
+        self.assertEqual(spans[0].value, timedelta(hours=2.5))
+        self.assertEqual(extract_duration_spans(""), [])
+
+    def test_iter_numbers_en(self):
+        text = "I have two hundred five apples and 3 pears.\n" \
+               "Then seven more, and twenty two dogs and a half.\n" * 20
+        expected = extract_numbers_spans(text)
+        self.assertEqual(list(iter_numbers(text)), expected)
+        self.assertEqual(list(iter_numbers(StringIO(text), chunk_size=5)),
+                         expected)
+        self.assertEqual(list(iter_numbers(text.splitlines(True))),
+                         expected)
+        self.assertEqual(list(iter_numbers(["two hund", "red fi", "ve"])),
+                         [(0, 16, 205, "number")])
+        self.assertEqual(list(iter_numbers(StringIO(""))), [])
+
+    def test_iter_numbers_markers_en(self):
+        # A marker found once in the whole text joins the same numbers
+        # whatever the chunks
+        text = "give me two and a half cups of milk"
+        expected = [span.value for span in extract_numbers_spans(text)]
+        self.assertEqual(expected, [2.5])
+        chunks = [word + " " for word in text.split()]
+        self.assertEqual([span.value for span in iter_numbers(chunks)],
+                         expected)
+        # Found more than once, it is only counted within each window
+        text = "bread and butter and then give me two and a half cups " \
+               "of milk please now"
+        self.assertEqual([span.value for span in extract_numbers_spans(text)],
+                         [2, 0.5])
+        chunks = [word + " " for word in text.split()]
+        self.assertEqual([span.value for span in iter_numbers(chunks)],
+                         [2.5])
+
+    def test_iter_durations_en(self):
+        spans = list(iter_durations(["set a timer for five",
+                                     " minutes and 30 seconds"]))
+        self.assertEqual([(s.start, s.end, s.value) for s in spans],
+                         [(16, 28, timedelta(minutes=5)),
+                          (33, 43, timedelta(seconds=30))])
+
     def test_extract_duration_case_en(self):
         self.assertEqual(extract_duration("Set a timer for 30 minutes"),
                          (timedelta(minutes=30), "Set a timer for"))
@@ -804,6 +920,8 @@ class TestNormalize(unittest.TestCase):
     def test_normalize_numbers(self):
         self.assertEqual(normalize("remind me to do something at two to two"),
                          "remind me to do something at 2 to 2")
+        # an ignored word doesn't hide the numbers after it
+        self.assertEqual(normalize("half of twenty"), "half of 20")
         self.assertEqual(normalize('what time will it be in two minutes'),
                          'what time will it be in 2 minutes')
         self.assertEqual(normalize('What time will it be in twenty two minutes'),
@@ -930,6 +1048,36 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers("this is a seven eight nine and a"
                                          " half test"),
                          [7.0, 8.0, 9.5])
+        self.assertEqual(extract_numbers("two cups and a half"), [2.5])
+        # a text of nothing but numbers is read one number at a time
+        self.assertEqual(extract_numbers(" ".join(map(str, range(1000)))),
+                         list(range(1000)))
+        self.assertEqual(extract_numbers("twenty two three hundred five "
+                                         "one two three four five six seven"
+                                         " eight and a half"),
+                         [22, 305, 1, 2, 3, 4, 5, 6, 7, 8.5])
+        # a number doesn't depend on other numbers further in the text
+        self.assertEqual(extract_numbers("two thousand three hundred cats "
+                                         "then one million dogs"),
+                         [2300, 1e6])
+        # a fraction after a decimal marker is not a decimal part
+        self.assertEqual(extract_numbers("point third point and two half"),
+                         [1 / 3, 1.0])
+
+    def test_get_normalizer(self):
+        normalizer = get_normalizer()
+        self.assertIs(normalizer, get_normalizer(lang="en-us"))
+        for text in ["it's one of the cats", "I can't see 12% of #1",
+                     "twenty two and a half apples", ""]:
+            self.assertEqual(normalizer.normalize(text, True),
+                             normalize(text))
+            self.assertEqual(normalizer.normalize(text, False),
+                             normalize(text, remove_articles=False))
+        normalizer = get_normalizer(lowercase=True, remove_articles=False)
+        self.assertIs(normalizer,
+                      get_normalizer(remove_articles=False, lowercase=True))
+        self.assertEqual(normalizer.normalize("The Cat isn't ONE"),
+                         "the cat is not 1")
 
     def test_contractions(self):
         self.assertEqual(normalize("ain't"), "is not")
@@ -1090,5 +1238,62 @@ class TestNormalize(unittest.TestCase):
                           get_gender, "person", None)
 
 
+class TestAnalyze(unittest.TestCase):
+    def test_analyze_en(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        for text in ["wake me up in twenty minutes",
+                     "it's two and a half hours from tomorrow at 5 pm",
+                     "what's the weather like next tuesday", "", "  "]:
+            self.assertEqual(
+                analyze(text, anchorDate=anchor),
+                {"numbers": extract_numbers(text),
+                 "duration": extract_duration(text),
+                 "datetime": extract_datetime(text, anchor),
+                 "normalized": normalize(text)})
+
+    def test_analyze_want(self):
+        self.assertEqual(analyze("the first of two", want={"numbers"}),
+                         {"numbers": [2]})
+        self.assertEqual(analyze("the first of two", want="normalized",
+                                 remove_articles=False),
+                         {"normalized": "the first of 2"})
+        self.assertRaises(ValueError, analyze, "one", want={"colors"})
+
+
+class TestBatch(unittest.TestCase):
+    texts = ["one", "two hundred cats", "no number", "3.5", "the third",
+             "what's the time"] * 3
+
+    def test_extract_number_batch(self):
+        expected = [extract_number(text) for text in self.texts]
+        self.assertEqual(extract_number_batch(self.texts), expected)
+        self.assertEqual(extract_number_batch(iter(self.texts)), expected)
+        self.assertEqual(extract_number_batch(self.texts, workers=2,
+                                              chunksize=4), expected)
+        self.assertEqual(extract_number_batch(["the third"], ordinals=True),
+                         [3])
+        self.assertEqual(extract_number_batch([]), [])
+
+    def test_extract_datetime_batch(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        texts = ["tomorrow at 5 pm", "nothing here", "in 3 days"]
+        expected = [extract_datetime(text, anchor) for text in texts]
+        self.assertEqual(extract_datetime_batch(texts, anchor), expected)
+        self.assertEqual(extract_datetime_batch(texts, anchor, workers=2),
+                         expected)
+
+    def test_normalize_batch(self):
+        expected = [normalize(text) for text in self.texts]
+        self.assertEqual(normalize_batch(self.texts), expected)
+        self.assertEqual(normalize_batch(self.texts, workers=2), expected)
+        self.assertEqual(normalize_batch(["the cat"], remove_articles=False),
+                         ["the cat"])
+
+    def test_batch_lang(self):
+        self.assertRaises(UnsupportedLanguageError, extract_number_batch,
+                          ["one"], lang="xx")
+        self.assertEqual(extract_number_batch(["one"], lang="en-us"), [1])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,8 +14,17 @@
 # limitations under the License.
 
 import unittest
+from datetime import datetime, timedelta
 
-from lingua_franca.lang.parse_common import tokenize, Token
+from lingua_franca.lang.parse_common import tokenize, Token, \
+    ReplaceableNumber, Normalizer, PhraseReplacer, split_number_segments, \
+    number_pieces, \
+    find_number_spans, number_word_classifier, number_word_combiner, \
+    token_offsets, tokenize_with_offsets, Tokenizer, Span, iter_spans, \
+    extract_numbers_spans_generic, compile_duration_regex, \
+    extract_duration_with_regex, DatetimeRules, extract_date_words, \
+    datetime_from_state
+from lingua_franca.lang.parse_de import extract_number_de
 
 
 class TestParseCommon(unittest.TestCase):
@@ -33,3 +42,249 @@ class TestParseCommon(unittest.TestCase):
 
         self.assertEqual(tokenize('hashtag #1world'),
                          [Token('hashtag', 0), Token('#1world', 1)])
+
+    def test_token(self):
+        token = Token('one', 0)
+        self.assertEqual(token.word, 'one')
+        self.assertEqual(token.index, 0)
+        self.assertEqual(token, Token('one', 0))
+        self.assertNotEqual(token, Token('one', 1))
+        self.assertEqual(len({token, Token('one', 0)}), 1)
+        self.assertEqual(repr(token), "Token(word='one', index=0)")
+        with self.assertRaises(AttributeError):
+            token.value = 1
+
+        number = ReplaceableNumber(2, tokenize('two apples')[:1])
+        self.assertEqual((number.start_index, number.end_index), (0, 0))
+        self.assertEqual(number.text, 'two')
+        with self.assertRaises(Exception):
+            number.value = 3
+        self.assertEqual(number.value, 2)
+
+    def test_normalizer(self):
+        config = {"lowercase": True,
+                  "contractions": {"isn't": "is not", "#1": "number #1"},
+                  "number_replacements": {"one": "1", "two": "2"},
+                  "word_replacements": {"not": "n't", "1": "one"},
+                  "remove_symbols": True, "remove_accents": True,
+                  "articles": ["a", "the"], "stopwords": ["is"],
+                  "remove_stopwords": True}
+
+        def stage_by_stage(normalizer, utterance):
+            utterance = normalizer.expand_contractions(utterance.lower())
+            utterance = normalizer.numbers_to_digits(utterance)
+            utterance = normalizer.replace_words(utterance)
+            utterance = normalizer.remove_accents(
+                normalizer.remove_symbols(utterance))
+            utterance = normalizer.remove_stopwords(
+                normalizer.remove_articles(utterance))
+            return " ".join(utterance.split())
+
+        normalizer = Normalizer(config)
+        for utterance in ["It isn't one of the two (à) #1 choices!",
+                          "one is a -", "", "Él is THE 12% #1 -"]:
+            self.assertEqual(normalizer.normalize(utterance, True),
+                             stage_by_stage(normalizer, utterance))
+        self.assertEqual(normalizer.normalize("Isn't THE one é?", True),
+                         "n't one e")
+        self.assertEqual(normalizer.normalize("Isn't THE one é?"),
+                         "n't the one e")
+
+        class OwnStage(Normalizer):
+            def remove_accents(self, utterance):
+                return utterance.replace("à", "á")
+
+        self.assertEqual(OwnStage(config).normalize("the one à"),
+                         "the one á")
+
+        # a tokenize() override of any kind splits the whole utterance
+        class StaticTokenize(Normalizer):
+            @staticmethod
+            def tokenize(utterance):
+                return utterance.split("-")
+
+        class PlainTokenize(Normalizer):
+            def tokenize(self, utterance):
+                return utterance.split("-")
+
+        for normalizer in (StaticTokenize(config), PlainTokenize(config)):
+            self.assertEqual(normalizer.normalize("the-one two"),
+                             "the one two")
+
+    def test_phrase_replacer(self):
+        replacer = PhraseReplacer({"a couple of": "2", "a couple": "two",
+                                   "couple": "pair", "new york": "NY",
+                                   "new  york city": "NYC"})
+        self.assertEqual(replacer.longest, 3)
+        self.assertEqual(replacer.words, {"couple": "pair"})
+        self.assertEqual(replacer["a couple"], "two")
+        self.assertEqual(len(replacer), 5)
+        self.assertEqual(
+            replacer.replace("a couple of a couple couple of new york "
+                             "new york city new a".split()),
+            ["2", "two", "pair", "of", "NY", "NYC", "new", "a"])
+        self.assertEqual(replacer.replace([]), [])
+
+        # phrases in the replacement dictionaries of a normalizer
+        normalizer = Normalizer({"contractions": {"gonna be": "will be"},
+                                 "word_replacements": replacer})
+        self.assertEqual(normalizer.normalize("it's gonna be a couple of "
+                                              "days in new york city"),
+                         "it's will be 2 days in NYC")
+        self.assertEqual(normalizer.expand_contractions("gonna be gonna"),
+                         "will be gonna")
+        self.assertIs(normalizer.phrase_replacer(replacer), replacer)
+
+    def test_split_number_segments(self):
+        def is_number_word(word):
+            return word in ('one', 'two', 'a', 'half')
+
+        tokens = tokenize('one cat and two dogs')
+        self.assertEqual(split_number_segments(tokens, is_number_word),
+                         [[Token('one', 0)], [Token('two', 3)]])
+        # a single marker joins the closest numbers around it
+        self.assertEqual(split_number_segments(tokens, is_number_word,
+                                               {'and'}),
+                         [tokens[:4]])
+        tokens = tokenize('one and two and a half')
+        self.assertEqual(split_number_segments(tokens, is_number_word,
+                                               {'and'}),
+                         [[Token('one', 0)], [Token('two', 2)],
+                          [Token('a', 4), Token('half', 5)]])
+        self.assertEqual(split_number_segments([], is_number_word), [])
+
+    def test_number_pieces(self):
+        values = {'one': 1, 'two': 2, 'twenty': 20, 'half': 0.5}
+
+        def joined(previous, word):
+            return previous == 'twenty' and values[word] < 10
+
+        def is_number(word):
+            return word in values
+
+        tokens = tokenize('twenty two one two')
+        self.assertEqual(number_pieces(tokens, joined, is_number),
+                         [tokens[:2], tokens[2:3], tokens[3:]])
+        # a marker keeps the numbers around it, and what is in between
+        tokens = tokenize('one two cups and a half one')
+        self.assertEqual(number_pieces(tokens, joined, is_number, {'and'}),
+                         [tokens[:1], tokens[1:6], tokens[6:]])
+        self.assertEqual(number_pieces([], joined, is_number), [])
+
+    def test_find_number_spans(self):
+        classify = number_word_classifier(extract_number_de, {"und"})
+        combine = number_word_combiner(extract_number_de, joiners={"und"})
+        text = "ich habe zwei  Katzen und drei und ein halb Hunde"
+        spans = find_number_spans(text, classify, combine)
+        self.assertEqual(spans, [Span(9, 13, 2, "number"),
+                                 Span(26, 43, 3.5, "number")])
+        self.assertEqual(text[26:43], "drei und ein halb")
+        self.assertEqual(
+            [span.value for span in find_number_spans(
+                "eins zwei drei", classify, combine)], [1, 2, 3])
+        self.assertEqual(find_number_spans("", classify, combine),
+                         [])
+
+    def test_token_offsets(self):
+        text = "I am  #1, 15%"
+        self.assertEqual(token_offsets(text, tokenize(text)),
+                         [(0, 1), (2, 4), (6, 7), (7, 9), (10, 12), (12, 13)])
+
+    def test_tokenize_with_offsets(self):
+        text = "I am  #1, 15%"
+        tokens, offsets = tokenize_with_offsets(text)
+        self.assertEqual(tokens, tokenize(text))
+        self.assertEqual(offsets, token_offsets(text, tokens))
+
+    def test_tokenizer(self):
+        tokenizer = Tokenizer()
+        self.assertEqual(tokenizer.words(" 15%  #1 "), ["15%", "#1"])
+        self.assertEqual(tokenizer.spans(" 15%  #1 "),
+                         [("15%", 1, 4), ("#1", 6, 8)])
+
+        tokenizer = Normalizer.tokenizer()
+        self.assertIs(tokenizer, Normalizer.tokenizer())
+        self.assertEqual(tokenizer.words("15% of #1"),
+                         ["15", "%", "of", "#", "1"])
+        self.assertEqual(tokenizer.spans("15% of #1"),
+                         [("15", 0, 2), ("%", 2, 3), ("of", 4, 6),
+                          ("#", 7, 8), ("1", 8, 9)])
+
+        class HyphenNormalizer(Normalizer):
+            _DROP_FINAL_HYPHEN = True
+        tokenizer = HyphenNormalizer.tokenizer()
+        self.assertIsNot(tokenizer, Normalizer.tokenizer())
+        self.assertEqual(tokenizer.words("15% -"), ["15", "%"])
+        self.assertEqual(tokenizer.spans("15% -"), [("15", 0, 2), ("%", 2, 3)])
+
+    def test_iter_spans(self):
+        def extract_spans(text):
+            return extract_numbers_spans_generic(text, extract_number_de,
+                                                 joiners={"und"})
+
+        text = "ich habe zwei Katzen und drei und ein halb Hunde, " * 4
+        expected = extract_spans(text)
+        for size in (1, 4, 9, 100):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            self.assertEqual(list(iter_spans(chunks, extract_spans, 2)),
+                             expected)
+        self.assertEqual(list(iter_spans(["drei und ein", " halb"],
+                                         extract_spans)),
+                         [Span(0, 17, 3.5, "number")])
+        # Past max_pending, held back text is parsed in pieces
+        self.assertEqual(
+            [span.value for span in iter_spans(["drei und", " ein", " halb"],
+                                               extract_spans, 2, 0)],
+            [4, 0.5])
+        self.assertEqual(list(iter_spans([], extract_spans)), [])
+
+    def test_extract_duration_with_regex(self):
+        units = {"minute": "minutes", "min": "minutes", "hour": "hours"}
+        regex = compile_duration_regex(units, suffix="s?")
+        self.assertEqual(
+            extract_duration_with_regex("in 2 hours and 5 minutes", regex,
+                                        units),
+            (timedelta(hours=2, minutes=5), "in  and"))
+        self.assertEqual(
+            extract_duration_with_regex("1 minute 2-min 0.5 hour", regex,
+                                        units),
+            (timedelta(minutes=33), ""))
+        self.assertEqual(
+            extract_duration_with_regex("no time at all", regex, units),
+            (None, "no time at all"))
+        regex = compile_duration_regex(units, separator=r"\s+", end="$")
+        self.assertEqual(
+            extract_duration_with_regex("5-hour 3 hour", regex, units),
+            (timedelta(hours=3), "5-hour"))
+
+
+class TestDatetimeRules(unittest.TestCase):
+    rules = DatetimeRules(
+        weekdays=["lunedì", "martedì", "mercoledì", "giovedì", "venerdì",
+                  "sabato", "domenica"],
+        months=["gen", "feb", "mar", "apr", "mag", "giu", "lug", "ago",
+                "set", "ott", "nov", "dic"],
+        relative_days={("oggi",): 0, ("domani",): 1},
+        units={"giorni": "days", "settimana": "weeks"},
+        next_words=["prossima"],
+        from_words=["da"],
+        markers=["a"],
+        joiner="e")
+    anchor = datetime(2017, 6, 27, 13, 4)  # a tuesday
+
+    def extract(self, text):
+        words = text.split()
+        state = extract_date_words(words, self.anchor, self.rules)
+        return datetime_from_state(words, self.anchor, state, self.rules)
+
+    def test_extract_date_words(self):
+        self.assertEqual(self.extract("ci vediamo domani"),
+                         [datetime(2017, 6, 28), "ci vediamo"])
+        self.assertEqual(self.extract("venerdì"), [datetime(2017, 6, 30), ""])
+        self.assertEqual(self.extract("3 giorni da domani"),
+                         [datetime(2017, 7, 1), ""])
+        self.assertEqual(self.extract("la prossima settimana"),
+                         [datetime(2017, 7, 4), "la"])
+        self.assertEqual(self.extract("a 5 lug 2018"),
+                         [datetime(2018, 7, 5), ""])
+        self.assertIsNone(self.extract("niente da fare"))
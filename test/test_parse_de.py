@@ -20,6 +20,7 @@ from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -83,6 +84,12 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("Drei Viertel Tassen", lang="de-de"),
                          3.0 / 4.0)
 
+    def test_extract_numbers(self):
+        self.assertEqual(extract_numbers("1 Tasse und eine halbe",
+                                         lang="de-de"), [1.5])
+        self.assertEqual(extract_numbers("eins zwei drei und Hund",
+                                         lang="de-de"), [1, 2, 3])
+
     def test_extractdatetime_de(self):
         def extractWithFormat(text):
             date = datetime(2017, 6, 27, 0, 0)
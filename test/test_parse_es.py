@@ -99,6 +99,11 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("seis punto dos", lang='es'), 6.2)
         self.assertEqual(extract_number("seis punto Dos", lang='es'), 6.2)
         self.assertEqual(extract_number("seis coma dos", lang='es'), 6.2)
+        self.assertEqual(extract_number("seis punto", lang='es'), 6)
+        self.assertEqual(extract_numbers("dos punto cinco", lang='es'), [2.5])
+        self.assertEqual(extract_numbers("dos coma cinco", lang='es'), [2.5])
+        self.assertEqual(extract_numbers("dos punto cero cinco", lang='es'),
+                         [2.05])
         self.assertEqual(extract_numbers("un medio", lang='es'), [0.5])
         self.assertEqual(extract_number("cuarto", lang='es'), 0.25)
 
@@ -21,6 +21,7 @@ from lingua_franca.internal import FunctionNotLocalizedError
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
+from lingua_franca.parse import extract_numbers_spans
 from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
@@ -73,6 +74,16 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("دو میلیون و پانصد هزار "
                                         "تن گوشت یخ زده"), 2500000)
 
+    def test_extract_numbers_spans(self):
+        # found word by word with extract_number(), which takes no
+        # short_scale in this language
+        text = "دو گربه و سه سگ"
+        spans = extract_numbers_spans(text)
+        self.assertEqual([(s.start, s.end, s.value) for s in spans],
+                         [(0, 2, 2), (10, 12, 3)])
+        self.assertEqual(extract_numbers_spans(text, short_scale=False,
+                                               ordinals=True), spans)
+
     def test_extract_duration_en(self):
         self.assertEqual(extract_duration("10 ثانیه"),
                          (timedelta(seconds=10.0), ""))
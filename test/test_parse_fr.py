@@ -22,7 +22,7 @@ from lingua_franca.time import default_timezone
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_duration
-from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -97,6 +97,24 @@ class TestNormalize_fr(unittest.TestCase):
         self.assertEqual(extract_number("un 20e",
                                         lang="fr-fr"), 1.0 / 20.0)
 
+    def test_extractnumbers_decimals_fr(self):
+        self.assertEqual(extract_numbers("trois virgule cinq", lang="fr-fr"),
+                         [3.5])
+        self.assertEqual(extract_numbers("trois virgule zéro cinq",
+                                         lang="fr-fr"), [3.05])
+        self.assertEqual(extract_numbers("trois virgule cinq pommes et deux",
+                                         lang="fr-fr"), [3.5, 2])
+        self.assertEqual(extract_numbers("trois virgule", lang="fr-fr"), [3])
+        self.assertEqual(extract_numbers("2 virgule 0 2 cm", lang="fr-fr"),
+                         [2.02])
+        # a joiner never takes the place of a number
+        self.assertEqual(extract_numbers("un deux trois et chien",
+                                         lang="fr-fr"), [1, 2, 3])
+        self.assertEqual(extract_numbers("1 bol et demi", lang="fr-fr"),
+                         [1.5])
+        self.assertEqual(extract_numbers("trois zéro cinq", lang="fr-fr"),
+                         [3, 5])
+
     def test_extractdatetime_fr(self):
         def extractWithFormat_fr(text):
             date = datetime(2017, 6, 27, 0, 0, tzinfo=default_timezone())
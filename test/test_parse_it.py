@@ -749,7 +749,7 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers('questo è  test dieci undici dodici',
                                          lang='it'), [10.0, 11.0, 12.0])
         self.assertEqual(extract_numbers('test dodici gatti ventuno',
-                                         lang='it'), [21.0, 12.0])
+                                         lang='it'), [12.0, 21.0])
         self.assertEqual(extract_numbers('1 cane, sette maiali, macdonald ' +
                                          'aveva la fattoria, 3 volte' +
                                          ' 5 macarena',
@@ -774,7 +774,17 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers('seimilioni', lang='it',
                                          short_scale=False), [6e6])
         self.assertEqual(extract_numbers('dodici maiali accompagnano \
-         seimiliardi di batteri', lang='it', short_scale=True), [6e9, 12])
+         seimiliardi di batteri', lang='it', short_scale=True), [12, 6e9])
+        self.assertEqual(extract_numbers('tre virgola cinque', lang='it'),
+                         [3.5])
+        self.assertEqual(extract_numbers('tre punto cinque', lang='it'),
+                         [3.5])
+        self.assertEqual(extract_numbers('tre virgola zero cinque',
+                                         lang='it'), [3.05])
+        self.assertEqual(extract_numbers('1 tazza e mezzo', lang='it'),
+                         [1.5])
+        self.assertEqual(extract_numbers('uno due tre e cane', lang='it'),
+                         [1, 2, 3])
 
         # TODO case when pronounced/extracted number don't match
         # fractional numbers often fail
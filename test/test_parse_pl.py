@@ -19,7 +19,7 @@ from datetime import datetime, timedelta
 from lingua_franca import get_default_lang, set_default_lang, \
     load_language, unload_language
 from lingua_franca.time import default_timezone
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetime_batch
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
@@ -156,6 +156,8 @@ class TestNormalize(unittest.TestCase):
                          (timedelta(seconds=10.0), ""))
         self.assertEqual(extract_duration("5-minut"),
                          (timedelta(minutes=5), ""))
+        self.assertEqual(extract_duration("1 godzina i 2 godziny"),
+                         (timedelta(hours=3), "i"))
 
     def test_extractdatetime_pl(self):
         def extractWithFormat(text):
@@ -470,6 +472,15 @@ class TestNormalize(unittest.TestCase):
         testExtract("spotkajmy się za 5sekund",
                     "2017-06-27 10:01:07", "spotkajmy się")
 
+    def test_extract_datetime_batch_pl(self):
+        anchor = datetime(2017, 6, 27, 10, 1, 2, tzinfo=default_timezone())
+        texts = ["jutro", "za 5 minut", "nic"]
+        expected = [extract_datetime(text, anchor) for text in texts]
+        self.assertEqual(expected[0][0].date(), datetime(2017, 6, 28).date())
+        self.assertEqual(extract_datetime_batch(texts, anchor), expected)
+        self.assertEqual(extract_datetime_batch(texts, anchor, workers=2),
+                         expected)
+
     def test_spaces(self):
         self.assertEqual(normalize("  to   jest    test"),
                          "to jest test")
@@ -532,6 +543,9 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers("to jest siedem osiem dziewięć i"
                                          " pół test"),
                          [7.0, 8.0, 9.5])
+        self.assertEqual(extract_numbers("minus 2"), [-2])
+        self.assertEqual(extract_numbers("ujemne siedemdziesiąt"), [-70])
+        self.assertEqual(extract_numbers("mam minus 2 i trzy"), [-2, 3])
 
 
 if __name__ == "__main__":
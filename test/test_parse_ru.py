@@ -18,7 +18,7 @@ from datetime import datetime, timedelta
 
 from lingua_franca import set_default_lang, \
     load_language, unload_language
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetime_batch
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import fuzzy_match
@@ -669,6 +669,15 @@ class TestNormalize(unittest.TestCase):
         # testExtract("мы встретимся через 5секунд",
         #             "2017-06-27 10:01:07", "мы встретимся")
 
+    def test_extract_datetime_batch_ru(self):
+        anchor = datetime(2017, 6, 27, 10, 1, 2, tzinfo=default_timezone())
+        texts = ["завтра", "через 5 минут", "ничего"]
+        expected = [extract_datetime(text, anchor) for text in texts]
+        self.assertEqual(expected[0][0].date(), datetime(2017, 6, 28).date())
+        self.assertEqual(extract_datetime_batch(texts, anchor), expected)
+        self.assertEqual(extract_datetime_batch(texts, anchor, workers=2),
+                         expected)
+
     def test_spaces(self):
         self.assertEqual(normalize("  вот   это   тест"),
                          "вот это тест")